@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Benchmark the documentation generator on synthetic specs of increasing size.
+
+For every size, a synthetic spec is generated (see synthetic_spec.py) and
+the build stages are timed in a fresh Python process, so peak memory is
+measured per size and never leaks from one size into the next:
+
+    parser.load               Parse the spec (no spec cache)
+    parser.load_cached        Load the spec from a warm spec cache
+    parser.get_endpoints      Parse every operation into Endpoint records
+    generator.index           Render the index page
+    generator.endpoint_pages  Render every endpoint page
+    generator.build           Full build (assets, index, pages, manifest)
+    generator.rebuild         Incremental rebuild with nothing changed
+    generator.versioned_build Two-version build (needs a PRO key, --license)
+
+Each stage records wall time and the peak RSS of the process so far.
+Results can be saved as JSON and compared against a baseline; the run
+fails if a stage got slower than the allowed threshold.
+
+Usage:
+    python3 benchmarks/run_benchmarks.py --sizes 100,1000,10000
+    python3 benchmarks/run_benchmarks.py --output results.json
+    python3 benchmarks/run_benchmarks.py --baseline results.json --threshold 1.25
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Add src and this directory to path
+sys.path.insert(0, str(REPO_ROOT / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from synthetic_spec import build_spec, write_spec
+
+
+DEFAULT_SIZES = "100,1000,10000,50000"
+# Stages faster than this are too noisy to flag as regressions
+NOISE_FLOOR_SECONDS = 0.1
+FORMAT_VERSION = 1
+
+
+def run_size(spec_path: Path, next_spec_path: Path, workdir: Path,
+             jobs: int, license_key: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Time every build stage for one spec (runs inside the per-size process).
+
+    Returns:
+        Mapping of stage name to {"seconds", "peak_rss_kb"}
+    """
+    from openapi.parser import OpenAPIParser
+    from openapi.generator import OpenAPIDocGenerator
+    from openapi.version_manager import VersionManager
+    from openapi.spec_cache import SpecCache
+    from openapi.profiling import peak_rss_kb
+
+    results: Dict[str, Dict[str, Any]] = {}
+    templates = str(REPO_ROOT / "templates" / "api")
+    static = str(REPO_ROOT / "static")
+
+    def measure(stage: str, fn: Callable[[], Any]) -> Any:
+        start = time.perf_counter()
+        value = fn()
+        results[stage] = {
+            "seconds": round(time.perf_counter() - start, 4),
+            "peak_rss_kb": peak_rss_kb(),
+        }
+        return value
+
+    # The generator reports progress on stdout; keep the benchmark output clean
+    with redirect_stdout(io.StringIO()):
+        parser = measure("parser.load", lambda: OpenAPIParser(str(spec_path)))
+
+        cache = SpecCache(str(workdir / "spec-cache"))
+        OpenAPIParser(str(spec_path), spec_cache=cache)
+        measure("parser.load_cached", lambda: OpenAPIParser(str(spec_path), spec_cache=cache))
+
+        measure("parser.get_endpoints", parser.get_endpoints)
+        del parser
+
+        generator = OpenAPIDocGenerator(
+            spec_path=str(spec_path), output_dir=str(workdir / "pages"),
+            template_dir=templates, jobs=jobs,
+        )
+        target = generator._build_target(None)
+        measure("generator.index", lambda: generator._generate_index(target))
+        measure("generator.endpoint_pages", lambda: generator._generate_endpoint_pages(target))
+
+        generator = OpenAPIDocGenerator(
+            spec_path=str(spec_path), output_dir=str(workdir / "build"),
+            template_dir=templates, jobs=jobs,
+        )
+        measure("generator.build", lambda: generator.generate(static_dir=static))
+        measure("generator.rebuild", lambda: generator.generate(static_dir=static))
+        del generator
+
+        if license_key:
+            version_manager = VersionManager()
+            version_manager.add_version("v1", str(spec_path), "V1")
+            version_manager.add_version("v2", str(next_spec_path), "V2", is_default=True)
+            versioned = OpenAPIDocGenerator(
+                output_dir=str(workdir / "versioned"), template_dir=templates,
+                license_key=license_key, version_manager=version_manager, jobs=jobs,
+            )
+            if versioned.use_versioning:
+                measure("generator.versioned_build", lambda: versioned.generate(static_dir=static))
+
+    return results
+
+
+def benchmark_size(operations: int, args: argparse.Namespace, workdir: Path) -> Dict[str, Any]:
+    """Generate specs for one size and time them in a fresh process."""
+    size_dir = workdir / f"ops-{operations}"
+    size_dir.mkdir(parents=True, exist_ok=True)
+    suffix = ".json" if args.format == "json" else ".yaml"
+    spec_path = size_dir / f"spec{suffix}"
+    next_spec_path = size_dir / f"spec-next{suffix}"
+
+    options = dict(ops_per_path=args.ops_per_path, tags=args.tags,
+                   depth=args.depth, models=args.models)
+    write_spec(build_spec(operations, **options), spec_path)
+    if args.license:
+        write_spec(build_spec(operations, revision=1, **options), next_spec_path)
+
+    result_file = size_dir / "result.json"
+    command = [
+        sys.executable, str(Path(__file__).resolve()), "--run-size",
+        str(spec_path), str(next_spec_path), str(size_dir), str(result_file),
+        "--jobs", str(args.jobs),
+    ]
+    if args.license:
+        command += ["--license", args.license]
+
+    # Isolate ~/.apiflow (license and spec caches) from the user's own
+    env = dict(os.environ, HOME=str(size_dir / "home"))
+    subprocess.run(command, check=True, env=env)
+
+    with open(result_file, "r", encoding="utf-8") as f:
+        stages = json.load(f)
+
+    return {"spec_bytes": spec_path.stat().st_size, "stages": stages}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    """
+    Find stages that got slower than threshold x the baseline.
+
+    Returns:
+        Human-readable regression descriptions
+    """
+    regressions = []
+    for size, current in results["results"].items():
+        previous = baseline.get("results", {}).get(size)
+        if not previous:
+            continue
+        for stage, measurement in current["stages"].items():
+            before = previous["stages"].get(stage)
+            if not before or before["seconds"] < NOISE_FLOOR_SECONDS:
+                continue
+            ratio = measurement["seconds"] / before["seconds"]
+            if ratio > threshold:
+                regressions.append(
+                    f"{stage} @ {int(size):,} ops: {before['seconds']:.3f}s -> "
+                    f"{measurement['seconds']:.3f}s ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    """Format results as one table per size."""
+    lines = []
+    for size, result in results["results"].items():
+        spec_mib = result["spec_bytes"] / (1024 * 1024)
+        lines.append(f"\nOperations: {int(size):,}  (spec {spec_mib:.1f} MiB)")
+        for stage, measurement in result["stages"].items():
+            rss = measurement["peak_rss_kb"]
+            memory = f"{rss / 1024:8.1f} MiB" if rss is not None else "       -"
+            lines.append(f"  {stage:<28} {measurement['seconds']:>9.3f}s  {memory}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark ApiFlow on synthetic OpenAPI specs"
+    )
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help=f"Comma-separated operation counts (default: {DEFAULT_SIZES})")
+    parser.add_argument("--ops-per-path", type=int, default=4, help="Operations per path (default: 4)")
+    parser.add_argument("--tags", type=int, default=25, help="Number of tags (default: 25)")
+    parser.add_argument("--depth", type=int, default=5, help="Nested $ref schema depth (default: 5)")
+    parser.add_argument("--models", type=int, default=50, help="Number of model schemas (default: 50)")
+    parser.add_argument("--format", choices=["yaml", "json"], default="yaml",
+                        help="Spec file format (default: yaml)")
+    parser.add_argument("-j", "--jobs", type=int, default=1,
+                        help="Worker processes for page rendering (default: 1)")
+    parser.add_argument("-l", "--license",
+                        help="PRO license key; enables the versioned build stage")
+    parser.add_argument("-o", "--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="Compare against results from an earlier run")
+    parser.add_argument("--threshold", type=float, default=1.25,
+                        help="Slowdown ratio reported as a regression (default: 1.25)")
+    parser.add_argument("--keep", action="store_true",
+                        help="Keep the generated specs and output in the work directory")
+    parser.add_argument("--run-size", nargs=4, help=argparse.SUPPRESS,
+                        metavar=("SPEC", "NEXT_SPEC", "WORKDIR", "RESULT_FILE"))
+    args = parser.parse_args()
+
+    if args.run_size:
+        # Per-size process started by benchmark_size()
+        spec_path, next_spec_path, workdir, result_file = (Path(p) for p in args.run_size)
+        stages = run_size(spec_path, next_spec_path, workdir, args.jobs, args.license)
+        with open(result_file, "w", encoding="utf-8") as f:
+            json.dump(stages, f)
+        return
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    workdir = Path(tempfile.mkdtemp(prefix="apiflow-bench-"))
+
+    results: Dict[str, Any] = {
+        "format": FORMAT_VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            "ops_per_path": args.ops_per_path, "tags": args.tags, "depth": args.depth,
+            "models": args.models, "format": args.format, "jobs": args.jobs,
+        },
+        "results": {},
+    }
+
+    print("ApiFlow Benchmarks")
+    print(f"{'='*50}")
+    try:
+        for operations in sizes:
+            print(f"  Running {operations:,} operations...", flush=True)
+            results["results"][str(operations)] = benchmark_size(operations, args, workdir)
+    finally:
+        if args.keep:
+            print(f"  Work directory kept: {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print(format_results(results))
+
+    if not args.license:
+        print("\nℹ Versioned build skipped (pass a PRO license key with --license)")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"\n✓ Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n⚠️  {len(regressions)} regression(s) above {args.threshold:.2f}x:")
+            for regression in regressions:
+                print(f"   {regression}")
+            sys.exit(1)
+        print(f"\n✓ No regressions above {args.threshold:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
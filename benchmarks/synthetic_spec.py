@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Synthetic OpenAPI specs of configurable size for benchmarking.
+
+Specs are deterministic: the same arguments always produce the same
+document. Every operation references component schemas that form chains
+of nested $refs (``depth`` levels deep) plus a self-referencing tree
+schema, so ref resolution and cycle detection are exercised the way
+large real-world specs exercise them.
+
+Usage:
+    python3 benchmarks/synthetic_spec.py 1000 -o /tmp/spec-1k.yaml
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict
+
+import yaml
+
+try:
+    # libyaml-backed dumper, much faster for large specs
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+
+METHODS = ("get", "post", "put", "patch", "delete")
+
+
+def _schema_chain(name: str, depth: int) -> Dict[str, Dict[str, Any]]:
+    """Schemas Name, NameLevel1 ... NameLevel<depth>, each referencing the next."""
+    schemas = {}
+    for level in range(depth + 1):
+        schema_name = name if level == 0 else f"{name}Level{level}"
+        properties: Dict[str, Any] = {
+            "id": {"type": "string", "format": "uuid"},
+            "name": {"type": "string", "example": f"{schema_name} name"},
+            "count": {"type": "integer", "minimum": 0},
+            "status": {"type": "string", "enum": ["active", "inactive", "pending"]},
+        }
+        if level < depth:
+            child = f"{name}Level{level + 1}"
+            properties["child"] = {"$ref": f"#/components/schemas/{child}"}
+            properties["children"] = {
+                "type": "array",
+                "items": {"$ref": f"#/components/schemas/{child}"},
+            }
+        else:
+            properties["tree"] = {"$ref": "#/components/schemas/TreeNode"}
+
+        schemas[schema_name] = {
+            "type": "object",
+            "required": ["id", "name"],
+            "properties": properties,
+        }
+    return schemas
+
+
+def build_spec(operations: int, ops_per_path: int = 4, tags: int = 25,
+               depth: int = 5, models: int = 50, revision: int = 0) -> Dict[str, Any]:
+    """
+    Build a synthetic OpenAPI 3.0 document.
+
+    Args:
+        operations: Total number of operations
+        ops_per_path: Operations per path item (1-5)
+        tags: Number of tags operations are spread over
+        depth: Levels of nested $ref schemas below each model
+        models: Number of model schema chains shared by the operations
+        revision: Non-zero to change info.version and every tenth operation,
+                  simulating the next version of the same API
+
+    Returns:
+        The OpenAPI document
+    """
+    ops_per_path = max(1, min(ops_per_path, len(METHODS)))
+    paths_count = -(-operations // ops_per_path)
+
+    schemas: Dict[str, Any] = {
+        "Error": {
+            "type": "object",
+            "required": ["code", "message"],
+            "properties": {
+                "code": {"type": "integer", "format": "int32"},
+                "message": {"type": "string"},
+            },
+        },
+        "TreeNode": {
+            "type": "object",
+            "properties": {
+                "value": {"type": "string"},
+                "children": {"type": "array", "items": {"$ref": "#/components/schemas/TreeNode"}},
+            },
+        },
+    }
+    for model in range(models):
+        schemas.update(_schema_chain(f"Model{model}", depth))
+
+    spec: Dict[str, Any] = {
+        "openapi": "3.0.3",
+        "info": {
+            "title": "Synthetic Benchmark API",
+            "version": f"{revision + 1}.0.0",
+            "description": f"Synthetic spec with {operations} operations for benchmarking.",
+        },
+        "servers": [{"url": "https://api.example.com/v1"}],
+        "tags": [{"name": f"tag{t}", "description": f"Operations of group {t}"} for t in range(tags)],
+        "paths": {},
+        "components": {
+            "schemas": schemas,
+            "parameters": {
+                "Limit": {
+                    "name": "limit",
+                    "in": "query",
+                    "schema": {"type": "integer", "default": 20},
+                    "description": "Maximum number of items to return",
+                },
+            },
+            "responses": {
+                "NotFound": {
+                    "description": "Resource not found",
+                    "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Error"}}},
+                },
+            },
+        },
+    }
+
+    index = 0
+    for p in range(paths_count):
+        model_ref = {"$ref": f"#/components/schemas/Model{p % models}"}
+        path = f"/resource{p // 2}" if p % 2 == 0 else f"/resource{p // 2}/{{id}}"
+        path_item: Dict[str, Any] = {}
+        if p % 2 == 1:
+            path_item["parameters"] = [{
+                "name": "id", "in": "path", "required": True,
+                "schema": {"type": "string"}, "example": "abc123",
+            }]
+
+        for method in METHODS[:ops_per_path]:
+            if index >= operations:
+                break
+
+            summary = f"{method.upper()} resource {p}"
+            if revision and index % 10 == 0:
+                summary += f" (revision {revision})"
+
+            operation: Dict[str, Any] = {
+                "operationId": f"{method}Resource{p}",
+                "summary": summary,
+                "description": f"Performs {method.upper()} on resource {p}.",
+                "tags": [f"tag{index % tags}"] if tags else [],
+                "parameters": [{"$ref": "#/components/parameters/Limit"}],
+                "responses": {
+                    "200": {
+                        "description": "Successful response",
+                        "content": {"application/json": {"schema": model_ref}},
+                    },
+                    "404": {"$ref": "#/components/responses/NotFound"},
+                    "default": {
+                        "description": "Unexpected error",
+                        "content": {"application/json": {"schema": {"$ref": "#/components/schemas/Error"}}},
+                    },
+                },
+            }
+            if method in ("post", "put", "patch"):
+                operation["requestBody"] = {
+                    "required": True,
+                    "content": {"application/json": {"schema": model_ref}},
+                }
+
+            path_item[method] = operation
+            index += 1
+
+        spec["paths"][path] = path_item
+
+    return spec
+
+
+def write_spec(spec: Dict[str, Any], path: Path) -> None:
+    """Write a spec as YAML or JSON, depending on the file suffix."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        if path.suffix == ".json":
+            json.dump(spec, f)
+        else:
+            yaml.dump(spec, f, Dumper=SafeDumper, sort_keys=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic OpenAPI spec")
+    parser.add_argument("operations", type=int, help="Number of operations")
+    parser.add_argument("-o", "--output", default="synthetic-api.yaml",
+                        help="Output file (.yaml or .json, default: synthetic-api.yaml)")
+    parser.add_argument("--ops-per-path", type=int, default=4, help="Operations per path (default: 4)")
+    parser.add_argument("--tags", type=int, default=25, help="Number of tags (default: 25)")
+    parser.add_argument("--depth", type=int, default=5, help="Nested $ref schema depth (default: 5)")
+    parser.add_argument("--models", type=int, default=50, help="Number of model schemas (default: 50)")
+    parser.add_argument("--revision", type=int, default=0,
+                        help="Generate a later revision of the same API (default: 0)")
+    args = parser.parse_args()
+
+    spec = build_spec(args.operations, args.ops_per_path, args.tags, args.depth,
+                      args.models, args.revision)
+    write_spec(spec, Path(args.output))
+    print(f"✓ Wrote {args.operations} operations to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
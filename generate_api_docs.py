@@ -10,8 +10,12 @@ import argparse
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "src"))
 
-from openapi.generator import OpenAPIDocGenerator
+from openapi.generator import OpenAPIDocGenerator, compile_templates
 from openapi.version_manager import VersionManager
+from openapi.spec_cache import SpecCache
+from openapi.profiling import BuildProfiler
+from openapi.dev_server import watch
+from openapi.vendor_assets import MissingVendorFilesError, fetch_vendor_assets, pin_vendor_assets
 from license.validator import LicenseValidator
 from license.config import Config
 
@@ -47,6 +51,11 @@ def main():
         choices=["default", "dark-pro", "light-pro", "modern"],
         help="Theme to use (requires PRO license for premium themes)",
     )
+    parser.add_argument(
+        "--nav-mode",
+        choices=["inline", "shared"],
+        help="Embed the endpoint sidebar in every page (inline) or load it from one shared script",
+    )
     parser.add_argument(
         "--versions",
         action="append",
@@ -70,6 +79,109 @@ def main():
         action="store_true",
         help="Export documentation to PDF (requires PRO license)",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for rendering endpoint pages (default: 1, 0 = all CPUs)",
+    )
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Re-render every page even if its inputs are unchanged since the last build",
+    )
+    parser.add_argument(
+        "--no-spec-cache",
+        action="store_true",
+        help="Always re-parse spec files instead of using the parsed-spec cache",
+    )
+    parser.add_argument(
+        "--no-template-cache",
+        action="store_true",
+        help="Compile templates every build instead of using the bytecode cache",
+    )
+    parser.add_argument(
+        "--compile-templates",
+        metavar="DIR",
+        help="Precompile the templates into DIR and exit",
+    )
+    parser.add_argument(
+        "--precompiled-templates",
+        metavar="DIR",
+        help="Render with templates precompiled by --compile-templates",
+    )
+    parser.add_argument(
+        "--fingerprint-assets",
+        action="store_true",
+        help="Add a content hash to CSS/JS file names so they can be cached forever",
+    )
+    parser.add_argument(
+        "--bundle-assets",
+        action="store_true",
+        help="Serve CSS and JS as minified bundles, with the critical layout CSS inlined in each page",
+    )
+    parser.add_argument(
+        "--offline-assets",
+        action="store_true",
+        help="Self-host fonts, icons and Prism so pages make no third-party requests",
+    )
+    parser.add_argument(
+        "--fetch-offline-assets",
+        action="store_true",
+        help="Download the pinned files used by --offline-assets into STATIC/vendor and exit",
+    )
+    parser.add_argument(
+        "--pin-offline-assets",
+        action="store_true",
+        help="Maintainers: record the hashes of the offline asset files in STATIC/vendor/vendor-lock.json and exit",
+    )
+    parser.add_argument(
+        "--highlight",
+        choices=["client", "server"],
+        help="Highlight code examples in the browser with Prism (client) or at build time with Pygments (server)",
+    )
+    parser.add_argument(
+        "--code-languages",
+        help="Comma-separated code example languages, in tab order "
+             "(curl, python, javascript, go, java, ruby, httpie)",
+    )
+    parser.add_argument(
+        "--precompress",
+        action="store_true",
+        help="Write .gz (and .br, with brotli installed) next to every generated HTML, CSS and JS file",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Rebuild on changes to specs, templates and static assets, and serve the docs with live reload",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Dev server interface for --watch (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=8000, help="Dev server port for --watch (default: 8000)"
+    )
+    parser.add_argument(
+        "--no-serve",
+        action="store_true",
+        help="With --watch, only rebuild on changes without starting the dev server",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print per-phase build timings, counts, bytes and peak memory",
+    )
+    parser.add_argument(
+        "--profile-json",
+        metavar="FILE",
+        help="Write the build profile as JSON (implies --profile)",
+    )
+    parser.add_argument(
+        "--profile-trace",
+        metavar="FILE",
+        help="Write the build profile in Chrome trace format (implies --profile)",
+    )
 
     args = parser.parse_args()
 
@@ -77,6 +189,31 @@ def main():
         Config.create_sample_config()
         return
 
+    if args.compile_templates:
+        count = compile_templates(args.templates, args.compile_templates)
+        print(f"✓ Compiled {count} template(s) into {args.compile_templates}")
+        return
+
+    if args.fetch_offline_assets:
+        print(f"Downloading offline assets into {os.path.join(args.static, 'vendor')}...")
+        try:
+            count = fetch_vendor_assets(args.static)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Download failed: {e}")
+            sys.exit(1)
+        print(f"✓ Downloaded {count} file(s); build with --offline-assets")
+        return
+
+    if args.pin_offline_assets:
+        print("Pinning offline asset hashes (review the lock file before committing it)...")
+        try:
+            lock_path = pin_vendor_assets(args.static)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Pinning failed: {e}")
+            sys.exit(1)
+        print(f"✓ Hashes written to {lock_path}")
+        return
+
     if args.license_status:
         license_validator = LicenseValidator(args.license)
         license_validator.print_status()
@@ -94,10 +231,43 @@ def main():
     if args.theme:
         config.set("theme", args.theme)
 
+    if args.nav_mode:
+        config.set("navigation.mode", args.nav_mode)
+
+    if args.no_template_cache:
+        config.set("templates.bytecode_cache", False)
+
+    if args.precompiled_templates:
+        config.set("templates.precompiled", args.precompiled_templates)
+
+    if args.fingerprint_assets:
+        config.set("assets.fingerprint", True)
+
+    if args.bundle_assets:
+        config.set("assets.bundle", True)
+
+    if args.offline_assets:
+        config.set("assets.offline", True)
+
+    if args.precompress:
+        config.set("compression.enabled", True)
+
+    if args.highlight:
+        config.set("code_examples.highlight", args.highlight)
+
+    if args.code_languages:
+        config.set("code_examples.languages",
+                   [name.strip() for name in args.code_languages.split(",") if name.strip()])
+
+    spec_cache = None if args.no_spec_cache else SpecCache()
+    profiler = BuildProfiler(
+        enabled=bool(args.profile or args.profile_json or args.profile_trace)
+    )
+
     version_manager = None
     if args.versions:
         print("\n📚 Setting up version management (PRO feature)...")
-        version_manager = VersionManager()
+        version_manager = VersionManager(spec_cache=spec_cache, profiler=profiler)
 
         for version, spec_path, label in args.versions:
             is_default = (
@@ -116,7 +286,7 @@ def main():
     else:
         if config.has_versions():
             print("\n📚 Loading versions from configuration...")
-            version_manager = VersionManager()
+            version_manager = VersionManager(spec_cache=spec_cache, profiler=profiler)
             for v in config.get_versions():
                 version_manager.add_version(
                     v["version"],
@@ -136,18 +306,44 @@ def main():
         license_key=args.license,
         config=config,
         version_manager=version_manager,
+        spec_cache=spec_cache,
+        jobs=args.jobs,
+        incremental=not args.full_rebuild,
+        profiler=profiler,
     )
 
-    generator.generate(static_dir=args.static, export_pdf=args.pdf)
+    # Versions are loaded on first use, so report the spec cache after the build
+    try:
+        generator.generate(static_dir=args.static, export_pdf=args.pdf)
+    except MissingVendorFilesError as e:
+        print(f"⚠️  Offline build failed: {e}")
+        sys.exit(1)
+
+    if spec_cache:
+        print(f"  Spec cache: {spec_cache.hits} hit(s), {spec_cache.misses} miss(es)")
 
     print(f"\n✓ Documentation generated successfully!")
     print(f"\nOpen {args.output}/index.html in your browser to view the docs.")
 
+    if profiler.enabled:
+        print(f"\n⏱  Build profile\n")
+        print(profiler.format_table())
+        if args.profile_json:
+            profiler.write_json(args.profile_json)
+            print(f"\n✓ Profile written to {args.profile_json}")
+        if args.profile_trace:
+            profiler.write_chrome_trace(args.profile_trace)
+            print(f"✓ Chrome trace written to {args.profile_trace} (open in chrome://tracing or Perfetto)")
+
     license_info = generator.get_license_info()
     if not license_info["is_licensed"]:
         print(f"\n💡 Want premium features? Upgrade at:")
         print(f"   https://github.com/Ilia01/apiflow#pricing")
 
+    if args.watch:
+        watch(generator, static_dir=args.static, host=args.host, port=args.port,
+              serve=not args.no_serve)
+
 
 if __name__ == "__main__":
     main()
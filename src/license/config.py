@@ -43,6 +43,36 @@ class Config:
                 'dark_mode': True,
                 'code_examples': True,
             },
+            'navigation': {
+                'mode': 'inline',  # inline | shared (sidebar loaded from js/endpoint-nav.js)
+            },
+            'templates': {
+                'bytecode_cache': True,  # Cache compiled templates in ~/.apiflow/jinja-cache
+                'precompiled': None,  # Directory of templates precompiled with --compile-templates
+            },
+            'search': {
+                'prefix_length': 1,  # Shard the search index by token prefix (0 = single file)
+            },
+            'assets': {
+                'fingerprint': False,  # Content hash in static asset names (api-docs.<hash>.css)
+                'link_mode': 'auto',  # auto (reflink, else copy) | hardlink | copy
+                'bundle': False,  # Minified per-theme CSS and per-page JS bundles, critical CSS inlined
+                'offline': False,  # Self-host fonts, icons and Prism from static/vendor (no CDN requests)
+            },
+            'code_examples': {
+                'highlight': 'client',  # client (Prism in the browser) | server (Pygments at build time)
+                'languages': ['curl', 'python', 'javascript'],  # Also available: go, java, ruby, httpie
+                'cache': True,  # Reuse generated examples from ~/.apiflow/code-examples while operations are unchanged
+            },
+            'compression': {
+                'enabled': False,  # Write .gz/.br next to generated files for gzip_static/brotli_static
+                'formats': ['gzip', 'brotli'],  # brotli needs the brotli package
+            },
+            'pdf': {
+                'workers': 0,  # Processes rendering PDF chunks (0 = all CPUs; needs pypdf)
+                'chunk_size': 20,  # Endpoints per chunk
+                'cache': True,  # Reuse rendered chunks from ~/.apiflow/pdf-cache when unchanged
+            },
             'versions': []  # List of API versions
         }
 
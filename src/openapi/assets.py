@@ -0,0 +1,204 @@
+"""
+Static asset copying for generated documentation.
+
+Assets are only written when their content changed: a file whose size and
+mtime match the previous copy is skipped without being read, and one that
+only differs in mtime is compared by content hash. New copies are made
+with a copy-on-write reflink where the filesystem supports it (Btrfs, XFS,
+APFS via cp), optionally with a hardlink, and fall back to a plain copy.
+
+With fingerprinting enabled, output names carry a content hash
+(css/api-docs.css -> css/api-docs.1a2b3c4d5e.css) so they can be served
+with far-future cache headers; templates resolve names with asset().
+Generated assets such as bundles go through the same path via write().
+"""
+
+import hashlib
+import os
+import shutil
+from pathlib import Path
+from typing import Dict, Optional
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; reflinks are then never attempted
+    fcntl = None
+
+# ioctl request cloning one file's extents into another (Linux, _IOW(0x94, 9, int))
+FICLONE = 0x40049409
+# Hex digits of the content hash used in fingerprinted names
+FINGERPRINT_LENGTH = 10
+LINK_MODES = ("auto", "hardlink", "copy")
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fingerprinted_name(name: str, digest: str) -> str:
+    """
+    Insert a content hash before the file extension.
+
+    Example: "css/api-docs.css" -> "css/api-docs.1a2b3c4d5e.css"
+    """
+    path = Path(name)
+    fingerprinted = f"{path.stem}.{digest[:FINGERPRINT_LENGTH]}{path.suffix}"
+    return str(path.with_name(fingerprinted).as_posix())
+
+
+def _reflink(source: Path, dest: Path) -> bool:
+    """Try to clone source into a new file at dest; return False if unsupported."""
+    if fcntl is None:
+        return False
+    try:
+        with open(source, "rb") as src, open(dest, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return True
+    except OSError:
+        try:
+            dest.unlink()
+        except OSError:
+            pass
+        return False
+
+
+def _hardlink(source: Path, dest: Path) -> bool:
+    """Try to hardlink dest to source; return False if unsupported (e.g. across filesystems)."""
+    try:
+        os.link(source, dest)
+        return True
+    except (OSError, AttributeError):
+        return False
+
+
+class AssetCopier:
+    """
+    Copies static assets into the output directory, skipping unchanged files.
+    """
+
+    def __init__(self, output_dir: Path, fingerprint: bool = False, link_mode: str = "auto"):
+        """
+        Initialize the asset copier.
+
+        Args:
+            output_dir: Directory containing the generated documentation
+            fingerprint: Add a content hash to output file names
+            link_mode: 'auto' (reflink, else copy), 'hardlink' (reflink,
+                       else hardlink, else copy) or 'copy'
+        """
+        self.output_dir = Path(output_dir)
+        self.fingerprint = fingerprint
+        self.link_mode = link_mode if link_mode in LINK_MODES else "auto"
+        # Logical asset name -> output name, used by the asset() template helper
+        self.urls: Dict[str, str] = {}
+        self.copied = 0
+        self.unchanged = 0
+
+    def copy(self, source: Path, name: str, digest: Optional[str] = None) -> str:
+        """
+        Copy an asset unless an identical copy already exists.
+
+        Args:
+            source: Source file
+            name: Output name relative to the output directory (e.g. "css/api-docs.css")
+            digest: Content hash of source, if already known
+
+        Returns:
+            Output name actually used (fingerprinted if enabled)
+        """
+        output_name = name
+        if self.fingerprint:
+            output_name = fingerprinted_name(name, digest or file_digest(source))
+
+        dest = self.output_dir / output_name
+        if self._is_current(source, dest):
+            self.unchanged += 1
+        else:
+            self._place(source, dest)
+            self.copied += 1
+
+        self.urls[name] = output_name
+        return output_name
+
+    def write(self, name: str, data: bytes) -> str:
+        """
+        Write generated asset content (e.g. a bundle) unless it is unchanged.
+
+        Args:
+            name: Output name relative to the output directory
+            data: File content
+
+        Returns:
+            Output name actually used (fingerprinted if enabled)
+        """
+        output_name = name
+        if self.fingerprint:
+            output_name = fingerprinted_name(name, hashlib.sha256(data).hexdigest())
+
+        dest = self.output_dir / output_name
+        try:
+            unchanged = dest.stat().st_size == len(data) and dest.read_bytes() == data
+        except OSError:
+            unchanged = False
+
+        if unchanged:
+            self.unchanged += 1
+        else:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, dest)
+            self.copied += 1
+
+        self.urls[name] = output_name
+        return output_name
+
+    @staticmethod
+    def _is_current(source: Path, dest: Path) -> bool:
+        """Check whether dest already holds source's content."""
+        try:
+            src_stat = source.stat()
+            dest_stat = dest.stat()
+        except OSError:
+            return False
+
+        if src_stat.st_size != dest_stat.st_size:
+            return False
+        if src_stat.st_mtime_ns == dest_stat.st_mtime_ns:
+            return True
+        if (src_stat.st_dev, src_stat.st_ino) == (dest_stat.st_dev, dest_stat.st_ino):
+            return True
+        if file_digest(source) != file_digest(dest):
+            return False
+
+        # Same content (e.g. the source was touched): remember it via the mtime
+        os.utime(dest, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+        return True
+
+    def _place(self, source: Path, dest: Path) -> None:
+        """
+        Write a copy of source at dest.
+
+        The copy is made under a temporary name and renamed over dest, so an
+        existing hardlink at dest is replaced rather than written through.
+        """
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp = dest.with_name(f".{dest.name}.{os.getpid()}.tmp")
+
+        try:
+            if self.link_mode != "copy" and _reflink(source, tmp):
+                shutil.copystat(source, tmp)
+            elif self.link_mode == "hardlink" and _hardlink(source, tmp):
+                pass
+            else:
+                shutil.copy2(source, tmp)
+            os.replace(tmp, dest)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
@@ -0,0 +1,147 @@
+"""
+Build manifest for incremental documentation builds.
+
+The manifest lives in the output directory and records a content hash of
+every input that went into each generated page. A page whose hash matches
+the previous build (and whose file still exists) is not rendered again.
+Copied static assets are listed separately, so a build that copies no
+assets leaves the previous ones in place, as are precompressed siblings.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def content_hash(*parts: Any) -> str:
+    """
+    Hash JSON-serializable build inputs.
+
+    Keys are sorted so dict ordering never changes the result; values that
+    are not JSON types (dates from YAML, for instance) are hashed by str().
+    """
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class BuildManifest:
+    """
+    Tracks generated files and the hash of their inputs between builds.
+    """
+
+    FILENAME = ".apiflow-manifest.json"
+    # Bump when rendering changes in a way template hashes don't capture
+    FORMAT_VERSION = 1
+
+    def __init__(self, output_dir: Path, force: bool = False):
+        """
+        Initialize the manifest.
+
+        Args:
+            output_dir: Directory containing the generated documentation
+            force: Treat every file as changed (full rebuild)
+        """
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / self.FILENAME
+        self.force = force
+        self.previous: Dict[str, str] = {}
+        self.previous_assets: Dict[str, str] = {}
+        self.previous_compressed: Dict[str, Dict[str, Any]] = {}
+        self._load()
+        self.current: Dict[str, str] = {}
+        # Output name -> asset name; None until this build copies assets
+        self.assets: Optional[Dict[str, str]] = None
+        # Filename -> {"digest", "formats"} of its precompressed siblings
+        self.compressed: Dict[str, Dict[str, Any]] = {}
+        self.rendered = 0
+        self.skipped = 0
+
+    def _load(self) -> None:
+        """Load file hashes and copied assets from the previous build, if any."""
+        if not self.path.exists():
+            return
+
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return
+
+        if data.get("format") != self.FORMAT_VERSION:
+            # Keep the file list for stale-file cleanup, but trust no hashes
+            self.force = True
+        self.previous = data.get("files", {})
+        self.previous_assets = data.get("assets", {})
+        self.previous_compressed = data.get("compressed", {})
+
+    def is_fresh(self, filename: str, digest: str) -> bool:
+        """
+        Check whether a file from the previous build can be kept as-is.
+
+        Records the digest for this build either way and updates the
+        rendered/skipped counters.
+        """
+        self.current[filename] = digest
+        fresh = (
+            not self.force
+            and self.previous.get(filename) == digest
+            and (self.output_dir / filename).exists()
+        )
+        if fresh:
+            self.skipped += 1
+        else:
+            self.rendered += 1
+        return fresh
+
+    def record_asset(self, filename: str, name: str) -> None:
+        """
+        Record a static asset copied by this build.
+
+        Args:
+            filename: Output file name (fingerprinted, if enabled)
+            name: Asset name templates refer to
+        """
+        if self.assets is None:
+            self.assets = {}
+        self.assets[filename] = name
+
+    def generated_files(self) -> List[str]:
+        """Every file of this build: pages, search index and copied assets."""
+        return sorted(set(self.current) | set(self.assets if self.assets is not None
+                                               else self.previous_assets))
+
+    def remove_stale(self) -> List[str]:
+        """
+        Delete files generated by the previous build that no longer exist.
+
+        Only files recorded in the manifest are removed, never anything the
+        user placed in the output directory.
+
+        Returns:
+            Filenames that were removed
+        """
+        stale = set(self.previous) - set(self.current)
+        if self.assets is not None:
+            stale |= set(self.previous_assets) - set(self.assets)
+        stale -= set(self.current) | set(self.assets or ())
+
+        removed = []
+        for filename in sorted(stale):
+            path = self.output_dir / filename
+            if path.exists():
+                path.unlink()
+            removed.append(filename)
+        return removed
+
+    def save(self) -> None:
+        """Write the manifest for the current build."""
+        assets = self.assets if self.assets is not None else self.previous_assets
+        data = {
+            "format": self.FORMAT_VERSION,
+            "files": self.current,
+            "assets": assets,
+            "compressed": self.compressed,
+        }
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
@@ -0,0 +1,377 @@
+"""
+CSS/JS bundling and minification for generated documentation.
+
+Without bundling every page requests variables.css, api-docs.css, the
+theme stylesheet and two or three scripts. With bundling enabled, each
+page instead gets:
+
+- the critical CSS inlined in a <style> tag: the design tokens
+  (variables.css) and the rules laying out the page frame (sidebar,
+  header, main column), including the selected theme's overrides of
+  them, so the first paint never waits for a stylesheet;
+- one stylesheet with all CSS for the selected theme, loaded without
+  blocking rendering;
+- one script for its page type (index or endpoint).
+
+rcssmin and rjsmin are used for minification when installed. Otherwise
+a conservative built-in minifier drops comments and whitespace without
+rewriting any code.
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import rcssmin
+except ImportError:
+    rcssmin = None
+
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+
+# Inlined into every page's <head>
+CRITICAL_CSS = "css/variables.css"
+# Bundled rules styling these are inlined too (see critical_css)
+CRITICAL_SELECTORS = frozenset((
+    "*", "html", "body", ":root", ".container", ".sidebar", ".main-content",
+    ".header", ".theme-toggle", ".version-switcher", ".back-link",
+))
+# Stylesheets bundled in order; the selected theme is appended
+CSS_SOURCES = ("css/api-docs.css",)
+# Scripts bundled per page type, in load order
+JS_SOURCES: Dict[str, Tuple[str, ...]] = {
+    "index_js": ("js/search.js", "js/theme.js"),
+    "endpoint_js": ("js/code-tabs.js", "js/theme.js"),
+}
+# Only needed on index pages of versioned builds
+VERSION_SWITCHER_JS = "js/version-switcher.js"
+# Token colors, when code examples are highlighted at build time
+HIGHLIGHT_CSS = "css/highlight.css"
+
+_CSS_TOKEN_RE = re.compile(
+    r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')'  # strings, kept verbatim
+    r'|(/\*.*?\*/)'                               # comments
+    r'|(\s+)'                                     # whitespace
+    r'|([{};,:>])'                                # punctuation
+    r'|([^"\'/\s{};,:>]+|/)',                     # everything else
+    re.S,
+)
+# Whitespace before these is never significant (':' is: "a :hover")
+_CSS_NO_SPACE_BEFORE = "{};,>"
+_CSS_NO_SPACE_AFTER = "{};,:>"
+
+
+def minify_css(source: str) -> str:
+    """
+    Remove comments and insignificant whitespace from a stylesheet.
+
+    Example: "a {\\n  color: red;\\n}" -> "a{color:red}"
+    """
+    if rcssmin is not None:
+        return rcssmin.cssmin(source)
+
+    out: List[str] = []
+    pending_space = False
+    for match in _CSS_TOKEN_RE.finditer(source):
+        string, comment, space, punct, other = match.groups()
+        if comment is not None:
+            continue
+        if space is not None:
+            pending_space = True
+            continue
+
+        last = out[-1][-1] if out else ""
+        if punct is not None:
+            if punct == "}" and last == ";":
+                out[-1] = out[-1][:-1]
+            if pending_space and punct not in _CSS_NO_SPACE_BEFORE and last not in _CSS_NO_SPACE_AFTER:
+                out.append(" ")
+            out.append(punct)
+        else:
+            if pending_space and last and last not in _CSS_NO_SPACE_AFTER:
+                out.append(" ")
+            out.append(string if string is not None else other)
+        pending_space = False
+
+    return "".join(out)
+
+
+# Leading compound of a selector: "*", an element, a class, :root or an attribute
+_CSS_SELECTOR_HEAD_RE = re.compile(r"\*|[a-zA-Z][\w-]*|\.[\w-]+|:root|\[[^\]]*\]")
+# Ancestors scoping a rule to a theme, e.g. [data-theme="dark"] .sidebar
+_CSS_THEME_SCOPE_RE = re.compile(r"^(?:html|:root)?\[data-theme[^\]]*\]\s*>?\s*")
+
+
+def _css_blocks(css: str) -> Iterable[Tuple[str, Optional[str]]]:
+    """
+    Split minified CSS into top-level (prelude, body) pairs.
+
+    Statements without a block (@import, @charset) have body None.
+    """
+    i = 0
+    start = 0
+    depth = 0
+    body_start = 0
+    prelude = ""
+    while i < len(css):
+        char = css[i]
+        if char in "'\"":
+            end = css.find(char, i + 1)
+            i = len(css) if end == -1 else end + 1
+            continue
+        if char == "{":
+            if depth == 0:
+                prelude = css[start:i].strip()
+                body_start = i + 1
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                yield prelude, css[body_start:i]
+                start = i + 1
+        elif char == ";" and depth == 0:
+            yield css[start:i].strip(), None
+            start = i + 1
+        i += 1
+
+
+def _critical_selector(selector: str) -> bool:
+    """Whether a selector styles part of the page frame (see CRITICAL_SELECTORS)."""
+    selector = selector.strip()
+    scoped = _CSS_THEME_SCOPE_RE.sub("", selector)
+    if not scoped:
+        # The theme's own variables block
+        return selector != ""
+    head = _CSS_SELECTOR_HEAD_RE.match(scoped)
+    return head is not None and head.group() in CRITICAL_SELECTORS
+
+
+def critical_css(css: str) -> str:
+    """
+    Pick the rules of a minified stylesheet that style the page frame.
+
+    A rule is critical when one of its selectors starts with an entry of
+    CRITICAL_SELECTORS, optionally scoped to a theme. @media blocks are
+    filtered the same way; other at-rules (@keyframes, @font-face,
+    @import) are left to the full stylesheet.
+
+    Example: "body{margin:0}.param-table{width:100%}" -> "body{margin:0}"
+    """
+    out = []
+    for prelude, body in _css_blocks(css):
+        if body is None:
+            continue
+        if prelude.startswith("@"):
+            if prelude.startswith(("@media", "@supports")):
+                inner = critical_css(body)
+                if inner:
+                    out.append(f"{prelude}{{{inner}}}")
+            continue
+        if any(_critical_selector(selector) for selector in prelude.split(",")):
+            out.append(f"{prelude}{{{body}}}")
+    return "".join(out)
+
+
+# A "/" after one of these starts a regex literal rather than a division
+_JS_REGEX_AFTER = set("(,=:[!&|?{};+-*%<>~^")
+_JS_REGEX_KEYWORDS = {"return", "typeof", "instanceof", "in", "of", "new", "delete",
+                      "void", "throw", "case", "do", "else", "yield", "await"}
+_JS_WORD_RE = re.compile(r"[A-Za-z0-9_$]+")
+
+
+def _js_string_end(source: str, i: int) -> int:
+    """Index after the string literal starting at i."""
+    quote = source[i]
+    i += 1
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 2
+            continue
+        i += 1
+        if char == quote or char == "\n":
+            break
+    return i
+
+
+def _js_template_end(source: str, i: int) -> int:
+    """Index after the template literal starting at i, including nested ${...} code."""
+    i += 1
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 2
+        elif char == "`":
+            return i + 1
+        elif source.startswith("${", i):
+            i = _js_code_end(source, i + 2)
+        else:
+            i += 1
+    return i
+
+
+def _js_code_end(source: str, i: int) -> int:
+    """Index after the "}" closing a template literal's ${ expression."""
+    depth = 0
+    while i < len(source):
+        char = source[i]
+        if char in "'\"":
+            i = _js_string_end(source, i)
+        elif char == "`":
+            i = _js_template_end(source, i)
+        elif char == "{":
+            depth += 1
+            i += 1
+        elif char == "}":
+            if depth == 0:
+                return i + 1
+            depth -= 1
+            i += 1
+        else:
+            i += 1
+    return i
+
+
+def _js_regex_end(source: str, i: int) -> int:
+    """Index after the regex literal starting at i (flags included)."""
+    i += 1
+    in_class = False
+    while i < len(source):
+        char = source[i]
+        if char == "\\":
+            i += 2
+            continue
+        if char == "\n":
+            return i
+        i += 1
+        if in_class:
+            in_class = char != "]"
+        elif char == "[":
+            in_class = True
+        elif char == "/":
+            break
+    match = _JS_WORD_RE.match(source, i)
+    return match.end() if match else i
+
+
+def _js_regex_allowed(code: str) -> bool:
+    """Whether a "/" following the code so far starts a regex literal."""
+    stripped = code.rstrip()
+    if not stripped:
+        return True
+    if stripped[-1] in _JS_REGEX_AFTER:
+        return True
+    match = re.search(r"[A-Za-z0-9_$]+$", stripped)
+    return match is not None and match.group() in _JS_REGEX_KEYWORDS
+
+
+def minify_js(source: str) -> str:
+    """
+    Remove comments, indentation and blank lines from a script.
+
+    Only the comment itself is removed; code before "/*" and after "*/" on
+    the same line is kept, and comment markers inside string, template and
+    regex literals are left alone. Line breaks are kept so automatic
+    semicolon insertion is unaffected, and template literals are copied
+    verbatim.
+
+    Example: "/* a */ foo();\\nbar(); /* b\\n*/ baz();" -> "foo();\\nbar();\\nbaz();"
+    """
+    if rjsmin is not None:
+        return rjsmin.jsmin(source)
+
+    lines: List[str] = []
+    line = ""
+    i = 0
+    while i < len(source):
+        char = source[i]
+        if char == "\n":
+            lines.append(line)
+            line = ""
+            i += 1
+        elif source.startswith("//", i):
+            end = source.find("\n", i)
+            i = len(source) if end == -1 else end
+        elif source.startswith("/*", i):
+            end = source.find("*/", i + 2)
+            end = len(source) if end == -1 else end + 2
+            # Keep a line break the comment spanned, and keep tokens apart
+            if "\n" in source[i:end]:
+                lines.append(line)
+                line = ""
+            else:
+                line += " "
+            i = end
+        elif char in "'\"":
+            end = _js_string_end(source, i)
+            line += source[i:end]
+            i = end
+        elif char == "`":
+            end = _js_template_end(source, i)
+            # May span lines; kept as one verbatim piece
+            line += source[i:end]
+            i = end
+        elif char == "/" and _js_regex_allowed(
+                line if line.strip() else next((l for l in reversed(lines) if l.strip()), "")):
+            end = _js_regex_end(source, i)
+            line += source[i:end]
+            i = end
+        else:
+            line += char
+            i += 1
+    lines.append(line)
+
+    return "\n".join(stripped for stripped in (line.strip() for line in lines) if stripped)
+
+
+def _read(static_path: Path, names: Iterable[str]) -> List[str]:
+    return [(static_path / name).read_text(encoding="utf-8")
+            for name in names if (static_path / name).exists()]
+
+
+def build_bundles(static_path: Path, theme: Optional[str] = None,
+                  versioning: bool = False, highlight: bool = False) -> Dict[str, str]:
+    """
+    Build the minified bundles from a static assets directory.
+
+    Args:
+        static_path: Static assets directory (containing css/, js/, themes/)
+        theme: Selected premium theme, or None for the default look
+        versioning: Include the version switcher in the index script
+        highlight: Include the token colors of build-time highlighting
+
+    Returns:
+        Mapping of bundle kind ("critical_css", "css", "index_js",
+        "endpoint_js") to its minified source
+    """
+    css_sources = list(CSS_SOURCES)
+    if highlight:
+        css_sources.append(HIGHLIGHT_CSS)
+    if theme:
+        css_sources.append(f"themes/{theme}.css")
+
+    css = minify_css("\n".join(_read(static_path, css_sources)))
+    bundles = {
+        "critical_css": minify_css("\n".join(_read(static_path, [CRITICAL_CSS]))) + critical_css(css),
+        "css": css,
+    }
+    for kind, sources in JS_SOURCES.items():
+        if kind == "index_js" and versioning:
+            sources = sources + (VERSION_SWITCHER_JS,)
+        # Separate files with ';' so one without a trailing semicolon can't merge into the next
+        bundles[kind] = ";\n".join(minify_js(script) for script in _read(static_path, sources))
+    return bundles
+
+
+def bundle_filename(kind: str, theme: Optional[str] = None) -> str:
+    """
+    Output name of a bundle file.
+
+    Example: ("css", "dark-pro") -> "css/apiflow-dark-pro.min.css"
+    """
+    if kind == "css":
+        return f"css/apiflow-{theme}.min.css" if theme else "css/apiflow.min.css"
+    return f"js/{kind[:-len('_js')]}.min.js"
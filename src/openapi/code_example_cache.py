@@ -0,0 +1,128 @@
+"""
+On-disk cache of generated code examples.
+
+Generating (and, with --highlight server, highlighting) the code examples
+of every endpoint is repeated work on each build, and identical across
+the render worker processes. Each endpoint's examples are stored under a
+key derived from its operation digest (see OpenAPIParser.operation_digest),
+the enabled languages, the servers and the request body, so later builds
+and every worker reuse them while the operation is unchanged.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+
+class CodeExampleCache:
+    """
+    Stores code examples under ~/.apiflow/code-examples.
+
+    Entries unused for MAX_AGE_DAYS are removed by prune().
+    """
+
+    CACHE_DIR = Path.home() / ".apiflow" / "code-examples"
+    # Bump when code example output changes in a way the key doesn't capture
+    FORMAT_VERSION = 1
+    MAX_AGE_DAYS = 30
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the code example cache.
+
+        Args:
+            cache_dir: Optional cache directory (defaults to ~/.apiflow/code-examples)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else self.CACHE_DIR
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, *parts: str) -> str:
+        """
+        Cache key of an endpoint's code examples.
+
+        Args:
+            parts: Everything the examples are generated from, e.g. the
+                operation digest, the languages and the servers
+        """
+        digest = hashlib.sha256()
+        for part in (str(self.FORMAT_VERSION),) + parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        # Two-character subdirectories keep directories small for large APIs
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def load(self, key: str) -> Optional[Dict[str, str]]:
+        """
+        Look up the code examples of an endpoint.
+
+        Returns:
+            Language key -> code, or None on a miss
+        """
+        path = self._entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            # Mark as used, for prune()
+            os.utime(path)
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+
+        if not isinstance(entry, dict) or entry.get("format") != self.FORMAT_VERSION:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry["examples"]
+
+    def store(self, key: str, examples: Dict[str, str]) -> None:
+        """
+        Save the code examples of an endpoint.
+
+        The entry is written to a temporary file and renamed into place so
+        concurrent builds (and render workers) never read a partial entry.
+        """
+        path = self._entry_path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"format": self.FORMAT_VERSION, "examples": examples}, f,
+                          ensure_ascii=False)
+            os.replace(tmp, path)
+        except OSError:
+            # The cache is an optimization only; never fail a build over it
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def prune(self) -> int:
+        """
+        Remove entries unused for MAX_AGE_DAYS.
+
+        Returns:
+            Number of entries removed
+        """
+        cutoff = time.time() - self.MAX_AGE_DAYS * 86400
+        removed = 0
+        try:
+            entries = list(self.cache_dir.glob("*/*.json"))
+        except OSError:
+            return 0
+        for path in entries:
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                pass
+        return removed
@@ -0,0 +1,371 @@
+"""
+Code examples shown on endpoint pages.
+
+Each language is a plugin registered with @register_language: a function
+turning an ExampleContext into source code. The context holds everything
+derived from the endpoint (URL with path parameters substituted, query
+and header parameters, request body synthesized by openapi.examples),
+computed once per endpoint and shared by all languages.
+
+Built-in languages: curl, python and javascript (shown by default) and
+go, java, ruby and httpie (enabled through code_examples.languages).
+"""
+
+import json
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import quote, urlencode
+
+from openapi.examples import parameter_examples
+from openapi.parser import Endpoint
+
+DEFAULT_BASE_URL = "https://api.example.com"
+DEFAULT_LANGUAGES = ("curl", "python", "javascript")
+
+
+class ExampleContext(NamedTuple):
+    """Inputs shared by the code examples of one endpoint."""
+
+    method: str
+    base_url: str
+    path: str  # Path with example values for path parameters
+    query: Tuple[Tuple[str, str], ...]
+    headers: Tuple[Tuple[str, str], ...]
+    body: Optional[Any]  # Example request body, None without one
+
+    @property
+    def url(self) -> str:
+        return f"{self.base_url}{self.path}"
+
+    @property
+    def body_json(self) -> str:
+        """Request body as (pretty-printed) JSON."""
+        return json.dumps(self.body, indent=2)
+
+    def cache_key(self) -> Tuple[Any, ...]:
+        """Hashable form of the context; equal keys produce equal examples."""
+        return self[:-1] + (json.dumps(self.body),)
+
+
+class CodeLanguage(NamedTuple):
+    """A registered code example language."""
+
+    key: str  # Tab id, e.g. "curl"
+    label: str  # Tab title, e.g. "cURL"
+    syntax: str  # Prism / Pygments language of the code
+    render: Callable[[ExampleContext], str]
+
+
+LANGUAGES: Dict[str, CodeLanguage] = {}
+
+
+def register_language(key: str, label: str, syntax: str):
+    """
+    Register a code example language.
+
+    Example:
+        @register_language("php", "PHP", "php")
+        def php_example(context: ExampleContext) -> str:
+            ...
+    """
+    def decorator(render: Callable[[ExampleContext], str]) -> Callable[[ExampleContext], str]:
+        LANGUAGES[key] = CodeLanguage(key, label, syntax, render)
+        return render
+    return decorator
+
+
+def _format_value(value: Any) -> str:
+    """Parameter value as it appears in a URL or header (JSON for non-strings)."""
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def build_context(endpoint: Endpoint, servers: Sequence[Dict[str, Any]],
+                  body: Optional[Any] = None) -> ExampleContext:
+    """
+    Derive the shared example inputs of an endpoint.
+
+    Args:
+        endpoint: Endpoint to document
+        servers: Servers of the spec the endpoint belongs to
+        body: Example request body (defaults to {} when the endpoint takes one)
+    """
+    values = {key: _format_value(value) for key, value in parameter_examples(endpoint.parameters).items()}
+    path = endpoint.path
+    query = []
+    headers = []
+    for param in endpoint.parameters:
+        name = param["name"]
+        location = param["in"]
+        value = values.get((location, name))
+        if location == "path":
+            # Example values may contain "/", "?" or spaces; placeholders stay readable
+            path = path.replace(f"{{{name}}}", f"<{name}>" if value is None else quote(value, safe=""))
+            continue
+        if value is None:
+            value = f"<{name}>"
+        if location == "query":
+            query.append((name, value))
+        elif location == "header":
+            headers.append((name, value))
+
+    if endpoint.request_body and body is None:
+        body = {}
+
+    return ExampleContext(
+        method=endpoint.method,
+        base_url=servers[0]["url"] if servers else DEFAULT_BASE_URL,
+        path=path,
+        query=tuple(query),
+        headers=tuple(headers),
+        body=body if endpoint.request_body else None,
+    )
+
+
+def generate_examples(context: ExampleContext, languages: Iterable[str]) -> Dict[str, str]:
+    """
+    Render the code examples of one endpoint.
+
+    Returns:
+        Language key -> code, in the order of languages
+    """
+    return {key: LANGUAGES[key].render(context) for key in languages}
+
+
+def _quote(value: str, quote: str = "'") -> str:
+    """Quote a string literal, escaping backslashes and the quote character."""
+    return quote + value.replace("\\", "\\\\").replace(quote, "\\" + quote) + quote
+
+
+def _dquote(value: str) -> str:
+    return _quote(value, '"')
+
+
+def _shell_quote(value: str) -> str:
+    """Single-quote a shell word."""
+    return "'" + value.replace("'", "'\\''") + "'"
+
+
+@register_language("curl", "cURL", "bash")
+def curl_example(context: ExampleContext) -> str:
+    """Generate curl command example."""
+    lines = [f"curl -X {context.method}", _shell_quote(context.url)]
+    if context.query:
+        lines.append("-G")
+        lines.extend(f"--data-urlencode {_shell_quote(f'{name}={value}')}" for name, value in context.query)
+    lines.extend(f"-H {_shell_quote(f'{name}: {value}')}" for name, value in context.headers)
+    if context.body is not None:
+        lines.append("-H 'Content-Type: application/json'")
+        lines.append(f"-d {_shell_quote(json.dumps(context.body))}")
+    return " \\\n  ".join(lines)
+
+
+@register_language("python", "Python", "python")
+def python_example(context: ExampleContext) -> str:
+    """Generate Python requests example."""
+    method = context.method.lower()
+    code = "import requests\n\n"
+    code += f"url = {_quote(context.url)}\n"
+
+    arguments = ["url"]
+    if context.query:
+        code += "params = {\n"
+        code += "".join(f"    {_quote(name)}: {_quote(value)},\n" for name, value in context.query)
+        code += "}\n"
+        arguments.append("params=params")
+    if context.headers:
+        code += "headers = {\n"
+        code += "".join(f"    {_quote(name)}: {_quote(value)},\n" for name, value in context.headers)
+        code += "}\n"
+        arguments.append("headers=headers")
+    if context.body is not None:
+        code += f"payload = {_python_literal(context.body)}\n"
+        arguments.append("json=payload")
+
+    code += f"\nresponse = requests.{method}({', '.join(arguments)})\n"
+    code += "print(response.json())"
+    return code
+
+
+def _python_literal(value: Any, indent: int = 0) -> str:
+    """Format JSON data as a Python literal (True/False/None instead of true/false/null)."""
+    pad = "    " * indent
+    if isinstance(value, dict):
+        if not value:
+            return "{}"
+        items = "".join(
+            f"{pad}    {_quote(str(key))}: {_python_literal(item, indent + 1)},\n"
+            for key, item in value.items()
+        )
+        return "{\n" + items + pad + "}"
+    if isinstance(value, list):
+        if not value:
+            return "[]"
+        items = "".join(f"{pad}    {_python_literal(item, indent + 1)},\n" for item in value)
+        return "[\n" + items + pad + "]"
+    if isinstance(value, str):
+        return _quote(value)
+    return repr(value)
+
+
+@register_language("javascript", "JavaScript", "javascript")
+def javascript_example(context: ExampleContext) -> str:
+    """Generate JavaScript fetch example."""
+    url = context.url
+    if context.query:
+        url += "?" + urlencode(context.query)
+    code = f"const url = {_quote(url)};\n\n"
+    code += "fetch(url, {\n"
+    code += f"  method: '{context.method}',\n"
+
+    headers = list(context.headers)
+    if context.body is not None:
+        headers.append(("Content-Type", "application/json"))
+    if headers:
+        code += "  headers: {\n"
+        code += "".join(f"    {_quote(name)}: {_quote(value)},\n" for name, value in headers)
+        code += "  },\n"
+    if context.body is not None:
+        body = json.dumps(context.body, indent=2).replace("\n", "\n  ")
+        code += f"  body: JSON.stringify({body}),\n"
+
+    code += "})\n"
+    code += "  .then(response => response.json())\n"
+    code += "  .then(data => console.log(data));"
+    return code
+
+
+@register_language("go", "Go", "go")
+def go_example(context: ExampleContext) -> str:
+    """Generate Go net/http example."""
+    imports = ["fmt", "io", "net/http"]
+    body = "nil"
+    setup = []
+    url = _dquote(context.url)
+
+    if context.query:
+        imports.append("net/url")
+        setup.append("\tparams := url.Values{}")
+        setup.extend(f"\tparams.Add({_dquote(name)}, {_dquote(value)})"
+                     for name, value in context.query)
+        setup.append("")
+        url += ' + "?" + params.Encode()'
+    if context.body is not None:
+        imports.append("strings")
+        body_json = context.body_json
+        # A raw string can't contain a backtick; fall back to an interpreted string
+        literal = f"`{body_json}`" if "`" not in body_json else _dquote(json.dumps(context.body))
+        setup.append(f"\tbody := strings.NewReader({literal})")
+        body = "body"
+
+    headers = list(context.headers)
+    if context.body is not None:
+        headers.append(("Content-Type", "application/json"))
+
+    lines = ["package main", "", "import ("]
+    lines.extend(f'\t"{name}"' for name in sorted(imports))
+    lines += [")", "", "func main() {"]
+    lines += setup
+    lines += [
+        f'\treq, err := http.NewRequest("{context.method}", {url}, {body})',
+        "\tif err != nil {",
+        "\t\tpanic(err)",
+        "\t}",
+    ]
+    lines.extend(f"\treq.Header.Set({_dquote(name)}, {_dquote(value)})"
+                 for name, value in headers)
+    lines += [
+        "",
+        "\tresp, err := http.DefaultClient.Do(req)",
+        "\tif err != nil {",
+        "\t\tpanic(err)",
+        "\t}",
+        "\tdefer resp.Body.Close()",
+        "",
+        "\tdata, _ := io.ReadAll(resp.Body)",
+        "\tfmt.Println(string(data))",
+        "}",
+    ]
+    return "\n".join(lines)
+
+
+@register_language("java", "Java", "java")
+def java_example(context: ExampleContext) -> str:
+    """Generate Java 11+ HttpClient example."""
+    url = context.url
+    if context.query:
+        url += "?" + urlencode(context.query)
+
+    headers = list(context.headers)
+    if context.body is not None:
+        headers.append(("Content-Type", "application/json"))
+        publisher = f"HttpRequest.BodyPublishers.ofString({_dquote(json.dumps(context.body))})"
+    else:
+        publisher = "HttpRequest.BodyPublishers.noBody()"
+
+    lines = [
+        "import java.net.URI;",
+        "import java.net.http.HttpClient;",
+        "import java.net.http.HttpRequest;",
+        "import java.net.http.HttpResponse;",
+        "",
+        "HttpClient client = HttpClient.newHttpClient();",
+        "HttpRequest request = HttpRequest.newBuilder()",
+        f"    .uri(URI.create({_dquote(url)}))",
+    ]
+    lines.extend(f"    .header({_dquote(name)}, {_dquote(value)})" for name, value in headers)
+    lines += [
+        f'    .method("{context.method}", {publisher})',
+        "    .build();",
+        "",
+        "HttpResponse<String> response = client.send(request, HttpResponse.BodyHandlers.ofString());",
+        "System.out.println(response.body());",
+    ]
+    return "\n".join(lines)
+
+
+@register_language("ruby", "Ruby", "ruby")
+def ruby_example(context: ExampleContext) -> str:
+    """Generate Ruby Net::HTTP example."""
+    lines = ["require 'net/http'", "require 'uri'", "", f"uri = URI({_quote(context.url)})"]
+    if context.query:
+        pairs = ", ".join(f"{_quote(name)} => {_quote(value)}" for name, value in context.query)
+        lines.append(f"uri.query = URI.encode_www_form({pairs})")
+    lines += ["", f"request = Net::HTTP::{context.method.capitalize()}.new(uri)"]
+    lines.extend(f"request[{_quote(name)}] = {_quote(value)}" for name, value in context.headers)
+    if context.body is not None:
+        lines.append("request['Content-Type'] = 'application/json'")
+        lines.append(f"request.body = {_quote(json.dumps(context.body))}")
+    lines += [
+        "",
+        "response = Net::HTTP.start(uri.hostname, uri.port, use_ssl: uri.scheme == 'https') do |http|",
+        "  http.request(request)",
+        "end",
+        "puts response.body",
+    ]
+    return "\n".join(lines)
+
+
+@register_language("httpie", "HTTPie", "bash")
+def httpie_example(context: ExampleContext) -> str:
+    """Generate HTTPie command example."""
+    lines = [f"http {context.method} {_shell_quote(context.url)}"]
+    lines.extend(_shell_quote(f"{name}=={value}") for name, value in context.query)
+    lines.extend(_shell_quote(f"{name}:{value}") for name, value in context.headers)
+    if context.body is not None:
+        lines.append(f"--raw {_shell_quote(json.dumps(context.body))}")
+    return " \\\n  ".join(lines)
+
+
+def resolve_languages(keys: Iterable[str]) -> Tuple[List[CodeLanguage], List[str]]:
+    """
+    Look up configured languages.
+
+    Returns:
+        (registered languages in the given order, unknown keys)
+    """
+    languages, unknown = [], []
+    for key in keys:
+        if key in LANGUAGES:
+            languages.append(LANGUAGES[key])
+        else:
+            unknown.append(key)
+    return languages, unknown
@@ -0,0 +1,170 @@
+"""
+Precompressed copies of generated files.
+
+Writes index.html.gz (and index.html.br, with the brotli package) next to
+every generated HTML, CSS and JS file, so a web server with gzip_static /
+brotli_static serves them without compressing on each request.
+
+Compression runs in a thread pool (zlib and brotli release the GIL) and
+skips files whose content is unchanged since their siblings were written:
+siblings carry their source's mtime, so an untouched file is skipped
+without being read, and a rewritten one is compared by content hash
+before it is compressed again.
+"""
+
+import gzip
+import hashlib
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Format name -> file suffix
+FORMATS = {"gzip": ".gz", "brotli": ".br"}
+COMPRESSIBLE_SUFFIXES = {".html", ".css", ".js", ".json", ".svg", ".txt", ".xml"}
+# Smaller files gain nothing from compression (nginx's gzip_min_length defaults to 20)
+MIN_SIZE = 256
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+class CompressionResult(NamedTuple):
+    """Outcome of precompressing one file."""
+
+    filename: str
+    # {"digest": ..., "formats": [...]} for the build manifest, None if not compressed
+    entry: Optional[Dict[str, Any]]
+    compressed: bool
+    bytes_in: int
+    bytes_out: int
+
+
+def gzip_bytes(data: bytes) -> bytes:
+    """Gzip data reproducibly (no timestamp or filename in the header)."""
+    buffer = io.BytesIO()
+    with gzip.GzipFile(filename="", mode="wb", fileobj=buffer,
+                       compresslevel=GZIP_LEVEL, mtime=0) as f:
+        f.write(data)
+    return buffer.getvalue()
+
+
+def brotli_bytes(data: bytes) -> bytes:
+    """Compress data with brotli at maximum quality."""
+    return brotli.compress(data, quality=BROTLI_QUALITY)
+
+
+_COMPRESSORS = {"gzip": gzip_bytes, "brotli": brotli_bytes}
+
+
+def available_formats(formats: Iterable[str]) -> List[str]:
+    """Requested formats that can be produced (brotli needs the brotli package)."""
+    return [name for name in formats
+            if name in FORMATS and (name != "brotli" or brotli is not None)]
+
+
+def remove_siblings(output_dir: Path, filename: str, formats: Iterable[str]) -> None:
+    """Delete the precompressed siblings of a file."""
+    for name in formats:
+        sibling = output_dir / (filename + FORMATS.get(name, ""))
+        if sibling != output_dir / filename and sibling.exists():
+            sibling.unlink()
+
+
+class Precompressor:
+    """
+    Writes compressed siblings for generated files, skipping unchanged ones.
+    """
+
+    def __init__(self, output_dir: Path, formats: Iterable[str], workers: int = 0):
+        """
+        Initialize the precompressor.
+
+        Args:
+            output_dir: Directory containing the generated documentation
+            formats: Formats to write ("gzip", "brotli"); unavailable ones are ignored
+            workers: Compression threads (0 = all CPUs)
+        """
+        self.output_dir = Path(output_dir)
+        self.formats = available_formats(formats)
+        self.workers = workers if workers > 0 else (os.cpu_count() or 1)
+
+    def run(self, filenames: Iterable[str],
+            previous: Dict[str, Dict[str, Any]]) -> List[CompressionResult]:
+        """
+        Precompress files and drop siblings that are no longer wanted.
+
+        Args:
+            filenames: Generated files (relative to the output directory)
+            previous: Manifest entries of the previous run, by filename
+
+        Returns:
+            One result per compressible file
+        """
+        candidates = sorted(
+            name for name in set(filenames) if Path(name).suffix in COMPRESSIBLE_SUFFIXES
+        )
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(
+                lambda name: self._compress(name, previous.get(name)), candidates
+            ))
+
+        # Siblings of files that are gone, or of formats no longer written
+        current = {result.filename: result.entry for result in results}
+        for filename, entry in previous.items():
+            kept = (current.get(filename) or {}).get("formats", [])
+            remove_siblings(self.output_dir, filename,
+                            [name for name in entry.get("formats", []) if name not in kept])
+        return results
+
+    def _compress(self, filename: str, previous: Optional[Dict[str, Any]]) -> CompressionResult:
+        """Compress one file unless its siblings are already up to date."""
+        path = self.output_dir / filename
+        try:
+            stat = path.stat()
+        except OSError:
+            return CompressionResult(filename, None, False, 0, 0)
+        if stat.st_size < MIN_SIZE:
+            return CompressionResult(filename, None, False, 0, 0)
+
+        siblings = {name: Path(str(path) + FORMATS[name]) for name in self.formats}
+        if previous is not None and set(previous.get("formats", [])) == set(self.formats):
+            if all(self._mtime(sibling) == stat.st_mtime_ns for sibling in siblings.values()):
+                # Untouched since its siblings were written
+                return CompressionResult(filename, previous, False, 0, 0)
+
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        entry = {"digest": digest, "formats": list(self.formats)}
+
+        if (previous is not None and previous.get("digest") == digest
+                and set(previous.get("formats", [])) == set(self.formats)
+                and all(sibling.exists() for sibling in siblings.values())):
+            # Rewritten with identical content: just re-stamp the siblings
+            for sibling in siblings.values():
+                os.utime(sibling, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            return CompressionResult(filename, entry, False, 0, 0)
+
+        bytes_out = 0
+        for name, sibling in siblings.items():
+            compressed = _COMPRESSORS[name](data)
+            tmp = sibling.with_name(f".{sibling.name}.{os.getpid()}.tmp")
+            tmp.write_bytes(compressed)
+            os.utime(tmp, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            os.replace(tmp, sibling)
+            bytes_out += len(compressed)
+
+        return CompressionResult(filename, entry, True, len(data), bytes_out)
+
+    @staticmethod
+    def _mtime(path: Path) -> Optional[int]:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
@@ -0,0 +1,315 @@
+"""
+Watch mode: incremental rebuilds on change, served with live reload.
+
+One long-lived process keeps the parsers, the Jinja environment and the
+build manifest of the previous build, so a change only costs re-rendering
+the pages whose inputs changed:
+
+- a spec edit re-renders the operations whose digest changed (plus the
+  index and search index if the endpoint list changed);
+- a template edit re-renders only pages rendered from that template or
+  one of its includes (their template hash is part of the page hash);
+- a static asset edit only copies assets.
+
+Sources are watched by polling mtimes, so no extra dependency is needed.
+Pages are served from the output directory with an in-memory cache; HTML
+responses get a small script that reloads the page after each rebuild.
+"""
+
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    from openapi.generator import OpenAPIDocGenerator
+
+EVENTS_PATH = "/__apiflow/events"
+
+LIVE_RELOAD_SCRIPT = (
+    "<script>(function(){"
+    f"var source=new EventSource('{EVENTS_PATH}');"
+    "source.addEventListener('reload',function(){location.reload();});"
+    "})();</script>"
+).encode("utf-8")
+
+
+class SourceWatcher:
+    """
+    Detects changed files by polling their modification times.
+    """
+
+    def __init__(self):
+        """Initialize the watcher with nothing to watch."""
+        self._mtimes: Dict[Path, Optional[int]] = {}
+        self._directories: Dict[Path, str] = {}
+
+    def watch_file(self, path: Path) -> None:
+        """Watch a single file (which may not exist yet)."""
+        path = Path(path).resolve()
+        if path not in self._mtimes:
+            self._mtimes[path] = self._mtime(path)
+
+    def watch_directory(self, path: Path, pattern: str = "*") -> None:
+        """Watch every file under a directory that matches a glob pattern."""
+        path = Path(path).resolve()
+        self._directories[path] = pattern
+        for file in self._scan(path, pattern):
+            self.watch_file(file)
+
+    @staticmethod
+    def _mtime(path: Path) -> Optional[int]:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _scan(directory: Path, pattern: str) -> Iterable[Path]:
+        if not directory.is_dir():
+            return []
+        return (file for file in directory.rglob(pattern) if file.is_file())
+
+    def changes(self) -> Set[Path]:
+        """
+        Get files created, modified or deleted since the last call.
+
+        Returns:
+            Resolved paths of changed files
+        """
+        for directory, pattern in self._directories.items():
+            for file in self._scan(directory, pattern):
+                if file.resolve() not in self._mtimes:
+                    # New file: report it on this poll
+                    self._mtimes[file.resolve()] = None
+
+        changed = set()
+        for path, previous in list(self._mtimes.items()):
+            current = self._mtime(path)
+            if current != previous:
+                self._mtimes[path] = current
+                changed.add(path)
+        return changed
+
+
+class _DevRequestHandler(SimpleHTTPRequestHandler):
+    """Serves the output directory from memory and streams reload events."""
+
+    server: "DevServer"
+
+    def do_GET(self) -> None:
+        if self.path == EVENTS_PATH:
+            self._stream_events()
+            return
+        super().do_GET()
+
+    def send_head(self):
+        path = Path(self.translate_path(self.path))
+        if path.is_dir():
+            path = path / "index.html"
+            if not self.path.split("?", 1)[0].endswith("/"):
+                # Let the base class redirect to the trailing-slash URL
+                return super().send_head()
+
+        body = self.server.read(path)
+        if body is None:
+            return super().send_head()
+
+        if path.suffix == ".html":
+            body = body.replace(b"</body>", LIVE_RELOAD_SCRIPT + b"</body>", 1)
+
+        self.send_response(200)
+        self.send_header("Content-Type", self.guess_type(str(path)))
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+        return None
+
+    def _stream_events(self) -> None:
+        """Send a 'reload' server-sent event after every rebuild."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+
+        seen = self.server.build_number
+        try:
+            while not self.server.stopping:
+                build = self.server.wait_for_build(seen, timeout=15)
+                if build != seen:
+                    seen = build
+                    self.wfile.write(b"event: reload\ndata: {}\n\n")
+                else:
+                    # Keep-alive comment so proxies don't drop the connection
+                    self.wfile.write(b": ping\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+    def log_message(self, format: str, *args) -> None:
+        """Keep the console for build output."""
+
+
+class DevServer(ThreadingHTTPServer):
+    """
+    HTTP server for the generated docs with an in-memory file cache.
+
+    Cached files are revalidated by (mtime, size) on every request, so a
+    rebuild only needs to bump the build number for pages to reload.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, output_dir: Path, host: str = "127.0.0.1", port: int = 8000):
+        """
+        Initialize the server.
+
+        Args:
+            output_dir: Directory containing the generated documentation
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+        """
+        self.output_dir = Path(output_dir)
+        self.build_number = 0
+        self.stopping = False
+        self._cache: Dict[Path, Tuple[Tuple[int, int], bytes]] = {}
+        self._cache_lock = threading.Lock()
+        self._build_changed = threading.Condition()
+        handler = partial(_DevRequestHandler, directory=str(self.output_dir))
+        super().__init__((host, port), handler)
+
+    @property
+    def url(self) -> str:
+        """Base URL the docs are served at."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def read(self, path: Path) -> Optional[bytes]:
+        """Get a file's content, from memory if it is unchanged on disk."""
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        with self._cache_lock:
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == signature:
+                return cached[1]
+
+        try:
+            body = path.read_bytes()
+        except OSError:
+            return None
+        with self._cache_lock:
+            self._cache[path] = (signature, body)
+        return body
+
+    def notify_rebuild(self) -> None:
+        """Tell connected pages to reload."""
+        with self._build_changed:
+            self.build_number += 1
+            self._build_changed.notify_all()
+
+    def wait_for_build(self, seen: int, timeout: float) -> int:
+        """Block until a build newer than seen finishes (or timeout); return the build number."""
+        with self._build_changed:
+            self._build_changed.wait_for(lambda: self.build_number != seen or self.stopping, timeout)
+            return self.build_number
+
+    def start(self) -> threading.Thread:
+        """Serve requests on a background thread."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return thread
+
+    def stop(self) -> None:
+        """Stop serving and release waiting event streams."""
+        with self._build_changed:
+            self.stopping = True
+            self._build_changed.notify_all()
+        self.shutdown()
+        self.server_close()
+
+
+def _spec_documents(generator: "OpenAPIDocGenerator") -> List[Tuple[Path, Optional[str]]]:
+    """(document path, version) for every spec file and external $ref document the last build read."""
+    return [
+        (path, version)
+        for version, paths in generator.spec_documents.items()
+        for path in paths
+    ]
+
+
+def watch(generator: "OpenAPIDocGenerator", static_dir: Optional[str] = None,
+          host: str = "127.0.0.1", port: int = 8000, interval: float = 0.3,
+          serve: bool = True) -> None:
+    """
+    Rebuild the docs whenever a spec, template or static asset changes.
+
+    Expects the generator to have completed an initial build. Runs until
+    interrupted with Ctrl+C.
+
+    Args:
+        generator: Generator that ran the initial build
+        static_dir: Optional static assets directory (copied on change)
+        host: Interface for the dev server
+        port: Port for the dev server
+        interval: Seconds between polls for changes
+        serve: Serve the docs with live reload
+    """
+    watcher = SourceWatcher()
+    watcher.watch_directory(generator.template_dir)
+    if static_dir:
+        watcher.watch_directory(Path(static_dir))
+    documents = _spec_documents(generator)
+    for path, _ in documents:
+        watcher.watch_file(path)
+
+    server = None
+    if serve:
+        server = DevServer(generator.output_dir, host, port)
+        server.start()
+        print(f"\n🌐 Serving docs at {server.url} (live reload)")
+
+    print("👀 Watching specs, templates and static assets. Press Ctrl+C to stop.")
+
+    try:
+        while True:
+            time.sleep(interval)
+            changed = watcher.changes()
+            if not changed:
+                continue
+
+            start = time.perf_counter()
+            names = ", ".join(sorted(path.name for path in changed))
+            print(f"\n↻ Changed: {names}")
+
+            try:
+                for path, version in documents:
+                    if path in changed:
+                        generator.reload_spec(version)
+
+                generator.generate(static_dir=static_dir if static_dir else None)
+            except Exception as e:
+                # Keep serving the last good build until the next edit
+                print(f"⚠️  Rebuild failed: {e}")
+                continue
+
+            # New external $ref documents may have been added
+            documents = _spec_documents(generator)
+            for path, _ in documents:
+                watcher.watch_file(path)
+
+            print(f"✓ Rebuilt in {(time.perf_counter() - start) * 1000:.0f} ms")
+            if server is not None:
+                server.notify_rebuild()
+    except KeyboardInterrupt:
+        print("\n✓ Watch mode stopped")
+    finally:
+        if server is not None:
+            server.stop()
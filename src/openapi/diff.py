@@ -0,0 +1,476 @@
+"""
+Structural diff between API versions.
+
+Each version gets an OperationIndex: its operations keyed by
+"METHOD path", built from the lightweight endpoint summaries without
+parsing anything. Two versions are compared by key lookups, so a diff is
+linear in the number of operations. Operations present in both versions
+are compared by their content digest first (see
+OpenAPIParser.operation_digest); only operations whose digest differs are
+parsed and compared field by field: parameters, request body, responses
+and the schemas below them.
+
+Resolved schemas are shared views, so a model used by many operations is
+compared once per version pair.
+"""
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from openapi.parser import Endpoint, EndpointSummary, OpenAPIParser
+
+# Schema changes, relative to the compared schema: (field, kind, detail, breaking)
+_SchemaChange = Tuple[str, str, str, bool]
+
+
+class Change(NamedTuple):
+    """
+    One difference within an operation.
+
+    Attributes:
+        kind: "added", "removed" or "changed"
+        location: Where the change is, e.g. "query parameter limit" or
+            "response 200 (application/json) › items[].name"
+        detail: Human-readable description
+        breaking: Whether existing clients may break
+    """
+    kind: str
+    location: str
+    detail: str
+    breaking: bool
+
+
+class OperationDiff(NamedTuple):
+    """Changes of an operation present in both versions."""
+    summary: EndpointSummary
+    changes: Tuple[Change, ...]
+
+    @property
+    def breaking(self) -> bool:
+        return any(change.breaking for change in self.changes)
+
+
+class VersionDiff(NamedTuple):
+    """
+    Differences between two API versions.
+
+    Attributes:
+        old_version: Version compared against
+        new_version: Version whose changes are listed
+        added: Operations only in the new version
+        removed: Operations only in the old version
+        changed: Operations in both versions with structural changes
+        unchanged: Number of operations without structural changes
+    """
+    old_version: str
+    new_version: str
+    added: Tuple[EndpointSummary, ...]
+    removed: Tuple[EndpointSummary, ...]
+    changed: Tuple[OperationDiff, ...]
+    unchanged: int
+
+    @property
+    def breaking(self) -> bool:
+        return bool(self.removed) or any(operation.breaking for operation in self.changed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable copy of this diff."""
+        return {
+            "old_version": self.old_version,
+            "new_version": self.new_version,
+            "added": [summary.operation_key for summary in self.added],
+            "removed": [summary.operation_key for summary in self.removed],
+            "changed": {
+                operation.summary.operation_key: [change._asdict() for change in operation.changes]
+                for operation in self.changed
+            },
+            "unchanged": self.unchanged,
+        }
+
+
+class OperationIndex:
+    """
+    Operations of one API version keyed by "METHOD path".
+
+    Content digests are computed on first use and kept, so a version
+    compared with both of its neighbours is hashed once.
+    """
+
+    def __init__(self, parser: OpenAPIParser):
+        """
+        Index a version's operations.
+
+        Args:
+            parser: Parser of the version's spec
+        """
+        self.parser = parser
+        self._source = parser.get_endpoint_summaries()
+        self.operations: Dict[str, EndpointSummary] = {
+            summary.operation_key: summary for summary in self._source
+        }
+        self._digests: Dict[str, str] = {}
+
+    def is_stale(self) -> bool:
+        """Whether the parser rebuilt its model since the index was built."""
+        return self.parser.get_endpoint_summaries() is not self._source
+
+    def digest(self, key: str) -> str:
+        """Content digest of an operation (see OpenAPIParser.operation_digest)."""
+        if key not in self._digests:
+            summary = self.operations[key]
+            self._digests[key] = self.parser.operation_digest(summary.path, summary.method.lower())
+        return self._digests[key]
+
+    def endpoint(self, key: str) -> Endpoint:
+        """Parse an operation."""
+        summary = self.operations[key]
+        return self.parser.parse_endpoint(summary.path, summary.method)
+
+
+def diff_versions(old: OperationIndex, new: OperationIndex,
+                  old_version: str, new_version: str) -> VersionDiff:
+    """
+    Compare two indexed versions.
+
+    Args:
+        old: Index of the version compared against
+        new: Index of the version whose changes are listed
+        old_version: Identifier of the old version
+        new_version: Identifier of the new version
+
+    Returns:
+        The differences, with operations in the new (removed: old) spec order
+    """
+    differ = _SchemaDiffer()
+    added = []
+    changed = []
+    unchanged = 0
+
+    for key, summary in new.operations.items():
+        if key not in old.operations:
+            added.append(summary)
+        elif old.digest(key) == new.digest(key):
+            unchanged += 1
+        else:
+            changes = tuple(_operation_changes(old.endpoint(key), new.endpoint(key), differ))
+            if changes:
+                changed.append(OperationDiff(summary, changes))
+            else:
+                # Only documentation (descriptions, examples) changed
+                unchanged += 1
+
+    removed = [summary for key, summary in old.operations.items() if key not in new.operations]
+
+    return VersionDiff(old_version, new_version, tuple(added), tuple(removed),
+                       tuple(changed), unchanged)
+
+
+def _operation_changes(old: Endpoint, new: Endpoint, differ: "_SchemaDiffer") -> Iterator[Change]:
+    """Structural changes between two versions of an operation."""
+    if old.deprecated != new.deprecated:
+        yield Change("changed", "operation",
+                     "deprecated" if new.deprecated else "no longer deprecated", False)
+
+    yield from _parameter_changes(old.parameters, new.parameters, differ)
+    yield from _request_body_changes(old.request_body, new.request_body, differ)
+    yield from _response_changes(old.responses, new.responses, differ)
+
+
+def _parameter_changes(old: Tuple[Dict[str, Any], ...], new: Tuple[Dict[str, Any], ...],
+                       differ: "_SchemaDiffer") -> Iterator[Change]:
+    old_params = {(param["in"], param["name"]): param for param in old}
+    new_params = {(param["in"], param["name"]): param for param in new}
+
+    for key, param in new_params.items():
+        location = f"{key[0]} parameter {key[1]}"
+        previous = old_params.get(key)
+        if previous is None:
+            required = bool(param.get("required"))
+            yield Change("added", location, "required" if required else "optional", required)
+            continue
+
+        if bool(previous.get("required")) != bool(param.get("required")):
+            now_required = bool(param.get("required"))
+            yield Change("changed", location,
+                         "now required" if now_required else "now optional", now_required)
+        for change in differ.diff(previous.get("schema"), param.get("schema"), writing=True):
+            yield _schema_change(location, change)
+
+    for key in old_params:
+        if key not in new_params:
+            yield Change("removed", f"{key[0]} parameter {key[1]}", "", True)
+
+
+def _request_body_changes(old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]],
+                          differ: "_SchemaDiffer") -> Iterator[Change]:
+    if old is None and new is None:
+        return
+    if old is None:
+        required = bool(new.get("required"))
+        yield Change("added", "request body", "required" if required else "optional", required)
+        return
+    if new is None:
+        yield Change("removed", "request body", "", True)
+        return
+
+    if bool(old.get("required")) != bool(new.get("required")):
+        now_required = bool(new.get("required"))
+        yield Change("changed", "request body",
+                     "now required" if now_required else "now optional", now_required)
+    # Clients keep sending a media type the server no longer accepts
+    yield from _content_changes("request body", old.get("content"), new.get("content"),
+                                differ, writing=True, removal_breaking=True)
+
+
+def _response_changes(old: Tuple[Dict[str, Any], ...], new: Tuple[Dict[str, Any], ...],
+                      differ: "_SchemaDiffer") -> Iterator[Change]:
+    old_responses = {str(response["status_code"]): response for response in old}
+    new_responses = {str(response["status_code"]): response for response in new}
+
+    for status, response in new_responses.items():
+        location = f"response {status}"
+        previous = old_responses.get(status)
+        if previous is None:
+            yield Change("added", location, response.get("description", ""), False)
+            continue
+        # Clients expecting a media type the server no longer returns
+        yield from _content_changes(location, previous.get("content"), response.get("content"),
+                                    differ, writing=False, removal_breaking=True)
+
+    for status in old_responses:
+        if status not in new_responses:
+            yield Change("removed", f"response {status}", "", status.startswith("2"))
+
+
+def _content_changes(location: str, old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]],
+                     differ: "_SchemaDiffer", writing: bool,
+                     removal_breaking: bool) -> Iterator[Change]:
+    old = old or {}
+    new = new or {}
+
+    for media_type, media in new.items():
+        media_location = f"{location} ({media_type})"
+        if media_type not in old:
+            yield Change("added", media_location, "", False)
+            continue
+        old_schema = (old[media_type] or {}).get("schema")
+        new_schema = (media or {}).get("schema")
+        for change in differ.diff(old_schema, new_schema, writing):
+            yield _schema_change(media_location, change)
+
+    for media_type in old:
+        if media_type not in new:
+            yield Change("removed", f"{location} ({media_type})", "", removal_breaking)
+
+
+def _schema_change(location: str, change: _SchemaChange) -> Change:
+    """Turn a schema-relative change into a Change of the operation."""
+    field, kind, detail, breaking = change
+    return Change(kind, f"{location} › {field}" if field else location, detail, breaking)
+
+
+def _schema_type(schema: Dict[str, Any]) -> Optional[str]:
+    """JSON type of a schema, inferred from its keywords when "type" is absent."""
+    schema_type = schema.get("type")
+    if isinstance(schema_type, list):
+        # OpenAPI 3.1: ["string", "null"]
+        schema_type = next((t for t in schema_type if t != "null"), "null")
+    if schema_type:
+        return schema_type
+    if "properties" in schema or "additionalProperties" in schema:
+        return "object"
+    if "items" in schema:
+        return "array"
+    return None
+
+
+def _join(parent: str, child: str) -> str:
+    if not parent:
+        return child
+    if not child:
+        return parent
+    return parent + child if child.startswith("[") else f"{parent}.{child}"
+
+
+class _SchemaDiffer:
+    """
+    Compares schemas of one version pair, memoizing per schema pair.
+
+    Changes are reported relative to the compared schemas, so the result
+    for a shared model is reused wherever the model appears.
+    """
+
+    def __init__(self):
+        # (id(old), id(new), writing) -> (old, new, changes); the schemas are
+        # kept so their ids can't be reused by other objects
+        self._memo: Dict[Tuple[int, int, bool], Tuple[Any, Any, Tuple[_SchemaChange, ...]]] = {}
+
+    def diff(self, old: Any, new: Any, writing: bool) -> Tuple[_SchemaChange, ...]:
+        """
+        Compare two schemas.
+
+        Args:
+            old: Resolved schema of the old version
+            new: Resolved schema of the new version
+            writing: True for request schemas (sent by clients), False for
+                responses; decides which changes are breaking and whether
+                readOnly or writeOnly properties are compared
+
+        Returns:
+            Changes as (field, kind, detail, breaking), field "" for the schema itself
+        """
+        if old is new:
+            return ()
+        if not isinstance(old, dict) or not isinstance(new, dict):
+            if old == new:
+                return ()
+            return (("", "changed", "schema changed", True),)
+
+        key = (id(old), id(new), writing)
+        memo = self._memo.get(key)
+        if memo is None:
+            memo = (old, new, tuple(self._compare(old, new, writing)))
+            self._memo[key] = memo
+        return memo[2]
+
+    def _compare(self, old: Dict[str, Any], new: Dict[str, Any],
+                 writing: bool) -> Iterator[_SchemaChange]:
+        if old.get("x-circular-ref") or new.get("x-circular-ref"):
+            # Cycles are cut at the repeated reference; its target is
+            # compared where it is first expanded
+            if old.get("$ref") != new.get("$ref"):
+                yield "", "changed", f"now {new.get('$ref', 'an inline schema')}", True
+            return
+
+        old = self._flatten(old)
+        new = self._flatten(new)
+
+        old_type = _schema_type(old)
+        new_type = _schema_type(new)
+        if old_type != new_type:
+            # integer → number accepts more (requests) but returns more (responses)
+            widened = (old_type, new_type) == ("integer", "number")
+            yield ("", "changed", f"type {old_type or 'any'} → {new_type or 'any'}",
+                   not (widened and writing))
+            if not widened:
+                return
+
+        if old.get("format") != new.get("format"):
+            yield ("", "changed", f"format {old.get('format') or 'none'} → "
+                   f"{new.get('format') or 'none'}", True)
+
+        yield from self._enum_changes(old.get("enum"), new.get("enum"), writing)
+
+        for combiner in ("oneOf", "anyOf"):
+            yield from self._option_changes(combiner, old.get(combiner), new.get(combiner), writing)
+
+        if new_type == "object":
+            yield from self._object_changes(old, new, writing)
+        elif new_type == "array":
+            for field, kind, detail, breaking in self.diff(old.get("items"), new.get("items"), writing):
+                yield _join("[]", field), kind, detail, breaking
+
+    def _flatten(self, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge allOf members into one schema, so composition changes compare by content."""
+        if "allOf" not in schema:
+            return schema
+
+        merged = {name: value for name, value in schema.items() if name != "allOf"}
+        properties = dict(merged.get("properties") or {})
+        required = list(merged.get("required") or [])
+        for part in schema["allOf"]:
+            if not isinstance(part, dict):
+                continue
+            part = self._flatten(part)
+            for name, value in part.items():
+                if name == "properties":
+                    properties.update(value or {})
+                elif name == "required":
+                    required.extend(value or [])
+                else:
+                    merged.setdefault(name, value)
+        if properties:
+            merged["properties"] = properties
+            merged.setdefault("type", "object")
+        if required:
+            merged["required"] = required
+        return merged
+
+    @staticmethod
+    def _enum_changes(old: Any, new: Any, writing: bool) -> Iterator[_SchemaChange]:
+        if old == new:
+            return
+        if not isinstance(old, list) or not isinstance(new, list):
+            # An enum was added (restricts values) or dropped (widens them)
+            restricted = isinstance(new, list)
+            yield "", "changed", "now an enum" if restricted else "no longer an enum", (
+                restricted if writing else not restricted)
+            return
+
+        added = [value for value in new if value not in old]
+        removed = [value for value in old if value not in new]
+        if added:
+            # Clients may not expect new values in responses
+            yield "", "added", f"enum values {_values(added)}", not writing
+        if removed:
+            # Clients may still send values no longer accepted
+            yield "", "removed", f"enum values {_values(removed)}", writing
+
+    def _option_changes(self, combiner: str, old: Any, new: Any,
+                        writing: bool) -> Iterator[_SchemaChange]:
+        old = old if isinstance(old, list) else []
+        new = new if isinstance(new, list) else []
+        if not old and not new:
+            return
+        if len(old) != len(new):
+            yield "", "changed", f"{combiner} options {len(old)} → {len(new)}", True
+            return
+        for index, (old_option, new_option) in enumerate(zip(old, new)):
+            for field, kind, detail, breaking in self.diff(old_option, new_option, writing):
+                yield _join(f"({combiner} {index + 1})", field), kind, detail, breaking
+
+    def _object_changes(self, old: Dict[str, Any], new: Dict[str, Any],
+                        writing: bool) -> Iterator[_SchemaChange]:
+        # Properties the other side never sees are not part of the contract
+        hidden = "readOnly" if writing else "writeOnly"
+        old_properties = _visible_properties(old, hidden)
+        new_properties = _visible_properties(new, hidden)
+        old_required = set(old.get("required") or [])
+        new_required = set(new.get("required") or [])
+
+        for name, prop in new_properties.items():
+            if name not in old_properties:
+                required = name in new_required
+                yield (name, "added", "required" if required else "optional",
+                       writing and required)
+                continue
+
+            if writing and name in new_required and name not in old_required:
+                yield name, "changed", "now required", True
+            elif not writing and name in old_required and name not in new_required:
+                # Clients may rely on the field always being present
+                yield name, "changed", "now optional", True
+
+            for field, kind, detail, breaking in self.diff(old_properties[name], prop, writing):
+                yield _join(name, field), kind, detail, breaking
+
+        for name in old_properties:
+            if name not in new_properties:
+                # Clients may read the field (responses); sending it is usually tolerated
+                yield name, "removed", "", not writing
+
+        old_extra = old.get("additionalProperties")
+        new_extra = new.get("additionalProperties")
+        if isinstance(old_extra, dict) and isinstance(new_extra, dict):
+            for field, kind, detail, breaking in self.diff(old_extra, new_extra, writing):
+                yield _join("*", field), kind, detail, breaking
+
+
+def _visible_properties(schema: Dict[str, Any], hidden: str) -> Dict[str, Any]:
+    return {
+        name: prop for name, prop in (schema.get("properties") or {}).items()
+        if not (isinstance(prop, dict) and prop.get(hidden))
+    }
+
+
+def _values(values: List[Any]) -> str:
+    shown = ", ".join(str(value) for value in values[:5])
+    return shown + (f" (+{len(values) - 5} more)" if len(values) > 5 else "")
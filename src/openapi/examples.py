@@ -0,0 +1,318 @@
+"""
+Example payloads synthesized from JSON schemas.
+
+Turns resolved request/response schemas into example JSON values for code
+examples and response previews. Explicit examples in the spec win
+(example, examples, default, const, enum); otherwise values are derived
+from type and format, oneOf/anyOf take their first option and allOf
+members are merged.
+
+Synthesis is bounded: nesting deeper than max_depth yields empty objects
+and arrays, and at most max_nodes values are produced per example, so
+recursive or very large models stay small. Resolved schemas are shared
+views (see RefResolver), so results are memoized by schema identity and a
+model used by many operations is synthesized once per build.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+MAX_DEPTH = 6
+MAX_NODES = 200
+
+# Example strings by "format"
+FORMAT_EXAMPLES = {
+    "date": "2024-01-15",
+    "date-time": "2024-01-15T09:30:00Z",
+    "time": "09:30:00",
+    "email": "user@example.com",
+    "idn-email": "user@example.com",
+    "uri": "https://example.com",
+    "url": "https://example.com",
+    "uri-reference": "/example",
+    "hostname": "example.com",
+    "ipv4": "192.0.2.1",
+    "ipv6": "2001:db8::1",
+    "uuid": "3fa85f64-5717-4562-b3fc-2c963f66afa6",
+    "byte": "ZXhhbXBsZQ==",
+    "binary": "<binary>",
+    "password": "********",
+}
+
+# Sentinel for "no value" (None is a valid example: JSON null)
+_MISSING = object()
+
+
+class _Budget:
+    """Values left to produce for one example."""
+
+    __slots__ = ("nodes", "exhausted")
+
+    def __init__(self, nodes: int):
+        self.nodes = nodes
+        # Set once content was left out for lack of budget
+        self.exhausted = False
+
+    def available(self) -> bool:
+        if self.nodes <= 0:
+            self.exhausted = True
+        return not self.exhausted
+
+
+def media_json_schema(content: Optional[Dict[str, Any]]) -> Tuple[Optional[str], Any]:
+    """
+    Pick the JSON media type of a request/response content map.
+
+    Returns:
+        (media type, media object), or (None, None) without a JSON media type
+    """
+    for media_type, media in (content or {}).items():
+        base = media_type.split(";", 1)[0].strip().lower()
+        if base == "application/json" or base.endswith("+json"):
+            return media_type, media if isinstance(media, dict) else {}
+    return None, None
+
+
+class ExampleGenerator:
+    """
+    Synthesizes example values from resolved schemas, memoizing per schema.
+    """
+
+    def __init__(self, resolve: Optional[Callable[[Any], Any]] = None,
+                 max_depth: int = MAX_DEPTH, max_nodes: int = MAX_NODES):
+        """
+        Initialize the generator.
+
+        Args:
+            resolve: Resolves a {"$ref": ...} node; used to expand circular
+                references (marked x-circular-ref) up to max_depth
+            max_depth: Deepest nesting level that still gets content
+            max_nodes: Most values produced for one example
+        """
+        self.resolve = resolve
+        self.max_depth = max_depth
+        self.max_nodes = max_nodes
+        # (id(schema), depth, writing) -> (schema, value, node count); the
+        # schema is kept so its id can't be reused by another object
+        self._memo: Dict[Tuple[int, int, bool], Tuple[Any, Any, int]] = {}
+        self._circular: Dict[str, Any] = {}
+
+    def media_example(self, content: Optional[Dict[str, Any]], writing: bool = False) -> Any:
+        """
+        Example payload of a request/response content map.
+
+        Args:
+            content: Media type -> media object (with schema/example/examples)
+            writing: True for request bodies (readOnly properties are left
+                out), False for responses (writeOnly properties are left out)
+
+        Returns:
+            Example value, or None without a JSON media type
+        """
+        media_type, media = media_json_schema(content)
+        if media_type is None:
+            return None
+        if "example" in media:
+            return media["example"]
+        for example in (media.get("examples") or {}).values():
+            if isinstance(example, dict) and "value" in example:
+                return example["value"]
+        return self.example(media.get("schema"), writing)
+
+    def example(self, schema: Any, writing: bool = False) -> Any:
+        """
+        Example value of a schema.
+
+        Args:
+            schema: Resolved schema
+            writing: Leave out readOnly (True) or writeOnly (False) properties
+
+        Returns:
+            Example JSON value
+        """
+        return self._example(schema, 0, writing, _Budget(self.max_nodes))
+
+    def _example(self, schema: Any, depth: int, writing: bool, budget: _Budget) -> Any:
+        """Example of a schema at a nesting depth, spending from the node budget."""
+        if not isinstance(schema, dict):
+            return None
+
+        key = (id(schema), depth, writing)
+        memo = self._memo.get(key)
+        if memo is not None and memo[2] <= budget.nodes:
+            budget.nodes -= memo[2]
+            return memo[1]
+
+        before = budget.nodes
+        budget.nodes -= 1
+        value = self._synthesize(schema, depth, writing, budget)
+        if not budget.exhausted:
+            # Not cut short by the budget, so the same for every caller
+            self._memo[key] = (schema, value, before - budget.nodes)
+        return value
+
+    def _synthesize(self, schema: Dict[str, Any], depth: int, writing: bool,
+                    budget: _Budget) -> Any:
+        """Build the example of a schema (see _example)."""
+        explicit = _explicit_example(schema)
+        if explicit is not _MISSING:
+            return explicit
+
+        if schema.get("x-circular-ref"):
+            target = self._expand_circular(schema["$ref"])
+            if target is None or depth >= self.max_depth:
+                return {}
+            # Counts as a level, so self-referencing combinators terminate too
+            return self._example(target, depth + 1, writing, budget)
+
+        if "allOf" in schema:
+            return self._all_of(schema, depth, writing, budget)
+        for combiner in ("oneOf", "anyOf"):
+            options = [option for option in schema.get(combiner) or [] if _type_of(option) != "null"]
+            if options:
+                return self._example(options[0], depth, writing, budget)
+
+        schema_type = _type_of(schema)
+        if schema_type == "object":
+            return self._object(schema, depth, writing, budget)
+        if schema_type == "array":
+            if depth >= self.max_depth or not budget.available():
+                return []
+            count = min(max(int(schema.get("minItems") or 1), 1), 3)
+            return [self._example(schema.get("items"), depth + 1, writing, budget) for _ in range(count)]
+        if schema_type == "string":
+            return _string_example(schema)
+        if schema_type == "integer":
+            return int(_number_example(schema))
+        if schema_type == "number":
+            return float(_number_example(schema))
+        if schema_type == "boolean":
+            return True
+        return None
+
+    def _object(self, schema: Dict[str, Any], depth: int, writing: bool,
+                budget: _Budget) -> Dict[str, Any]:
+        if depth >= self.max_depth:
+            return {}
+        skip = "readOnly" if writing else "writeOnly"
+        value = {}
+        for name, prop in (schema.get("properties") or {}).items():
+            if not budget.available():
+                break
+            if isinstance(prop, dict) and prop.get(skip):
+                continue
+            value[name] = self._example(prop, depth + 1, writing, budget)
+
+        extra = schema.get("additionalProperties")
+        if not value and isinstance(extra, dict) and budget.available():
+            value["key"] = self._example(extra, depth + 1, writing, budget)
+        return value
+
+    def _all_of(self, schema: Dict[str, Any], depth: int, writing: bool,
+                budget: _Budget) -> Any:
+        """Merge the examples of allOf members (and the schema's own properties)."""
+        parts = list(schema["allOf"])
+        own = {name: item for name, item in schema.items() if name != "allOf"}
+        if own.get("properties"):
+            parts.append(own)
+
+        merged: Any = _MISSING
+        for part in parts:
+            value = self._example(part, depth, writing, budget)
+            if isinstance(merged, dict) and isinstance(value, dict):
+                merged = {**merged, **value}
+            elif value is not None or merged is _MISSING:
+                merged = value
+        return None if merged is _MISSING else merged
+
+    def _expand_circular(self, ref: str) -> Any:
+        """Resolved target of a circular reference (None if it can't be expanded)."""
+        if self.resolve is None:
+            return None
+        if ref not in self._circular:
+            target = self.resolve({"$ref": ref})
+            # An unresolvable ref comes back as itself
+            self._circular[ref] = None if isinstance(target, dict) and "$ref" in target else target
+        return self._circular[ref]
+
+
+def _explicit_example(schema: Dict[str, Any]) -> Any:
+    """Example given in the schema itself, or _MISSING."""
+    for field in ("example", "const", "default"):
+        if field in schema:
+            return schema[field]
+    examples = schema.get("examples")
+    if isinstance(examples, list) and examples:
+        return examples[0]
+    enum = schema.get("enum")
+    if isinstance(enum, list) and enum:
+        return enum[0]
+    return _MISSING
+
+
+def _type_of(schema: Any) -> Optional[str]:
+    """JSON type of a schema, inferred from its keywords when "type" is absent."""
+    if not isinstance(schema, dict):
+        return None
+    schema_type = schema.get("type")
+    if isinstance(schema_type, list):
+        # OpenAPI 3.1: ["string", "null"]
+        schema_type = next((t for t in schema_type if t != "null"), "null")
+    if schema_type:
+        return schema_type
+    if "properties" in schema or "additionalProperties" in schema:
+        return "object"
+    if "items" in schema:
+        return "array"
+    return None
+
+
+def _string_example(schema: Dict[str, Any]) -> str:
+    value = FORMAT_EXAMPLES.get(schema.get("format"), "string")
+    min_length = schema.get("minLength")
+    if isinstance(min_length, int) and len(value) < min_length:
+        value = value.ljust(min_length, "x")
+    max_length = schema.get("maxLength")
+    if isinstance(max_length, int) and len(value) > max_length:
+        value = value[:max_length]
+    return value
+
+
+def _number_example(schema: Dict[str, Any]) -> float:
+    minimum = schema.get("minimum")
+    maximum = schema.get("maximum")
+    if isinstance(minimum, (int, float)):
+        # OpenAPI 3.0: exclusiveMinimum is a flag; 3.1: a number
+        exclusive = schema.get("exclusiveMinimum")
+        if exclusive is True:
+            return minimum + 1
+        return minimum
+    if isinstance(schema.get("exclusiveMinimum"), (int, float)) and not isinstance(
+            schema.get("exclusiveMinimum"), bool):
+        return schema["exclusiveMinimum"] + 1
+    if isinstance(maximum, (int, float)) and maximum < 0:
+        return maximum
+    return 0
+
+
+def parameter_examples(parameters: Iterable[Dict[str, Any]]) -> Dict[Tuple[str, str], Any]:
+    """
+    Explicit example values of parameters, by (location, name).
+
+    Uses the parameter's own example, else one from its schema (example,
+    default, enum). Parameters without one are left out. A path and a
+    query parameter may share a name, hence the location in the key.
+
+    Example: [{"in": "path", "name": "id", "example": 7}] -> {("path", "id"): 7}
+    """
+    values = {}
+    for param in parameters:
+        key = (param["in"], param["name"])
+        if param.get("example") is not None:
+            values[key] = param["example"]
+            continue
+        schema = param.get("schema")
+        if isinstance(schema, dict):
+            explicit = _explicit_example(schema)
+            if explicit is not _MISSING and explicit is not None:
+                values[key] = explicit
+    return values
@@ -1,24 +1,176 @@
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import groupby, islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from openapi.parser import OpenAPIParser
-from openapi.version_manager import VersionManager
-from openapi.pdf_exporter import PDFExporter
+from typing import Dict, Any, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+from jinja2 import (
+    BaseLoader, BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader,
+    ModuleLoader, meta, nodes, select_autoescape,
+)
+from markupsafe import Markup, escape
+from openapi.assets import AssetCopier
+from openapi.compression import Precompressor, available_formats, remove_siblings
+from openapi.bundler import build_bundles, bundle_filename
+from openapi.examples import ExampleGenerator, media_json_schema
+from openapi.code_examples import DEFAULT_LANGUAGES, CodeLanguage, build_context, generate_examples, resolve_languages
+from openapi.build_manifest import BuildManifest, content_hash
+from openapi.parser import OpenAPIParser, Endpoint, EndpointSummary
+from openapi.version_manager import VersionManager, VersionedAPI
+from openapi.pdf_cache import PDFFragmentCache
+from openapi.code_example_cache import CodeExampleCache
+from openapi.pdf_exporter import PDFChunk, PDFExporter, PDFSection
+from openapi.profiling import BuildProfiler, Phase
+from openapi.search_index import search_index_files
+from openapi import highlighting
+from openapi import vendor_assets
+from openapi.spec_cache import SpecCache
 from license.validator import LicenseValidator
 from license.features import FeatureManager, LicenseTier
 from license.config import Config
+import functools
+import hashlib
 import json
+import os
 import shutil
 
 
+# Rendered code examples kept per process, keyed by their inputs
+CODE_EXAMPLE_CACHE_SIZE = 4096
+
+# Inline style of the current page's link in the endpoint sidebar
+NAV_ACTIVE_ATTRS = 'aria-current="page" style="background: var(--bg-tertiary); font-weight: 600;"'
+
+def schema_type_label(schema: Any) -> str:
+    """
+    Short, human-readable type of a resolved schema.
+
+    Example: {"type": "array", "items": {"type": "string"}} -> "array of string"
+    """
+    if not isinstance(schema, dict) or not schema:
+        return "any"
+
+    if "$ref" in schema:
+        # Circular or unresolvable reference: show the component name
+        return schema["$ref"].rsplit("/", 1)[-1]
+
+    for combiner in ("oneOf", "anyOf"):
+        if combiner in schema:
+            return " | ".join(schema_type_label(option) for option in schema[combiner])
+
+    schema_type = schema.get("type")
+    if schema_type == "array":
+        return f"array of {schema_type_label(schema.get('items'))}"
+    if isinstance(schema_type, list):
+        return " | ".join(str(t) for t in schema_type)
+    if schema.get("title"):
+        return schema["title"]
+    if not schema_type:
+        return "object" if "properties" in schema or "allOf" in schema else "any"
+    if schema.get("format"):
+        return f"{schema_type} ({schema['format']})"
+    return schema_type
+
+
+def create_template_environment(loader: BaseLoader,
+                                bytecode_cache: Optional[BytecodeCache] = None) -> Environment:
+    """Create a Jinja2 environment with the settings and filters all templates expect."""
+    env = Environment(
+        loader=loader,
+        autoescape=select_autoescape(["html", "xml"]),
+        bytecode_cache=bytecode_cache,
+    )
+    env.filters["schema_type"] = schema_type_label
+    return env
+
+
+def compile_templates(template_dir: str, target_dir: str) -> int:
+    """
+    Precompile every template in a directory into Python modules.
+
+    The result can be used with the 'templates.precompiled' setting (or
+    --precompiled-templates) to skip template compilation entirely.
+
+    Returns:
+        Number of templates compiled
+    """
+    env = create_template_environment(FileSystemLoader(template_dir))
+    names = env.list_templates()
+    Path(target_dir).mkdir(parents=True, exist_ok=True)
+    env.compile_templates(target_dir, zip=None, ignore_errors=False)
+    return len(names)
+
+
+class BuildTarget(NamedTuple):
+    """
+    One set of pages to generate: the single spec, or one API version.
+
+    Attributes:
+        version: Version identifier (None in single-spec mode)
+        parser: Parser for the target's spec
+        subdir: Output subdirectory for the target's pages ("" for the output root)
+        base_path: Relative prefix from the target's pages to shared assets
+        info: API info shown on the target's pages
+    """
+    version: Optional[str]
+    parser: OpenAPIParser
+    subdir: str
+    base_path: str
+    info: Dict[str, Any]
+
+    def output_name(self, filename: str) -> str:
+        """Path of a generated file relative to the output directory."""
+        return f"{self.subdir}/{filename}" if self.subdir else filename
+
+
+# Generator copy owned by a render worker process (see _init_render_worker)
+_worker_generator: Optional["OpenAPIDocGenerator"] = None
+# Build target the worker renders, and its page context (computed on the first shard)
+_worker_target: Optional[BuildTarget] = None
+_worker_page_context: Optional[Dict[str, Any]] = None
+
+
+def _init_render_worker(generator: "OpenAPIDocGenerator", target: BuildTarget) -> None:
+    """Pool initializer: keep one generator and the target being rendered per worker process."""
+    global _worker_generator, _worker_target, _worker_page_context
+    _worker_generator = generator
+    _worker_target = target
+    _worker_page_context = None
+    # Measurements taken before the fork belong to the parent's report
+    generator.profiler.reset()
+
+
+def _render_endpoint_chunk(operations: Sequence[Tuple[str, str]]) -> Optional[Dict[str, Any]]:
+    """
+    Parse, render and write one shard of (path, method) operations in a worker process.
+
+    Returns:
+        Profiler measurements of the shard (None when profiling is off)
+    """
+    global _worker_page_context
+    if _worker_page_context is None:
+        _worker_page_context = _worker_generator._endpoint_page_context(_worker_target)
+    _worker_generator._write_endpoint_pages(_worker_target, operations, _worker_page_context)
+    profiler = _worker_generator.profiler
+    return profiler.snapshot() if profiler.enabled else None
+
+
 class OpenAPIDocGenerator:
     """
     Generates HTML documentation from OpenAPI specification.
     """
 
+    # Upper bound on operations per parallel render task
+    MAX_SHARD_SIZE = 64
+    # Compiled template bytecode, reused across builds and worker processes
+    TEMPLATE_CACHE_DIR = Path.home() / ".apiflow" / "jinja-cache"
+    # Font Awesome webfonts subset to the icons in use
+    FONT_CACHE_DIR = Path.home() / ".apiflow" / "font-cache"
+
     def __init__(self, spec_path: str = None, output_dir: str = None, template_dir: str = None,
                  license_key: Optional[str] = None, config: Optional[Config] = None,
-                 version_manager: Optional[VersionManager] = None):
+                 version_manager: Optional[VersionManager] = None,
+                 spec_cache: Optional[SpecCache] = None, jobs: int = 1,
+                 incremental: bool = True, profiler: Optional[BuildProfiler] = None):
         """
         Initialize the documentation generator.
 
@@ -29,9 +181,16 @@ class OpenAPIDocGenerator:
             license_key: Optional license key for premium features
             config: Optional configuration object
             version_manager: Optional version manager for multi-version support
+            spec_cache: Optional on-disk cache of parsed specs
+            jobs: Number of worker processes for page rendering (0 = all CPUs)
+            incremental: Skip pages whose inputs are unchanged since the last build
+            profiler: Optional build profiler recording per-phase timings
         """
         self.output_dir = Path(output_dir) if output_dir else Path('api-docs')
         self.template_dir = Path(template_dir) if template_dir else Path('templates/api')
+        self.jobs = jobs if jobs > 0 else (os.cpu_count() or 1)
+        self.incremental = incremental
+        self.profiler = profiler or BuildProfiler(enabled=False)
 
         # Initialize configuration
         self.config = config or Config()
@@ -49,14 +208,30 @@ class OpenAPIDocGenerator:
 
         # For backward compatibility - single spec mode
         if spec_path and not version_manager:
-            self.parser = OpenAPIParser(spec_path)
+            self.parser = OpenAPIParser(spec_path, spec_cache=spec_cache, profiler=self.profiler)
         else:
             self.parser = None
 
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
-            autoescape=select_autoescape(["html", "xml"]),
+        precompiled = self.config.get('templates.precompiled')
+        self.precompiled_dir = Path(precompiled) if precompiled else None
+        self._parsed_templates: Dict[str, nodes.Template] = {}
+        self._precompiled_digest: Optional[str] = None
+        # Logical asset name -> output name (differs when assets are fingerprinted)
+        self.asset_urls: Dict[str, str] = {}
+        # Bundle kind -> asset name ("critical_css" -> inlined CSS), when bundling
+        self.asset_bundles: Dict[str, str] = {}
+        # Pages link self-hosted fonts, icons and Prism instead of CDNs
+        self.offline_assets = False
+        # Version (None for the single spec) -> spec files read by the last build
+        self.spec_documents: Dict[Optional[str], List[Path]] = {}
+        self.server_highlighting = self._use_server_highlighting()
+        self.code_languages = self._code_languages()
+        self._code_example_memo: "OrderedDict[Any, Dict[str, str]]" = OrderedDict()
+        # Code examples reused across builds and render workers
+        self.code_example_cache = (
+            CodeExampleCache() if self.config.get('code_examples.cache', True) else None
         )
+        self.jinja_env = self._create_jinja_env()
 
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -70,86 +245,606 @@ class OpenAPIDocGenerator:
             print("\n⚠️  Version management requires PRO license. Using single version mode.")
             self.use_versioning = False
 
+        # Without versioning, a version manager still provides the spec to document
+        if self.parser is None and version_manager is not None and not self.use_versioning:
+            default_version = version_manager.get_default_version()
+            self.parser = default_version.parser if default_version else None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the Jinja environment when sending the generator to a worker."""
+        state = self.__dict__.copy()
+        del state["jinja_env"]
+        state["_parsed_templates"] = {}
+        state["_code_example_memo"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Rebuild the Jinja environment inside a worker process."""
+        self.__dict__.update(state)
+        self.jinja_env = self._create_jinja_env()
+
+    def _create_jinja_env(self) -> Environment:
+        """
+        Create the Jinja2 environment for the template directory.
+
+        Precompiled templates are loaded as Python modules when configured.
+        Otherwise templates are compiled from source, with the bytecode kept
+        in ~/.apiflow/jinja-cache so later builds (and render workers) skip
+        compilation while the template source is unchanged.
+        """
+        if self.precompiled_dir:
+            env = create_template_environment(ModuleLoader(str(self.precompiled_dir)))
+        else:
+            env = create_template_environment(
+                FileSystemLoader(str(self.template_dir)),
+                bytecode_cache=self._template_bytecode_cache(),
+            )
+        env.globals["asset"] = self.asset_url
+        env.globals["bundle"] = self.asset_bundle
+        return env
+
+    def asset_url(self, name: str) -> str:
+        """
+        Get the output name of a static asset, for use in templates as asset().
+
+        Example: asset('css/api-docs.css') -> "css/api-docs.1a2b3c4d5e.css"
+        when fingerprinting is enabled, "css/api-docs.css" otherwise.
+        """
+        return self.asset_urls.get(name, name)
+
+    def asset_bundle(self, kind: str) -> Optional[str]:
+        """
+        Get a bundle for use in templates as bundle(), or None without bundling.
+
+        Args:
+            kind: "css", "index_js" or "endpoint_js" for the bundle's asset
+                  name, or "critical_css" for the CSS inlined in the <head>
+        """
+        value = self.asset_bundles.get(kind)
+        if kind == "critical_css" and value is not None:
+            # Safe inside <style>; minified CSS never legitimately contains "</"
+            return Markup(value.replace("</", "<\\/"))
+        return value
+
+    def _template_bytecode_cache(self) -> Optional[BytecodeCache]:
+        """Get the on-disk template bytecode cache, or None if disabled or unavailable."""
+        if not self.config.get('templates.bytecode_cache', True):
+            return None
+
+        try:
+            self.TEMPLATE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            # The cache is an optimization only; never fail a build over it
+            return None
+        return FileSystemBytecodeCache(str(self.TEMPLATE_CACHE_DIR))
+
+    def _parse_template(self, source: str) -> nodes.Template:
+        """Parse template source into an AST, once per distinct source."""
+        if source not in self._parsed_templates:
+            self._parsed_templates[source] = self.jinja_env.parse(source)
+        return self._parsed_templates[source]
+
     def generate(self, static_dir: str = None, export_pdf: bool = False) -> None:
         """
         Generate all documentation pages.
 
+        With versioning, versions are built oldest first. Each version's
+        spec is loaded just before its pages are written and released once
+        they and its changelog are, so at most two specs are in memory.
+
         Args:
             static_dir: Optional path to static assets directory to copy
             export_pdf: Export documentation to PDF (requires PRO license)
         """
+        manifest = BuildManifest(self.output_dir, force=not self.incremental)
+
         # Copy static assets if provided
         if static_dir:
-            self._copy_static_assets(static_dir)
+            self._copy_static_assets(static_dir, manifest)
+        elif self.config.get('assets.offline', False):
+            raise vendor_assets.MissingVendorFilesError(
+                "Offline assets need the static assets directory holding vendor/"
+            )
+
+        # Output name of every endpoint page by content digest, shared across versions
+        produced: Dict[str, str] = {}
+        self.spec_documents.clear()
 
-        self._generate_index()
-        self._generate_endpoint_pages()
+        if not self.use_versioning:
+            self._generate_target(self._build_target(None), manifest, produced)
+        else:
+            previous = None
+            for version in sorted(self.version_manager.versions):
+                with self.profiler.phase("versions.load"):
+                    target = self._build_target(version)
+                self._generate_target(target, manifest, produced)
+                if previous is not None:
+                    # The changelog is the last page needing the previous version
+                    with self.profiler.phase("changelog"):
+                        self._generate_changelog(previous, version, manifest)
+                    self.version_manager.release(previous)
+                previous = version
+            # The targets hold the parsers too
+            del target
+            self.version_manager.release(previous)
+
+        if self.code_example_cache is not None:
+            self.code_example_cache.prune()
+
+        removed = manifest.remove_stale()
+        self._precompress(manifest)
+        manifest.save()
+
+        if self.incremental:
+            print(f"✓ Incremental build: {manifest.rendered} page(s) rendered, "
+                  f"{manifest.skipped} unchanged, {len(removed)} removed")
 
         # PDF export (PRO feature)
         if export_pdf:
             if self.features.has_feature('pdf_export'):
-                self._export_to_pdf()
+                with self.profiler.phase("pdf.export"):
+                    self._export_to_pdf()
             else:
                 print("\n⚠️  PDF export requires PRO or BUSINESS license")
                 print("   Upgrade at: https://gumroad.com/l/apiflow-pro")
 
-    def _copy_static_assets(self, static_dir: str) -> None:
-        """Copy CSS, JS, and other static assets to output directory."""
+    def _generate_target(self, target: BuildTarget, manifest: BuildManifest,
+                         produced: Dict[str, str]) -> None:
+        """
+        Write the index, search index and endpoint pages of one build target.
+
+        Args:
+            target: Build target to document
+            manifest: Build manifest; unchanged files are not rewritten
+            produced: Endpoint pages written so far by content digest (see _pending_operations)
+        """
+        with self.profiler.phase("index"):
+            self._generate_index(target, manifest)
+        with self.profiler.phase("search.index"):
+            self._generate_search_index(target, manifest)
+        if self._navigation_mode() == 'shared':
+            with self.profiler.phase("nav.shared"):
+                self._generate_shared_nav(target, manifest)
+        with self.profiler.phase("endpoint.pages"):
+            self._generate_endpoint_pages(target, manifest, produced)
+
+        # Files the watch mode rebuilds this target on, including $ref documents
+        parser = target.parser
+        self.spec_documents[target.version] = [parser.spec_path.resolve()] + [
+            Path(path) for path in parser.resolver.documents()
+        ]
+
+    def reload_spec(self, version: Optional[str] = None) -> None:
+        """
+        Make the next build pick up changes to a spec or its $ref documents.
+
+        Versions are released after every build and loaded again by the
+        next one, so only the single spec needs reloading.
+
+        Args:
+            version: Version whose spec changed (None in single-spec mode)
+        """
+        if version is None and self.parser is not None:
+            # Drop the resolver too, so external $ref documents are re-read
+            self.parser.invalidate()
+            self.parser.refresh()
+
+    def _precompress(self, manifest: BuildManifest) -> None:
+        """
+        Write .gz/.br siblings of generated files, if enabled.
+
+        When disabled, siblings written by earlier builds are removed so
+        they can never be served with outdated content.
+
+        Args:
+            manifest: Build manifest of this build (records the compressed files)
+        """
+        if not self.config.get('compression.enabled', False):
+            for filename, entry in manifest.previous_compressed.items():
+                remove_siblings(self.output_dir, filename, entry.get("formats", []))
+            return
+
+        requested = self.config.get('compression.formats', ['gzip', 'brotli'])
+        formats = available_formats(requested)
+        if 'brotli' in requested and 'brotli' not in formats:
+            print("⚠️  brotli is not installed (pip install brotli); writing gzip only")
+
+        with self.profiler.phase("compress") as phase:
+            precompressor = Precompressor(self.output_dir, formats)
+            results = precompressor.run(manifest.generated_files(), manifest.previous_compressed)
+
+            manifest.compressed = {
+                result.filename: result.entry for result in results if result.entry is not None
+            }
+            written = [result for result in results if result.compressed]
+            phase.items = len(written)
+            phase.bytes = sum(result.bytes_out for result in written)
+
+        print(f"✓ Precompressed {len(written)} file(s) ({', '.join(formats)}), "
+              f"{len(manifest.compressed) - len(written)} unchanged")
+
+    def _use_server_highlighting(self) -> bool:
+        """Whether code examples are highlighted at build time instead of by Prism in the browser."""
+        mode = self.config.get('code_examples.highlight', 'client')
+        if mode != 'server':
+            return False
+        if not highlighting.is_available():
+            print("⚠️  Build-time highlighting requires Pygments (pip install pygments); using Prism")
+            return False
+        return True
+
+    def _code_languages(self) -> List[CodeLanguage]:
+        """Code example languages shown on endpoint pages, in tab order."""
+        keys = self.config.get('code_examples.languages') or DEFAULT_LANGUAGES
+        languages, unknown = resolve_languages(keys)
+        if unknown:
+            print(f"⚠️  Unknown code example language(s) ignored: {', '.join(unknown)}")
+        return languages
+
+    def _copy_static_assets(self, static_dir: str, manifest: Optional[BuildManifest] = None) -> None:
+        """
+        Copy CSS, JS, and other static assets to output directory.
+
+        Files identical to the copy from the previous build are left alone.
+
+        Args:
+            static_dir: Path to static assets directory
+            manifest: Optional build manifest; copied assets are recorded so
+                      outdated ones (e.g. old fingerprinted names) are removed
+        """
         static_path = Path(static_dir)
         if not static_path.exists():
             return
 
-        # Copy CSS files
-        css_src = static_path / "css"
-        if css_src.exists():
-            css_dest = self.output_dir / "css"
-            css_dest.mkdir(exist_ok=True)
-            for css_file in css_src.glob("*.css"):
-                shutil.copy2(css_file, css_dest / css_file.name)
-
-        # Copy JS files
-        js_src = static_path / "js"
-        if js_src.exists():
-            js_dest = self.output_dir / "js"
-            js_dest.mkdir(exist_ok=True)
-            for js_file in js_src.glob("*.js"):
-                shutil.copy2(js_file, js_dest / js_file.name)
+        copier = AssetCopier(
+            self.output_dir,
+            fingerprint=self.config.get('assets.fingerprint', False),
+            link_mode=self.config.get('assets.link_mode', 'auto'),
+        )
+
+        with self.profiler.phase("static.copy") as phase:
+            for subdir, pattern in (("css", "*.css"), ("js", "*.js")):
+                self._copy_asset_dir(copier, static_path / subdir, subdir, pattern, phase)
 
         # Copy theme files if user has premium features
         if self.features.has_feature('premium_themes'):
-            self._copy_theme_files(static_path)
+            self._copy_theme_files(static_path, copier)
+
+        self.offline_assets = False
+        if self.config.get('assets.offline', False):
+            with self.profiler.phase("vendor.copy"):
+                self.offline_assets = self._copy_vendor_assets(static_path, copier)
+
+        self.asset_bundles = {}
+        if self.config.get('assets.bundle', False):
+            with self.profiler.phase("assets.bundle"):
+                self._bundle_assets(static_path, copier)
+
+        self.asset_urls = copier.urls
+        if manifest is not None:
+            for name, output_name in copier.urls.items():
+                manifest.record_asset(output_name, name)
 
         # Print versioning status
         if self.use_versioning:
             print(f"✓ Version management enabled ({len(self.version_manager.versions)} versions)")
 
-    def _generate_index(self) -> None:
-        """Generate the main index/overview page."""
-        template = self.jinja_env.get_template("api_index.html")
+    def _copy_vendor_assets(self, static_path: Path, copier: AssetCopier) -> bool:
+        """
+        Copy the self-hosted fonts, icons and Prism files into the output.
 
-        if self.use_versioning:
-            # Multi-version mode
-            default_version = self.version_manager.get_default_version()
-            info = default_version.get_info()
-            servers = default_version.get_servers()
-            endpoints = default_version.get_endpoints()
-            tags = default_version.get_tags()
-
-            # Get all versions
-            versions = self.version_manager.get_version_list()
-            default_version_label = next((v['label'] for v in versions if v['is_default']), None)
+        Args:
+            static_path: Static assets directory (containing vendor/)
+            copier: Asset copier of this build
+
+        Returns:
+            True (pages link the local copies)
+
+        Raises:
+            MissingVendorFilesError: If vendor files haven't been downloaded;
+                offline builds never fall back to CDN links
+        """
+        missing = vendor_assets.missing_vendor_files(static_path)
+        if missing:
+            raise vendor_assets.MissingVendorFilesError(
+                f"{len(missing)} offline asset file(s) missing from "
+                f"{static_path / vendor_assets.VENDOR_DIR} (e.g. {missing[0]}); download them with: "
+                "python3 generate_api_docs.py --fetch-offline-assets"
+            )
+
+        vendor_path = static_path / vendor_assets.VENDOR_DIR
+        for source in sorted((vendor_path / "prism").glob("*")):
+            copier.copy(source, f"vendor/prism/{source.name}")
+
+        # Stylesheets refer to fonts by (possibly fingerprinted) name in the same directory
+        font_urls = {}
+        for weight in vendor_assets.INTER_WEIGHTS:
+            name = f"vendor/fonts/inter-latin-{weight}-normal.woff2"
+            font_urls[weight] = Path(copier.copy(vendor_path / name[len("vendor/"):], name)).name
+        copier.write("vendor/fonts/inter.css", vendor_assets.inter_stylesheet(font_urls).encode("utf-8"))
+
+        self._copy_icon_font(static_path, copier)
+        return True
+
+    def _copy_icon_font(self, static_path: Path, copier: AssetCopier) -> None:
+        """
+        Write vendor/font-awesome/icons.css and its webfonts.
+
+        With fontTools installed, the fonts only contain the icons used by
+        the templates and scripts; otherwise the full Font Awesome is copied.
+        """
+        font_awesome_path = static_path / vendor_assets.VENDOR_DIR / "font-awesome"
+        full_css = (font_awesome_path / "css" / "all.min.css").read_text(encoding="utf-8")
+        sources = [path.read_text(encoding="utf-8")
+                   for path in sorted(self.template_dir.glob("*.html"))]
+        sources += [path.read_text(encoding="utf-8")
+                    for path in sorted((static_path / "js").glob("*.js"))]
+        icons, styles = vendor_assets.used_icons(sources)
+        codepoints = vendor_assets.icon_codepoints(full_css, icons)
+
+        subsets = {
+            style: self._subset_icon_font(
+                font_awesome_path / "webfonts" / vendor_assets.FONT_AWESOME_STYLES[style][0],
+                codepoints.values(),
+            )
+            for style in sorted(styles)
+        }
+
+        if all(font is not None for font in subsets.values()):
+            font_urls = {
+                style: Path(copier.write(f"vendor/font-awesome/icons-{style}.woff2", font)).name
+                for style, font in subsets.items()
+            }
+            css = vendor_assets.icon_stylesheet(codepoints, font_urls)
         else:
+            # No fontTools: ship the full stylesheet and webfonts
+            font_urls = {}
+            for source in sorted((font_awesome_path / "webfonts").glob("*")):
+                output_name = copier.copy(source, f"vendor/font-awesome/webfonts/{source.name}")
+                font_urls[source.name] = f"webfonts/{Path(output_name).name}"
+            css = vendor_assets.rewrite_webfont_urls(full_css, font_urls)
+
+        copier.write("vendor/font-awesome/icons.css", css.encode("utf-8"))
+
+    def _subset_icon_font(self, font_path: Path, codepoints: Iterable[int]) -> Optional[bytes]:
+        """Subset an icon font, reusing the result while the font and icon set are unchanged."""
+        font_data = font_path.read_bytes()
+        codepoints = sorted(set(codepoints))
+        key = content_hash(hashlib.sha256(font_data).hexdigest(), codepoints)
+        cache_path = self.FONT_CACHE_DIR / f"{key}.woff2"
+        if cache_path.exists():
+            return cache_path.read_bytes()
+
+        font = vendor_assets.subset_font(font_data, codepoints)
+        if font is not None:
+            try:
+                self.FONT_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                cache_path.write_bytes(font)
+            except OSError:
+                # The cache is an optimization only
+                pass
+        return font
+
+    def _bundle_assets(self, static_path: Path, copier: AssetCopier) -> None:
+        """
+        Write minified per-theme CSS and per-page JS bundles.
+
+        Args:
+            static_path: Static assets directory
+            copier: Asset copier of this build (bundles are fingerprinted like other assets)
+        """
+        theme = self.get_selected_theme()
+        bundles = build_bundles(static_path, theme=theme, versioning=self.use_versioning,
+                                highlight=self.server_highlighting)
+
+        self.asset_bundles["critical_css"] = bundles.pop("critical_css")
+        for kind, source in bundles.items():
+            name = bundle_filename(kind, theme)
+            copier.write(name, source.encode("utf-8"))
+            self.asset_bundles[kind] = name
+
+        print(f"✓ Assets bundled ({len(bundles)} files, critical CSS inlined)")
+
+    @staticmethod
+    def _copy_asset_dir(copier: AssetCopier, source_dir: Path, subdir: str,
+                        pattern: str, phase: Phase) -> None:
+        """Copy the files of one static asset directory, counting those actually written."""
+        if not source_dir.exists():
+            return
+
+        for source in sorted(source_dir.glob(pattern)):
+            copied = copier.copied
+            copier.copy(source, f"{subdir}/{source.name}")
+            if copier.copied > copied:
+                phase.items += 1
+                phase.bytes += source.stat().st_size
+
+    def _template_sources(self, name: str) -> Dict[str, str]:
+        """
+        Get the source of a template and every template it includes or extends.
+
+        Precompiled templates have no source; they are represented by a
+        digest of the whole precompiled directory instead.
+        """
+        if self.precompiled_dir:
+            if self._precompiled_digest is None:
+                self._precompiled_digest = content_hash([
+                    (module.name, module.read_text(encoding="utf-8"))
+                    for module in sorted(self.precompiled_dir.glob("*.py"))
+                ])
+            return {"<precompiled>": self._precompiled_digest}
+
+        sources = {}
+        pending = [name]
+
+        while pending:
+            current = pending.pop()
+            if current in sources:
+                continue
+            source, _, _ = self.jinja_env.loader.get_source(self.jinja_env, current)
+            sources[current] = source
+            # Dynamic includes yield None and can't be tracked
+            referenced = meta.find_referenced_templates(self._parse_template(source))
+            pending.extend(ref for ref in referenced if ref)
+
+        return sources
+
+    def _template_hash(self, name: str) -> str:
+        """Hash a template together with every template it includes or extends."""
+        return content_hash(self._template_sources(name))
+
+    def _template_fields(self, name: str, variable: str) -> Optional[FrozenSet[str]]:
+        """
+        Find which fields of a context variable a template (and its includes) reads.
+
+        Example: a template using only {{ info.title }} -> {"title"}
+
+        Returns:
+            The field names, or None if the variable is used as a whole
+        """
+        if self.precompiled_dir:
+            # No source to analyze
+            return None
+
+        fields = set()
+
+        for source in self._template_sources(name).values():
+            ast = self._parse_template(source)
+            accessed = set()
+            for node in ast.find_all((nodes.Getattr, nodes.Getitem)):
+                if isinstance(node.node, nodes.Name) and node.node.name == variable:
+                    if isinstance(node, nodes.Getattr):
+                        fields.add(node.attr)
+                    elif isinstance(node.arg, nodes.Const) and isinstance(node.arg.value, str):
+                        fields.add(node.arg.value)
+                    else:
+                        return None
+                    accessed.add(id(node.node))
+
+            # Any other use (passed to a filter, iterated, ...) needs the whole value
+            for node in ast.find_all(nodes.Name):
+                if node.name == variable and id(node) not in accessed:
+                    return None
+
+        return frozenset(fields)
+
+    def _build_settings(self) -> Dict[str, Any]:
+        """Settings that affect every rendered page."""
+        return {
+            "license_tier": self.license.get_tier().value,
+            "show_branding": self._should_show_branding(),
+            "selected_theme": self.get_selected_theme(),
+            "config": self.config.config,
+            "assets": self.asset_urls,
+            "bundles": self.asset_bundles,
+            "offline_assets": self.offline_assets,
+            "server_highlighting": self.server_highlighting,
+        }
+
+    def _build_targets(self) -> List[BuildTarget]:
+        """
+        Get the page sets this build generates.
+
+        In single-spec mode, one target writes to the output root. With
+        versioning, every version gets its own subdirectory named after it.
+        """
+        if not self.use_versioning:
+            return [BuildTarget(None, self.parser, "", "", self.parser.get_info())]
+
+        return [self._version_target(api) for api in self.version_manager.get_all_versions()]
+
+    @staticmethod
+    def _version_target(api: VersionedAPI) -> BuildTarget:
+        """Get the build target of an API version."""
+        return BuildTarget(api.version, api.parser, api.version, "../", api.get_info())
+
+    def _build_target(self, version: Optional[str]) -> BuildTarget:
+        """Get the build target for a version (None in single-spec mode)."""
+        if self.use_versioning:
+            # Only this version's spec needs to be loaded
+            return self._version_target(self.version_manager.get_version(version))
+        return next(target for target in self._build_targets() if target.version == version)
+
+    def _generate_index(self, target: BuildTarget, manifest: Optional[BuildManifest] = None) -> None:
+        """
+        Generate the main index/overview page of a build target.
+
+        With versioning, every version gets an index in its subdirectory and
+        the root index shows the default version, linking into its subdirectory.
+
+        Args:
+            target: Build target whose index is written
+            manifest: Optional build manifest; pages are skipped if their inputs are unchanged
+        """
+        if not self.use_versioning:
             # Single spec mode
-            info = self.parser.get_info()
-            servers = self.parser.get_servers()
-            endpoints = self.parser.get_endpoints()
-            tags = self.parser.get_tags()
-            versions = []
-            default_version_label = None
+            self._write_index(target, "index.html", manifest)
+            return
+
+        # Multi-version mode
+        versions = self.version_manager.get_version_list()
+        labels = {v['version']: v['label'] for v in versions}
+        # Label of the version the target's changelog compares against
+        changelog_since = next(
+            (labels[older] for older, version in self._changelog_pairs() if version == target.version),
+            None,
+        )
+
+        self._write_index(target, target.output_name("index.html"), manifest, versions=versions,
+                          changelog_since=changelog_since)
+        if target.version == self.version_manager.default_version:
+            self._write_index(
+                target, "index.html", manifest, versions=versions,
+                base_path="", page_prefix=f"{target.subdir}/",
+                changelog_since=changelog_since,
+            )
+
+    def _write_index(self, target: BuildTarget, output_name: str,
+                     manifest: Optional[BuildManifest] = None,
+                     versions: Optional[List[Dict[str, Any]]] = None,
+                     base_path: Optional[str] = None, page_prefix: str = "",
+                     changelog_since: Optional[str] = None) -> None:
+        """
+        Render one index page.
+
+        Args:
+            target: Build target whose endpoints are listed
+            output_name: Output path relative to the output directory
+            manifest: Optional build manifest; the page is skipped if its inputs are unchanged
+            versions: Version list for the version switcher (empty without versioning)
+            base_path: Relative prefix to shared assets (defaults to the target's)
+            page_prefix: Relative prefix from the page to the target's endpoint pages
+            changelog_since: Label of the version the target's changelog page
+                compares against (None without a changelog)
+        """
+        versions = versions or []
+        base_path = target.base_path if base_path is None else base_path
+        info = target.info
+        servers = target.parser.get_servers()
+        endpoints = target.parser.get_endpoint_summaries()
+        tags = target.parser.get_tags()
+        default_version_label = next((v['label'] for v in versions if v['is_default']), None)
+        current_version_label = next(
+            (v['label'] for v in versions if v['version'] == target.version), None
+        )
+
+        # Endpoint fields shown in the sidebar and overview
+        listing = [self._search_entry(endpoint) for endpoint in endpoints]
+
+        if manifest is not None:
+            digest = content_hash(
+                self._template_hash("api_index.html"),
+                info, servers, tags, listing, versions, default_version_label,
+                target.version, base_path, page_prefix, changelog_since,
+                self.use_versioning, self._build_settings(),
+            )
+            if manifest.is_fresh(output_name, digest):
+                return
 
         # Group endpoints by tag
         endpoints_by_tag = self._group_endpoints_by_tag(endpoints, tags)
 
+        template = self.jinja_env.get_template("api_index.html")
         html = template.render(
             info=info,
             servers=servers,
@@ -159,62 +854,415 @@ class OpenAPIDocGenerator:
             license_tier=self.license.get_tier().value,
             show_branding=self._should_show_branding(),
             selected_theme=self.get_selected_theme(),
+            offline_assets=self.offline_assets,
+            server_highlighting=self.server_highlighting,
             config=self.config,
-            versions=versions if self.use_versioning else [],
+            versions=versions,
             default_version_label=default_version_label,
+            current_version=target.version,
+            current_version_label=current_version_label,
             has_versioning=self.use_versioning,
+            base_path=base_path,
+            page_prefix=page_prefix,
+            changelog_since=changelog_since,
         )
 
-        output_path = self.output_dir / "index.html"
-        output_path.write_text(html, encoding="utf-8")
+        output_path = self.output_dir / output_name
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_page(output_path, html, "index.page")
+
+    def _changelog_pairs(self) -> List[Tuple[str, str]]:
+        """(previous version, version) for every version with a changelog page."""
+        versions_sorted = sorted(self.version_manager.versions.keys())
+        return list(zip(versions_sorted, versions_sorted[1:]))
+
+    def _generate_changelog(self, older: str, version: str,
+                            manifest: Optional[BuildManifest] = None) -> None:
+        """
+        Write the changelog page of a version, listing what changed since the previous one.
+
+        The page goes to <version>/changelog.html. Versions are compared by
+        the version manager's structural diff, which only parses operations
+        whose content differs between the two versions.
+
+        Args:
+            older: Version the changelog compares against
+            version: Version whose changelog is written
+            manifest: Optional build manifest; an unchanged page is not rewritten
+        """
+        versions = self.version_manager.get_version_list()
+        labels = {v['version']: v['label'] for v in versions}
+
+        diff = self.version_manager.diff_versions(older, version)
+        target = self._build_target(version)
+        output_name = target.output_name("changelog.html")
+
+        if manifest is not None:
+            digest = content_hash(
+                self._template_hash("api_changelog.html"),
+                target.info, diff.to_dict(),
+                [[self._search_entry(endpoint) for endpoint in diff.added],
+                 [self._search_entry(endpoint) for endpoint in diff.removed],
+                 [self._search_entry(operation.summary) for operation in diff.changed]],
+                versions, self._build_settings(),
+            )
+            if manifest.is_fresh(output_name, digest):
+                return
 
-    def _generate_endpoint_pages(self) -> None:
-        """Generate individual pages for each endpoint."""
+        template = self.jinja_env.get_template("api_changelog.html")
+        html = template.render(
+            info=target.info,
+            diff=diff,
+            license_tier=self.license.get_tier().value,
+            show_branding=self._should_show_branding(),
+            selected_theme=self.get_selected_theme(),
+            offline_assets=self.offline_assets,
+            config=self.config,
+            versions=versions,
+            default_version_label=next((v['label'] for v in versions if v['is_default']), None),
+            current_version=version,
+            current_version_label=labels[version],
+            previous_version_label=labels[older],
+            base_path=target.base_path,
+        )
+        self._write_page(self.output_dir / output_name, html, "changelog.page")
+
+        print(f"✓ Changelog {labels[older]} → {labels[version]}: {len(diff.added)} added, "
+              f"{len(diff.removed)} removed, {len(diff.changed)} changed")
+
+    @staticmethod
+    def _search_entry(endpoint: EndpointSummary) -> Dict[str, Any]:
+        """Fields of an endpoint used by client-side search."""
+        return {
+            "method": endpoint.method,
+            "path": endpoint.path,
+            "summary": endpoint.summary,
+            "description": endpoint.description,
+            "tags": list(endpoint.tags),
+            "filename": endpoint.filename,
+        }
+
+    def _search_prefix_length(self) -> int:
+        """Get the token prefix length the search index is sharded by (0 = one shard)."""
+        prefix_length = self.config.get('search.prefix_length', 1)
+        if isinstance(prefix_length, int) and 0 <= prefix_length <= 3:
+            return prefix_length
+
+        print(f"⚠️  Invalid search.prefix_length '{prefix_length}', using 1")
+        return 1
+
+    def _generate_search_index(self, target: BuildTarget,
+                               manifest: Optional[BuildManifest] = None) -> None:
+        """
+        Write the prebuilt search index of a target to search/ next to its pages.
+
+        Args:
+            target: Build target whose endpoints are indexed
+            manifest: Optional build manifest; unchanged files are not rewritten
+        """
+        entries = [self._search_entry(endpoint) for endpoint in target.parser.get_endpoint_summaries()]
+        search_dir = self.output_dir / target.subdir / "search"
+        search_dir.mkdir(parents=True, exist_ok=True)
+
+        for name, source in search_index_files(entries, self._search_prefix_length()):
+            output_name = target.output_name(f"search/{name}")
+            if manifest is not None and manifest.is_fresh(output_name, content_hash(source)):
+                continue
+            (search_dir / name).write_text(source, encoding="utf-8")
+
+    def _generate_endpoint_pages(self, target: BuildTarget, manifest: Optional[BuildManifest] = None,
+                                 produced: Optional[Dict[str, str]] = None) -> None:
+        """
+        Generate individual pages for each endpoint of a build target.
+
+        Pages are produced by a streaming pipeline: operations are taken
+        from the spec one at a time, unchanged ones are skipped before
+        being parsed, and each remaining operation is parsed, rendered and
+        written before the next one is touched, so memory stays bounded
+        regardless of spec size.
+
+        With jobs > 1, small shards of operations are handed to a process
+        pool with a bounded number of shards in flight. The workers receive
+        only this target's spec. Every page depends only on its own
+        operation and the shared spec data, so the output is identical to
+        the serial path.
+
+        An operation whose page would be byte-identical to one already
+        produced (e.g. for an earlier version) is not rendered again; the
+        existing page is copied once rendering has finished.
+
+        Args:
+            target: Build target to render
+            manifest: Optional build manifest; pages with unchanged inputs are skipped
+            produced: Pages written earlier in this build by content digest,
+                updated with this target's pages
+        """
+        produced = {} if produced is None else produced
+        copies: List[Tuple[str, str]] = []
+        pending = self._pending_operations(target, manifest, produced, copies)
+        total = len(target.parser.get_endpoint_summaries())
+
+        pool = None
+        if self.jobs > 1 and total >= 2:
+            try:
+                pool = ProcessPoolExecutor(
+                    max_workers=self.jobs,
+                    initializer=_init_render_worker,
+                    initargs=(self, target),
+                )
+            except (OSError, NotImplementedError) as e:
+                # Platforms without working process pools (e.g. no sem_open)
+                print(f"⚠️  Parallel rendering unavailable ({e}), rendering serially")
+
+        if pool is None:
+            self._write_endpoint_pages(target, pending)
+        else:
+            # A few shards per worker keeps the pool busy when page sizes vary
+            shard_size = max(1, min(self.MAX_SHARD_SIZE, total // (self.jobs * 4)))
+
+            with pool:
+                in_flight = set()
+                for shard in iter(lambda: tuple(islice(pending, shard_size)), ()):
+                    if len(in_flight) >= self.jobs * 2:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            self.profiler.merge(future.result())
+                    in_flight.add(pool.submit(_render_endpoint_chunk, shard))
+
+                for future in in_flight:
+                    self.profiler.merge(future.result())
+
+        with self.profiler.phase("endpoint.copy", items=len(copies)):
+            for source, destination in copies:
+                shutil.copyfile(self.output_dir / source, self.output_dir / destination)
+        if copies:
+            print(f"✓ Reused {len(copies)} identical page(s) across versions")
+
+    def _pending_operations(self, target: BuildTarget, manifest: Optional[BuildManifest],
+                            produced: Dict[str, str],
+                            copies: List[Tuple[str, str]]) -> Iterator[Tuple[str, str]]:
+        """
+        Yield (path, method) for every endpoint page of a target that must be rendered.
+
+        Pages whose inputs are unchanged since the last build are skipped.
+        Pages identical to one in produced (rendered or kept earlier in this
+        build) are appended to copies as (source, destination) output names
+        instead.
+        """
+        summaries = target.parser.get_endpoint_summaries()
+        shared = self._endpoint_pages_hash(target, summaries)
+        if target.subdir:
+            (self.output_dir / target.subdir).mkdir(parents=True, exist_ok=True)
+
+        for summary in summaries:
+            output_name = target.output_name(summary.filename)
+            digest = content_hash(
+                shared, target.parser.operation_digest(summary.path, summary.method)
+            )
+            if manifest is not None and manifest.is_fresh(output_name, digest):
+                produced.setdefault(digest, output_name)
+                continue
+            if digest in produced:
+                copies.append((produced[digest], output_name))
+                continue
+
+            produced[digest] = output_name
+            yield summary.path, summary.method
+
+    def _endpoint_pages_hash(self, target: BuildTarget,
+                             endpoints: Sequence[EndpointSummary]) -> str:
+        """
+        Hash the inputs shared by every endpoint page of a target.
+
+        Only the info fields the template reads are included, so versions
+        that differ in e.g. info.version still produce identical pages.
+        """
+        if self._navigation_mode() == 'shared':
+            # The sidebar lives in js/endpoint-nav.js, so pages don't depend on it
+            navigation = None
+        else:
+            navigation = (
+                self._template_hash("endpoint_nav.html"),
+                [(endpoint.operation_key, endpoint.filename) for endpoint in endpoints],
+            )
+
+        info_fields = self._template_fields("api_endpoint.html", "info")
+        info = target.info if info_fields is None else {
+            field: target.info.get(field) for field in sorted(info_fields)
+        }
+
+        return content_hash(
+            self._template_hash("api_endpoint.html"),
+            info,
+            target.parser.get_servers(),
+            navigation,
+            target.base_path,
+            self._build_settings(),
+        )
+
+    def _navigation_mode(self) -> str:
+        """
+        Get how the endpoint sidebar is delivered.
+
+        Returns:
+            'inline' to embed the pre-rendered sidebar in every page, or
+            'shared' to load it from a single js/endpoint-nav.js file
+        """
+        mode = self.config.get('navigation.mode', 'inline')
+        if mode in ('inline', 'shared'):
+            return mode
+
+        print(f"⚠️  Unknown navigation mode '{mode}', using inline")
+        return 'inline'
+
+    def _render_endpoint_nav(self, endpoints: Sequence[EndpointSummary]) -> str:
+        """Render the sidebar links for all endpoints once per build."""
+        template = self.jinja_env.get_template("endpoint_nav.html")
+        return template.render(endpoints=endpoints)
+
+    @staticmethod
+    def _mark_active_nav_link(nav_html: str, endpoint: Endpoint) -> Markup:
+        """Highlight the current endpoint in pre-rendered sidebar HTML."""
+        link = f'<a href="{escape(endpoint.filename)}" class="endpoint-link"'
+        return Markup(nav_html.replace(link, f'{link} {NAV_ACTIVE_ATTRS}', 1))
+
+    def _generate_shared_nav(self, target: BuildTarget,
+                             manifest: Optional[BuildManifest] = None) -> None:
+        """
+        Write js/endpoint-nav.js next to a target's pages; it builds the sidebar on every endpoint page.
+
+        Keeps output size and render time linear in the number of endpoints,
+        since pages no longer embed a link to every other endpoint.
+        """
+        nav_entries = [
+            [endpoint.method, endpoint.path, endpoint.filename]
+            for endpoint in target.parser.get_endpoint_summaries()
+        ]
+        filename = target.output_name("js/endpoint-nav.js")
+
+        if manifest is not None:
+            digest = content_hash(self._template_hash("endpoint_nav.js"), nav_entries)
+            if manifest.is_fresh(filename, digest):
+                return
+
+        template = self.jinja_env.get_template("endpoint_nav.js")
+        output_path = self.output_dir / filename
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_path.write_text(template.render(nav_entries=nav_entries), encoding="utf-8")
+
+    def _endpoint_page_context(self, target: BuildTarget) -> Dict[str, Any]:
+        """Template values shared by every endpoint page of a target, computed once per build."""
+        summaries = target.parser.get_endpoint_summaries()
+        shared_nav = self._navigation_mode() == 'shared'
+
+        return {
+            "info": target.info,
+            "servers": target.parser.get_servers(),
+            "endpoints": summaries,
+            "shared_nav": shared_nav,
+            "nav_html": "" if shared_nav else self._render_endpoint_nav(summaries),
+            "license_tier": self.license.get_tier().value,
+            "show_branding": self._should_show_branding(),
+            "selected_theme": self.get_selected_theme(),
+            "offline_assets": self.offline_assets,
+            "server_highlighting": self.server_highlighting,
+            "code_languages": self.code_languages,
+            # Response examples are JSON
+            "prism_components": list(dict.fromkeys(
+                [language.syntax for language in self.code_languages] + ["json"]
+            )),
+            # Shared by the target's pages, so each schema is synthesized once
+            "example_generator": ExampleGenerator(target.parser.resolve),
+        }
+
+    def _write_endpoint_pages(self, target: BuildTarget, operations: Iterable[Tuple[str, str]],
+                              context: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Parse, render and write the pages for the given operations one at a time.
+
+        Args:
+            target: Build target the operations belong to
+            operations: (path, method) pairs, consumed lazily
+            context: Shared page context (computed if omitted)
+
+        Returns:
+            Number of pages written
+        """
         template = self.jinja_env.get_template("api_endpoint.html")
+        context = context or self._endpoint_page_context(target)
+        shared_nav = context["shared_nav"]
+        output_dir = self.output_dir / target.subdir
+        count = 0
 
-        endpoints = self.parser.get_endpoints()
-        info = self.parser.get_info()
+        for path, method in operations:
+            endpoint = target.parser.parse_endpoint(path, method)
 
-        for endpoint in endpoints:
             # Create a safe filename from method and path
             filename = self._endpoint_to_filename(endpoint)
 
-            # Generate code examples
-            code_examples = self._generate_code_examples(endpoint)
-
-            html = template.render(
-                endpoint=endpoint,
-                info=info,
-                code_examples=code_examples,
-                endpoints=endpoints,  # For sidebar navigation
-                license_tier=self.license.get_tier().value,
-                show_branding=self._should_show_branding(),
-                selected_theme=self.get_selected_theme(),
-                config=self.config,
+            examples = context["example_generator"]
+            with self.profiler.phase("examples", items=1):
+                body = self._request_example(endpoint, examples)
+                response_examples = self._response_examples(endpoint, examples)
+            code_examples = self._code_examples(
+                endpoint, context["servers"], body, context["server_highlighting"],
+                target.parser.operation_digest(path, method),
             )
+            if context["server_highlighting"]:
+                with self.profiler.phase("code_examples.highlight", items=len(response_examples)):
+                    response_examples = {
+                        status: Markup(highlighting.highlight(code, "json"))
+                        for status, code in response_examples.items()
+                    }
+
+            with self.profiler.phase("endpoint.render", items=1):
+                html = template.render(
+                    endpoint=endpoint,
+                    info=context["info"],
+                    code_examples=code_examples,
+                    response_examples=response_examples,
+                    endpoints=context["endpoints"],
+                    endpoint_nav=(
+                        Markup("") if shared_nav
+                        else self._mark_active_nav_link(context["nav_html"], endpoint)
+                    ),
+                    shared_nav=shared_nav,
+                    license_tier=context["license_tier"],
+                    show_branding=context["show_branding"],
+                    selected_theme=context["selected_theme"],
+                    offline_assets=context["offline_assets"],
+                    server_highlighting=context["server_highlighting"],
+                    code_languages=context["code_languages"],
+                    prism_components=context["prism_components"],
+                    config=self.config,
+                    base_path=target.base_path,
+                )
+
+            self._write_page(output_dir / filename, html, "endpoint.write")
+            count += 1
+
+        return count
 
-            output_path = self.output_dir / filename
+    def _write_page(self, output_path: Path, html: str, phase_name: str) -> None:
+        """Write a rendered page, recording its size when profiling."""
+        with self.profiler.phase(phase_name, items=1) as phase:
             output_path.write_text(html, encoding="utf-8")
+            if self.profiler.enabled:
+                phase.bytes = output_path.stat().st_size
 
-    def _endpoint_to_filename(self, endpoint: Dict[str, Any]) -> str:
+    def _endpoint_to_filename(self, endpoint: Endpoint) -> str:
         """
         Convert endpoint to a safe filename.
 
-        Example: GET /pets/{petId} -> get_pets_petid.html
+        Example: GET /pets/{petId} -> get_pets_petId.html
         """
-        method = endpoint["method"].lower()
-        path = endpoint["path"]
-
-        # Remove leading slash and replace special chars
-        safe_path = path.lstrip("/").replace("/", "_").replace("{", "").replace("}", "")
-
-        return f"{method}_{safe_path}.html"
+        return endpoint.filename
 
     def _group_endpoints_by_tag(
-        self, endpoints: List[Dict[str, Any]], tags: List[Dict[str, Any]]
-    ) -> Dict[str, List[Dict[str, Any]]]:
+        self, endpoints: Sequence[EndpointSummary], tags: List[Dict[str, Any]]
+    ) -> Dict[str, List[EndpointSummary]]:
         """Group endpoints by their tags."""
-        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        grouped: Dict[str, List[EndpointSummary]] = {}
 
         # Initialize with defined tags
         for tag in tags:
@@ -225,7 +1273,7 @@ class OpenAPIDocGenerator:
 
         # Group endpoints
         for endpoint in endpoints:
-            endpoint_tags = endpoint.get("tags", [])
+            endpoint_tags = endpoint.tags
 
             if not endpoint_tags:
                 grouped["Untagged"].append(endpoint)
@@ -238,124 +1286,92 @@ class OpenAPIDocGenerator:
         # Remove empty groups
         return {k: v for k, v in grouped.items() if v}
 
-    def _generate_code_examples(self, endpoint: Dict[str, Any]) -> Dict[str, str]:
+    @staticmethod
+    def _request_example(endpoint: Endpoint, examples: ExampleGenerator) -> Any:
+        """Example request body of an endpoint (None without a JSON body)."""
+        if not endpoint.request_body:
+            return None
+        return examples.media_example(endpoint.request_body.get("content"), writing=True)
+
+    @staticmethod
+    def _response_examples(endpoint: Endpoint, examples: ExampleGenerator) -> Dict[str, str]:
         """
-        Generate code examples for different languages.
+        Example JSON payload of each response that has a JSON body.
 
         Returns:
-            Dictionary mapping language to code example
+            Dictionary mapping status code to pretty-printed JSON
         """
-        examples = {}
-
-        # Generate curl example
-        examples["curl"] = self._generate_curl_example(endpoint)
-
-        # Generate Python example
-        examples["python"] = self._generate_python_example(endpoint)
+        payloads = {}
+        for response in endpoint.responses:
+            if media_json_schema(response.get("content"))[0] is None:
+                continue
+            payloads[str(response["status_code"])] = json.dumps(
+                examples.media_example(response.get("content")), indent=2
+            )
+        return payloads
 
-        # Generate JavaScript example
-        examples["javascript"] = self._generate_javascript_example(endpoint)
+    def _code_examples(self, endpoint: Endpoint, servers: List[Dict[str, Any]],
+                       body: Any, highlight: bool, digest: Optional[str] = None) -> Dict[str, str]:
+        """
+        Code examples of an endpoint, reusing earlier results for identical inputs.
 
-        return examples
+        Examples are kept in memory for this process and, given the
+        operation digest, in the on-disk cache shared by later builds and
+        the render workers.
 
-    def _generate_curl_example(self, endpoint: Dict[str, Any]) -> str:
-        """Generate curl command example."""
-        method = endpoint["method"]
-        path = endpoint["path"]
-        servers = self.parser.get_servers()
-        base_url = servers[0]["url"] if servers else "https://api.example.com"
-
-        # Replace path parameters with example values
-        example_path = path
-        for param in endpoint["parameters"]:
-            if param["in"] == "path":
-                example_value = param.get("example", f"<{param['name']}>")
-                example_path = example_path.replace(
-                    f"{{{param['name']}}}", str(example_value)
-                )
+        Args:
+            endpoint: Endpoint to document
+            servers: Servers of the spec the endpoint belongs to
+            body: Example request body (None to send {})
+            highlight: Highlight the examples at build time
+            digest: Operation digest of the endpoint (see OpenAPIParser.operation_digest)
 
-        curl = f"curl -X {method} \\\n  '{base_url}{example_path}'"
-
-        # Add query parameters
-        query_params = [p for p in endpoint["parameters"] if p["in"] == "query"]
-        if query_params:
-            curl += " \\\n  -G"
-            for param in query_params:
-                example_value = param.get("example", f"<{param['name']}>")
-                curl += f" \\\n  --data-urlencode '{param['name']}={example_value}'"
-
-        # Add request body if present
-        if endpoint["request_body"]:
-            curl += " \\\n  -H 'Content-Type: application/json' \\\n  -d '{}'"
-
-        return curl
-
-    def _generate_python_example(self, endpoint: Dict[str, Any]) -> str:
-        """Generate Python requests example."""
-        method = endpoint["method"].lower()
-        path = endpoint["path"]
-        servers = self.parser.get_servers()
-        base_url = servers[0]["url"] if servers else "https://api.example.com"
-
-        # Replace path parameters
-        example_path = path
-        for param in endpoint["parameters"]:
-            if param["in"] == "path":
-                example_value = param.get("example", f"<{param['name']}>")
-                example_path = example_path.replace(
-                    f"{{{param['name']}}}", str(example_value)
+        Returns:
+            Dictionary mapping language to code example (HTML when highlighted)
+        """
+        languages = [language.key for language in self.code_languages]
+        with self.profiler.phase("code_examples", items=1):
+            example_context = build_context(endpoint, servers, body)
+            key = (example_context.cache_key(), highlight)
+            examples = self._code_example_memo.get(key)
+            if examples is not None:
+                self._code_example_memo.move_to_end(key)
+                return examples
+
+            cache_key = None
+            if digest is not None and self.code_example_cache is not None:
+                cache_key = self.code_example_cache.key(
+                    digest, ",".join(languages), json.dumps(servers, sort_keys=True),
+                    json.dumps(body, sort_keys=True),
+                    f"highlight:{highlighting.version()}" if highlight else "",
                 )
-
-        code = f"import requests\n\n"
-        code += f"url = '{base_url}{example_path}'\n"
-
-        # Add query parameters
-        query_params = [p for p in endpoint["parameters"] if p["in"] == "query"]
-        if query_params:
-            code += "params = {\n"
-            for param in query_params:
-                example_value = param.get("example", f"<{param['name']}>")
-                code += f"    '{param['name']}': '{example_value}',\n"
-            code += "}\n\n"
-            code += f"response = requests.{method}(url, params=params)\n"
+                examples = self.code_example_cache.load(cache_key)
+            cached = examples is not None
+            if not cached:
+                examples = generate_examples(example_context, languages)
+
+        if cached:
+            if highlight:
+                examples = {language: Markup(code) for language, code in examples.items()}
         else:
-            code += f"\nresponse = requests.{method}(url)\n"
-
-        code += "print(response.json())"
-
-        return code
-
-    def _generate_javascript_example(self, endpoint: Dict[str, Any]) -> str:
-        """Generate JavaScript fetch example."""
-        method = endpoint["method"]
-        path = endpoint["path"]
-        servers = self.parser.get_servers()
-        base_url = servers[0]["url"] if servers else "https://api.example.com"
-
-        # Replace path parameters
-        example_path = path
-        for param in endpoint["parameters"]:
-            if param["in"] == "path":
-                example_value = param.get("example", f"<{param['name']}>")
-                example_path = example_path.replace(
-                    f"{{{param['name']}}}", str(example_value)
-                )
-
-        code = f"const url = '{base_url}{example_path}';\n\n"
-        code += f"fetch(url, {{\n"
-        code += f"  method: '{method}',\n"
-
-        if endpoint["request_body"]:
-            code += "  headers: {\n"
-            code += "    'Content-Type': 'application/json',\n"
-            code += "  },\n"
-            code += "  body: JSON.stringify({}),\n"
-
-        code += "})\n"
-        code += "  .then(response => response.json())\n"
-        code += "  .then(data => console.log(data));"
+            if highlight:
+                with self.profiler.phase("code_examples.highlight", items=1):
+                    examples = self._highlight_code_examples(examples)
+            if cache_key is not None:
+                self.code_example_cache.store(cache_key, examples)
+
+        self._code_example_memo[key] = examples
+        if len(self._code_example_memo) > CODE_EXAMPLE_CACHE_SIZE:
+            self._code_example_memo.popitem(last=False)
+        return examples
 
-        return code
+    def _highlight_code_examples(self, code_examples: Dict[str, str]) -> Dict[str, Markup]:
+        """Highlight code examples as HTML (identical snippets are highlighted once per process)."""
+        syntaxes = {language.key: language.syntax for language in self.code_languages}
+        return {
+            language: Markup(highlighting.highlight(code, syntaxes[language]))
+            for language, code in code_examples.items()
+        }
 
     def _should_show_branding(self) -> bool:
         """
@@ -371,7 +1387,7 @@ class OpenAPIDocGenerator:
         # Free tier always shows branding
         return True
 
-    def _copy_theme_files(self, static_path: Path) -> None:
+    def _copy_theme_files(self, static_path: Path, copier: AssetCopier) -> None:
         """
         Copy premium theme files to output directory.
 
@@ -381,12 +1397,9 @@ class OpenAPIDocGenerator:
         if not themes_src.exists():
             return
 
-        themes_dest = self.output_dir / "themes"
-        themes_dest.mkdir(exist_ok=True)
-
         # Copy all theme files
-        for theme_file in themes_src.glob("*.css"):
-            shutil.copy2(theme_file, themes_dest / theme_file.name)
+        with self.profiler.phase("theme.copy") as phase:
+            self._copy_asset_dir(copier, themes_src, "themes", "*.css", phase)
 
         print(f"✓ Premium themes enabled ({len(list(themes_src.glob('*.css')))} themes available)")
 
@@ -425,13 +1438,87 @@ class OpenAPIDocGenerator:
             'features': self.features.get_available_features(),
         }
 
+    def _print_target(self) -> BuildTarget:
+        """Target exported to PDF: the single spec, or the default version."""
+        if self.use_versioning:
+            default = self.version_manager.get_default_version()
+            if default is not None:
+                return self._build_target(default.version)
+        return self._build_targets()[0]
+
+    def _render_print_chunks(self, target: BuildTarget, chunk_size: int) -> List[PDFChunk]:
+        """
+        Render the print documents the PDF is made from.
+
+        The first chunk holds the overview; the others hold up to chunk_size
+        endpoints of one tag each (endpoints are grouped by first tag). Endpoints are rendered straight
+        from the parsed model, flattened (every code example shown) and
+        without scripts, stylesheets or other external resources.
+        """
+        template = self.jinja_env.get_template("api_print.html")
+        servers = target.parser.get_servers()
+        examples = ExampleGenerator(target.parser.resolve)
+        render = functools.partial(
+            template.render, info=target.info, servers=servers, code_languages=self.code_languages,
+        )
+
+        summaries = target.parser.get_endpoint_summaries()
+        tag_order = {tag["name"]: i for i, tag in enumerate(target.parser.get_tags())}
+        first_tags = [summary.tags[0] if summary.tags else "Untagged" for summary in summaries]
+        for tag in first_tags:
+            tag_order.setdefault(tag, len(tag_order))
+        ordered = sorted(zip(first_tags, summaries), key=lambda item: tag_order[item[0]])
+
+        title = target.info.get("title", "API Documentation")
+        chunks = [PDFChunk(render(overview=True, groups=[]), (PDFSection(title, "overview"),))]
+        # Chunks never span tags, so an added or removed endpoint only
+        # changes the chunks of its own tag (see PDFFragmentCache)
+        for tag, items in groupby(ordered, key=lambda item: item[0]):
+            items = list(items)
+            for start in range(0, len(items), chunk_size):
+                entries = []
+                sections = []
+                for _, summary in items[start:start + chunk_size]:
+                    with self.profiler.phase("pdf.print_html", items=1):
+                        endpoint = target.parser.parse_endpoint(summary.path, summary.method)
+                        body = self._request_example(endpoint, examples)
+                        entries.append({
+                            "endpoint": endpoint,
+                            "anchor": Path(summary.filename).stem,
+                            "code_examples": self._code_examples(
+                                endpoint, servers, body, False,
+                                target.parser.operation_digest(summary.path, summary.method),
+                            ),
+                            "response_examples": self._response_examples(endpoint, examples),
+                        })
+                    label = f"{summary.method} {summary.path}"
+                    if summary.summary:
+                        label += f" — {summary.summary}"
+                    sections.append(PDFSection(label, entries[-1]["anchor"], tag))
+
+                group = {
+                    "name": tag,
+                    "anchor": f"group-{tag_order[tag]}",
+                    "start": start == 0,
+                    "entries": entries,
+                }
+                with self.profiler.phase("pdf.print_html"):
+                    chunks.append(PDFChunk(render(overview=False, groups=[group]), tuple(sections)))
+        return chunks
+
     def _export_to_pdf(self) -> None:
         """
         Export documentation to PDF (PRO feature).
         """
         try:
-            exporter = PDFExporter(self.output_dir)
-            pdf_path = exporter.export_to_pdf()
+            exporter = PDFExporter(self.output_dir, profiler=self.profiler)
+            target = self._print_target()
+            chunks = self._render_print_chunks(target, max(1, self.config.get('pdf.chunk_size', 20)))
+            pdf_path = exporter.export_documentation(
+                chunks, target.info.get("title", "API Documentation"),
+                workers=self.config.get('pdf.workers', 0),
+                cache=PDFFragmentCache() if self.config.get('pdf.cache', True) else None,
+            )
 
             if pdf_path:
                 print(f"\n✓ PDF export complete: {pdf_path}")
@@ -0,0 +1,97 @@
+"""
+Build-time syntax highlighting of code examples.
+
+Highlights code with Pygments, emitting the same "token <type>" classes
+Prism uses, so static/css/highlight.css (Prism's Tomorrow Night colors)
+styles them and pages need no highlighting script at all.
+
+Results are cached by (language, code): code examples of endpoints with
+the same shape are identical, so each distinct snippet is highlighted once.
+"""
+
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+
+from markupsafe import escape
+
+try:
+    from pygments import __version__ as PYGMENTS_VERSION
+    from pygments.lexers import get_lexer_by_name
+    from pygments.token import Token
+except ImportError:
+    get_lexer_by_name = None
+    PYGMENTS_VERSION = None
+
+# Pygments token type -> Prism token class; subtypes inherit their parent's class
+if get_lexer_by_name is not None:
+    PRISM_CLASSES = {
+        Token.Comment: "comment",
+        Token.Keyword: "keyword",
+        Token.Keyword.Constant: "boolean",
+        Token.Name.Builtin: "builtin",
+        Token.Name.Function: "function",
+        Token.Name.Class: "class-name",
+        Token.Name.Constant: "constant",
+        Token.Name.Variable: "variable",
+        Token.Name.Attribute: "attr-name",
+        Token.Name.Tag: "property",
+        Token.Literal.String: "string",
+        # Line continuations and escapes stay plain, as in Prism
+        Token.Literal.String.Escape: None,
+        Token.Literal.Number: "number",
+        Token.Operator: "operator",
+        Token.Operator.Word: "keyword",
+        Token.Punctuation: "punctuation",
+    }
+
+
+def is_available() -> bool:
+    """Whether Pygments is installed."""
+    return get_lexer_by_name is not None
+
+
+def version() -> str:
+    """Version of the highlighter, for cache keys of highlighted code ("" without Pygments)."""
+    return PYGMENTS_VERSION or ""
+
+
+@lru_cache(maxsize=None)
+def _lexer(language: str):
+    return get_lexer_by_name(language, stripnl=False, ensurenl=False)
+
+
+@lru_cache(maxsize=None)
+def _token_class(token_type: Any) -> Optional[str]:
+    """Prism class of a Pygments token type (None for plain text)."""
+    while token_type is not Token:
+        if token_type in PRISM_CLASSES:
+            return PRISM_CLASSES[token_type]
+        token_type = token_type.parent
+    return None
+
+
+@lru_cache(maxsize=4096)
+def highlight(code: str, language: str) -> str:
+    """
+    Highlight code as HTML with Prism-compatible token spans.
+
+    Args:
+        code: Source code
+        language: Pygments lexer name (e.g. "bash", "python", "javascript")
+
+    Returns:
+        Escaped HTML for use inside <code>
+    """
+    spans: List[Tuple[Optional[str], str]] = []
+    for token_type, text in _lexer(language).get_tokens(code):
+        css_class = _token_class(token_type)
+        if spans and spans[-1][0] == css_class:
+            # Merge runs of the same class into one span
+            spans[-1] = (css_class, spans[-1][1] + text)
+        else:
+            spans.append((css_class, text))
+
+    return "".join(
+        f'<span class="token {css_class}">{escape(text)}</span>' if css_class else str(escape(text))
+        for css_class, text in spans
+    )
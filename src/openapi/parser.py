@@ -1,7 +1,94 @@
 import yaml
 import json
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, Iterator, List, Any, NamedTuple, Optional, Tuple
+from openapi.spec_cache import SpecCache
+from openapi.resolver import RefResolver
+from openapi.build_manifest import content_hash
+from openapi.profiling import BuildProfiler
+
+try:
+    # libyaml-backed loader, much faster on large specs
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+HTTP_METHODS = ("get", "post", "put", "patch", "delete", "options", "head")
+
+
+def parse_document(raw: bytes, suffix: str) -> Any:
+    """Parse raw YAML or JSON document bytes based on the file suffix."""
+    if suffix == ".json":
+        return json.loads(raw)
+    return yaml.load(raw, Loader=SafeLoader)
+
+
+def load_document(path: Path) -> Any:
+    """Load a YAML or JSON document referenced from a spec."""
+    return parse_document(path.read_bytes(), path.suffix)
+
+
+def endpoint_filename(method: str, path: str) -> str:
+    """
+    Convert an operation to a safe page filename.
+
+    Example: GET /pets/{petId} -> get_pets_petId.html
+    """
+    # Remove leading slash and replace special chars
+    safe_path = path.lstrip("/").replace("/", "_").replace("{", "").replace("}", "")
+
+    return f"{method.lower()}_{safe_path}.html"
+
+
+class EndpointSummary(NamedTuple):
+    """
+    Lightweight, immutable record of an operation for navigation and the index.
+
+    Carries no parameters, request body or responses, so it can be built
+    for every operation without resolving any $ref.
+    """
+
+    path: str
+    method: str
+    operation_id: str
+    summary: str
+    description: str
+    tags: Tuple[str, ...]
+    deprecated: bool
+    operation_key: str
+    filename: str
+
+
+class Endpoint(NamedTuple):
+    """
+    Immutable record describing a single API operation.
+
+    Built once per spec load by OpenAPIParser and shared by every consumer,
+    so it must never be mutated. Use ``_replace`` to derive a variant.
+    """
+
+    path: str
+    method: str
+    operation_id: str
+    summary: str
+    description: str
+    parameters: Tuple[Dict[str, Any], ...]
+    request_body: Optional[Dict[str, Any]]
+    responses: Tuple[Dict[str, Any], ...]
+    tags: Tuple[str, ...]
+    deprecated: bool
+    operation_key: str
+    filename: str
+    api_version: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return a JSON-serializable copy of this endpoint."""
+        data = self._asdict()
+        data["parameters"] = list(self.parameters)
+        data["responses"] = list(self.responses)
+        data["tags"] = list(self.tags)
+        return data
 
 
 class OpenAPIParser:
@@ -10,37 +97,160 @@ class OpenAPIParser:
     and extracts structured data for documentation generation.
     """
 
-    def __init__(self, spec_path: str):
+    def __init__(self, spec_path: str, spec_cache: Optional[SpecCache] = None,
+                 profiler: Optional[BuildProfiler] = None):
         """
         Initialize parser with path to OpenAPI spec file.
 
         Args:
             spec_path: Path to OpenAPI YAML or JSON file
+            spec_cache: Optional on-disk cache of parsed specs
+            profiler: Optional build profiler timing spec load and endpoint parsing
         """
         self.spec_path = Path(spec_path)
         self.spec: Dict[str, Any] = {}
+        self.spec_cache = spec_cache
+        self.profiler = profiler or BuildProfiler(enabled=False)
+        # "hit" or "miss" when a spec cache is used, None otherwise
+        self.cache_status: Optional[str] = None
+        self._endpoints: Optional[Tuple[Endpoint, ...]] = None
+        self._summaries: Optional[Tuple[EndpointSummary, ...]] = None
+        self._resolver: Optional[RefResolver] = None
+        self._spec_signature: Optional[Tuple[int, int]] = None
         self._load_spec()
 
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop derived caches when sending the parser to a worker process."""
+        state = self.__dict__.copy()
+        state["_endpoints"] = None
+        state["_resolver"] = None
+        return state
+
     def _load_spec(self) -> None:
         """Load and parse the OpenAPI specification file."""
         if not self.spec_path.exists():
             raise FileNotFoundError(f"OpenAPI spec not found: {self.spec_path}")
 
-        with open(self.spec_path, "r", encoding="utf-8") as f:
-            if self.spec_path.suffix in [".yaml", ".yml"]:
-                self.spec = yaml.safe_load(f)
-            elif self.spec_path.suffix == ".json":
-                self.spec = json.load(f)
-            else:
-                raise ValueError(f"Unsupported file format: {self.spec_path.suffix}")
+        if self.spec_path.suffix not in [".yaml", ".yml", ".json"]:
+            raise ValueError(f"Unsupported file format: {self.spec_path.suffix}")
 
-        # Basic validation
+        with self.profiler.phase("spec.load", items=1) as phase:
+            self._spec_signature = self._stat_signature()
+            raw = self.spec_path.read_bytes()
+            phase.bytes = len(raw)
+
+            if self.spec_cache is not None:
+                digest = self.spec_cache.content_hash(raw)
+                cached = self.spec_cache.load(self.spec_path, self._spec_signature, digest)
+                if cached is not None:
+                    self.cache_status = "hit"
+                    self.spec = cached
+                    return
+                self.cache_status = "miss"
+
+            with self.profiler.phase("spec.parse", items=1):
+                self.spec = parse_document(raw, self.spec_path.suffix)
+            self._validate_spec()
+
+            if self.spec_cache is not None:
+                self.spec_cache.store(self.spec_path, self._spec_signature, digest, self.spec)
+
+    def _validate_spec(self) -> None:
+        """Basic validation of the loaded spec."""
         if "openapi" not in self.spec:
             raise ValueError("Invalid OpenAPI spec: missing 'openapi' field")
 
         if not self.spec["openapi"].startswith("3."):
             raise ValueError(f"Only OpenAPI 3.x is supported, got: {self.spec['openapi']}")
 
+    def _stat_signature(self) -> Tuple[int, int]:
+        """Return (mtime_ns, size) of the spec file, used to detect edits."""
+        stat = self.spec_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def is_stale(self) -> bool:
+        """
+        Check whether the spec file changed on disk since it was loaded.
+
+        Returns:
+            True if the file was modified or removed
+        """
+        try:
+            return self._stat_signature() != self._spec_signature
+        except FileNotFoundError:
+            return True
+
+    def invalidate(self) -> None:
+        """Drop the cached endpoint model and resolved refs so they are rebuilt on next access."""
+        self._endpoints = None
+        self._summaries = None
+        self._resolver = None
+
+    @property
+    def resolver(self) -> RefResolver:
+        """$ref resolver for this spec, created on first use."""
+        if self._resolver is None:
+            self._resolver = RefResolver(self.spec, self.spec_path, load_document)
+        return self._resolver
+
+    def resolve(self, node: Any) -> Any:
+        """
+        Get a resolved view of part of the spec.
+
+        Every $ref (local or into another file) is replaced by its target.
+        Shared components are resolved once and the views are shared, so
+        they must not be mutated.
+
+        Args:
+            node: Any part of the spec, e.g. a schema or parameter object
+
+        Returns:
+            Resolved view of the node
+        """
+        return self.resolver.resolve(node)
+
+    def endpoint_digest(self, endpoint: Endpoint) -> str:
+        """Hash everything an endpoint's documentation is built from."""
+        return self.operation_digest(endpoint.path, endpoint.method)
+
+    def operation_digest(self, path: str, method: str) -> str:
+        """
+        Hash everything an operation's documentation is built from.
+
+        Covers the path and method, the raw operation, its path-level
+        parameters and every component it references, directly or
+        transitively, so editing a shared schema changes the digest of
+        exactly the endpoints using it. Operations with identical bodies
+        under different paths or methods still get different digests.
+        Works on the raw spec, so the operation is never parsed.
+        """
+        method = method.lower()
+        path_item = self.get_paths().get(path, {})
+        sources = (path_item.get("parameters", []), path_item.get(method, {}))
+        resolver = self.resolver
+        dependencies = sorted(
+            (resolver.portable_key(key), resolver.target_digest(key))
+            for key in resolver.dependencies(sources)
+        )
+        return content_hash(path, method, sources, dependencies)
+
+    def reload(self) -> None:
+        """Re-read the spec file and drop every derived cache."""
+        self.invalidate()
+        self._load_spec()
+
+    def refresh(self) -> bool:
+        """
+        Reload the spec if the file changed on disk.
+
+        Returns:
+            True if the spec was reloaded
+        """
+        if not self.is_stale():
+            return False
+        self.reload()
+        return True
+
     def get_info(self) -> Dict[str, Any]:
         """
         Get API metadata (title, version, description, etc.)
@@ -68,45 +278,111 @@ class OpenAPIParser:
         """
         return self.spec.get("paths", {})
 
-    def get_endpoints(self) -> List[Dict[str, Any]]:
+    def iter_operations(self) -> Iterator[Tuple[str, str]]:
         """
-        Get all endpoints as a flat list with parsed details.
+        Yield (path, method) for every operation in spec order.
 
-        Returns:
-            List of endpoint objects with method, path, summary, etc.
+        Nothing is parsed or resolved, so this is cheap even on huge specs.
+        """
+        for path, path_item in self.get_paths().items():
+            for method in HTTP_METHODS:
+                if method in path_item:
+                    yield path, method
+
+    def get_endpoint_summaries(self) -> Tuple[EndpointSummary, ...]:
+        """
+        Get lightweight records for all endpoints (navigation, index, search).
+
+        Built without resolving parameters, request bodies or responses,
+        and cached until the spec is reloaded.
+        """
+        if self._summaries is None:
+            summaries = []
+            for path, method in self.iter_operations():
+                operation = self.get_paths()[path][method]
+                method_upper = method.upper()
+                summaries.append(EndpointSummary(
+                    path=path,
+                    method=method_upper,
+                    operation_id=operation.get("operationId", f"{method}_{path}"),
+                    summary=operation.get("summary", ""),
+                    description=operation.get("description", ""),
+                    tags=tuple(operation.get("tags", [])),
+                    deprecated=operation.get("deprecated", False),
+                    operation_key=f"{method_upper} {path}",
+                    filename=endpoint_filename(method, path),
+                ))
+            self._summaries = tuple(summaries)
+        return self._summaries
+
+    def parse_endpoint(self, path: str, method: str) -> Endpoint:
         """
-        endpoints = []
-        paths = self.get_paths()
+        Parse a single operation into an Endpoint record.
 
-        for path, path_item in paths.items():
-            # Common parameters for all operations in this path
-            common_params = path_item.get("parameters", [])
+        Args:
+            path: Path template, e.g. "/pets/{petId}"
+            method: HTTP method (any case)
 
-            for method in ["get", "post", "put", "patch", "delete", "options", "head"]:
-                if method not in path_item:
-                    continue
+        Returns:
+            The parsed endpoint
+        """
+        with self.profiler.phase("spec.parse_endpoint", items=1):
+            return self._parse_endpoint(path, method.lower())
+
+    def _parse_endpoint(self, path: str, method: str) -> Endpoint:
+        """Build the Endpoint record for a lowercase method (see parse_endpoint)."""
+        path_item = self.get_paths()[path]
+        operation = path_item[method]
+
+        # Merge common and operation-specific parameters
+        common_params = path_item.get("parameters", [])
+        params = self.resolve(common_params + operation.get("parameters", []))
+        method_upper = method.upper()
+
+        return Endpoint(
+            path=path,
+            method=method_upper,
+            operation_id=operation.get("operationId", f"{method}_{path}"),
+            summary=operation.get("summary", ""),
+            description=operation.get("description", ""),
+            parameters=tuple(self._parse_parameters(params)),
+            request_body=self._parse_request_body(self.resolve(operation.get("requestBody"))),
+            responses=tuple(self._parse_responses(self.resolve(operation.get("responses", {})))),
+            tags=tuple(operation.get("tags", [])),
+            deprecated=operation.get("deprecated", False),
+            operation_key=f"{method_upper} {path}",
+            filename=endpoint_filename(method, path),
+        )
+
+    def iter_endpoints(self) -> Iterator[Endpoint]:
+        """
+        Yield fully parsed endpoints one at a time.
 
-                operation = path_item[method]
+        Each operation is parsed only when the consumer asks for it and is
+        not retained afterwards, so memory stays bounded regardless of spec
+        size. If get_endpoints() already built the model, it is reused.
+        """
+        if self._endpoints is not None:
+            yield from self._endpoints
+            return
 
-                # Merge common and operation-specific parameters
-                params = common_params + operation.get("parameters", [])
+        for path, method in self.iter_operations():
+            yield self.parse_endpoint(path, method)
 
-                endpoint = {
-                    "path": path,
-                    "method": method.upper(),
-                    "operation_id": operation.get("operationId", f"{method}_{path}"),
-                    "summary": operation.get("summary", ""),
-                    "description": operation.get("description", ""),
-                    "parameters": self._parse_parameters(params),
-                    "request_body": self._parse_request_body(operation.get("requestBody")),
-                    "responses": self._parse_responses(operation.get("responses", {})),
-                    "tags": operation.get("tags", []),
-                    "deprecated": operation.get("deprecated", False),
-                }
+    def get_endpoints(self) -> Tuple[Endpoint, ...]:
+        """
+        Get all endpoints as a flat sequence with parsed details.
 
-                endpoints.append(endpoint)
+        The model is built on first access and cached until the spec is
+        reloaded or invalidate() is called, so repeated calls are free.
+        Prefer iter_endpoints() when a single pass is enough.
 
-        return endpoints
+        Returns:
+            Tuple of Endpoint records with method, path, summary, etc.
+        """
+        if self._endpoints is None:
+            self._endpoints = tuple(self.iter_endpoints())
+        return self._endpoints
 
     def _parse_parameters(self, params: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Parse parameter objects into simplified format."""
@@ -0,0 +1,164 @@
+"""
+On-disk cache of rendered PDF fragments.
+
+Laying out print documents with WeasyPrint is the slowest step of a build
+with --pdf. Each print chunk's rendered PDF (with its page count and the
+pages of its anchors) is stored under a key derived from the chunk's HTML
+and the print stylesheet, so later exports re-render only changed chunks
+and reassemble the PDF from cached fragments. When no fragment changed
+and the previous output is untouched, the export is skipped altogether.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import time
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Tuple
+
+# (PDF bytes, page count, page index of every anchor)
+Fragment = Tuple[bytes, int, Dict[str, int]]
+
+
+class PDFFragmentCache:
+    """
+    Stores rendered PDF fragments under ~/.apiflow/pdf-cache.
+
+    Fragments unused for MAX_AGE_DAYS are removed by prune().
+    """
+
+    CACHE_DIR = Path.home() / ".apiflow" / "pdf-cache"
+    FORMAT_VERSION = 1
+    MAX_AGE_DAYS = 30
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the fragment cache.
+
+        Args:
+            cache_dir: Optional cache directory (defaults to ~/.apiflow/pdf-cache)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else self.CACHE_DIR
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, *parts: str) -> str:
+        """
+        Cache key of a fragment.
+
+        Args:
+            parts: Everything the fragment is rendered from, e.g. its HTML,
+                the stylesheet and the renderer version
+        """
+        digest = hashlib.sha256()
+        for part in (str(self.FORMAT_VERSION),) + parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def _fragment_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.fragment"
+
+    def load(self, key: str) -> Optional[Fragment]:
+        """
+        Look up a rendered fragment.
+
+        Returns:
+            The cached fragment, or None on a miss
+        """
+        path = self._fragment_path(key)
+        try:
+            with open(path, "rb") as f:
+                header = pickle.load(f)
+                data = f.read()
+            # Mark as used, for prune()
+            os.utime(path)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            self.misses += 1
+            return None
+
+        if not isinstance(header, dict) or header.get("format") != self.FORMAT_VERSION:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return data, header["pages"], header["anchors"]
+
+    def store(self, key: str, fragment: Fragment) -> None:
+        """
+        Save a rendered fragment.
+
+        The entry is written to a temporary file and renamed into place so
+        concurrent builds never read a partially written entry.
+        """
+        data, pages, anchors = fragment
+        path = self._fragment_path(key)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump({"format": self.FORMAT_VERSION, "pages": pages, "anchors": anchors},
+                            f, pickle.HIGHEST_PROTOCOL)
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError:
+            # The cache is an optimization only; never fail a build over it
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def _output_record(self, output: Path) -> Path:
+        name = hashlib.sha256(str(output.resolve()).encode("utf-8")).hexdigest()
+        return self.cache_dir / "outputs" / f"{name}.json"
+
+    @staticmethod
+    def assembly_digest(keys: Sequence[str], *extra: str) -> str:
+        """Digest of everything an assembled PDF is made from."""
+        return hashlib.sha256("\0".join(list(keys) + list(extra)).encode("utf-8")).hexdigest()
+
+    def is_assembled(self, output: Path, digest: str) -> bool:
+        """Whether output is still the PDF assembled from the inputs with this digest."""
+        try:
+            record = json.loads(self._output_record(output).read_text(encoding="utf-8"))
+            stat = output.stat()
+        except (OSError, ValueError):
+            return False
+        return (record.get("digest") == digest and record.get("size") == stat.st_size
+                and record.get("mtime_ns") == stat.st_mtime_ns)
+
+    def record_assembled(self, output: Path, digest: str) -> None:
+        """Remember the inputs of a freshly written PDF."""
+        record = self._output_record(output)
+        try:
+            stat = output.stat()
+            record.parent.mkdir(parents=True, exist_ok=True)
+            record.write_text(json.dumps({
+                "digest": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+            }), encoding="utf-8")
+        except OSError:
+            pass
+
+    def prune(self) -> int:
+        """
+        Remove fragments unused for MAX_AGE_DAYS.
+
+        Returns:
+            Number of fragments removed
+        """
+        cutoff = time.time() - self.MAX_AGE_DAYS * 86400
+        removed = 0
+        try:
+            entries = list(self.cache_dir.glob("*.fragment"))
+        except OSError:
+            return 0
+        for path in entries:
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                pass
+        return removed
@@ -2,17 +2,258 @@
 PDF export functionality for API documentation.
 
 PRO feature: Export generated HTML documentation to PDF format.
+
+The full-documentation export takes lean print documents rendered by the
+generator (api_print.html: no scripts, no external resources), lays out
+chunks of them in a process pool and merges the results (with pypdf) into
+one PDF with a table of contents and bookmarks. Each worker compiles the
+print stylesheet once and reuses it for all its chunks.
 """
 
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from html import escape
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+import io
 import logging
+import os
+from openapi.pdf_cache import Fragment, PDFFragmentCache
+from openapi.profiling import BuildProfiler
+
+try:
+    from pypdf import PdfReader, PdfWriter
+except ImportError:
+    PdfReader = PdfWriter = None
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+PRINT_CSS = """
+@page {
+    size: A4;
+    margin: 2cm;
+}
+
+body {
+    font-family: Arial, sans-serif;
+    font-size: 10pt;
+    line-height: 1.4;
+}
+
+/* Hide interactive elements in PDF */
+.theme-toggle,
+.search-box,
+#searchResults,
+.apiflow-footer,
+button,
+input {
+    display: none !important;
+}
+
+/* Better print layout */
+.sidebar {
+    page-break-after: always;
+}
+
+.endpoint-card {
+    page-break-inside: avoid;
+    margin-bottom: 1em;
+}
+
+code {
+    background: #f5f5f5;
+    padding: 2px 4px;
+    border-radius: 3px;
+}
+
+.code-block {
+    background: #f5f5f5;
+    padding: 10px;
+    border-radius: 5px;
+    page-break-inside: avoid;
+}
+"""
+
+# Layout of the print documents (see api_print.html): system fonts only,
+# so rendering never waits on a download
+DOCUMENT_CSS = """
+@page {
+    size: A4;
+    margin: 2cm 1.8cm;
+}
+
+body {
+    font-family: Helvetica, Arial, sans-serif;
+    font-size: 9.5pt;
+    line-height: 1.4;
+    color: #1f2937;
+}
+
+h1 {
+    font-size: 18pt;
+}
+
+h1.group {
+    page-break-before: always;
+    border-bottom: 1px solid #d1d5db;
+    padding-bottom: 0.2em;
+}
+
+h2 {
+    font-size: 12pt;
+    margin: 1.6em 0 0.4em;
+    page-break-after: avoid;
+}
+
+h3 {
+    font-size: 10pt;
+    margin: 1em 0 0.3em;
+    page-break-after: avoid;
+}
+
+h4 {
+    font-size: 9pt;
+    margin: 0.6em 0 0.2em;
+    color: #4b5563;
+}
+
+code,
+pre {
+    font-family: "DejaVu Sans Mono", Menlo, Consolas, monospace;
+    font-size: 8pt;
+}
+
+pre {
+    background: #f5f5f5;
+    border: 1px solid #e5e7eb;
+    padding: 6px 8px;
+    white-space: pre-wrap;
+    page-break-inside: avoid;
+}
+
+table {
+    width: 100%;
+    border-collapse: collapse;
+    page-break-inside: avoid;
+}
+
+th,
+td {
+    border-bottom: 1px solid #e5e7eb;
+    padding: 3px 6px;
+    text-align: left;
+    vertical-align: top;
+}
+
+.method {
+    font-weight: bold;
+}
+
+.method-get { color: #059669; }
+.method-post { color: #2563eb; }
+.method-put { color: #d97706; }
+.method-patch { color: #7c3aed; }
+.method-delete { color: #dc2626; }
+
+.required,
+.deprecated {
+    font-size: 7.5pt;
+    color: #dc2626;
+}
+
+.example,
+.response {
+    page-break-inside: avoid;
+}
+"""
+
+TOC_CSS = """
+.toc h1 {
+    font-size: 18pt;
+    margin-bottom: 1em;
+}
+
+.toc ol {
+    list-style: none;
+    padding: 0;
+}
+
+.toc li {
+    display: flex;
+    margin: 0.2em 0;
+}
+
+.toc li.group {
+    font-weight: bold;
+    margin-top: 0.8em;
+}
+
+.toc .title {
+    flex: 1;
+}
+"""
+
+# Compiled stylesheets of this process, by name (see _stylesheet)
+_stylesheets: Dict[str, Any] = {}
+
+
+def _stylesheet(name: str) -> Any:
+    """Compiled WeasyPrint stylesheet, parsed once per process."""
+    if name not in _stylesheets:
+        from weasyprint import CSS
+        source = {"print": PRINT_CSS, "document": DOCUMENT_CSS, "toc": TOC_CSS}[name]
+        _stylesheets[name] = CSS(string=source)
+    return _stylesheets[name]
+
+
+def _print_stylesheet() -> Any:
+    return _stylesheet("print")
+
+
+class PDFSection(NamedTuple):
+    """A bookmarked part of the documentation (the overview or one endpoint)."""
+
+    title: str  # Table of contents and bookmark label
+    anchor: str  # id of the section's heading in its chunk
+    group: Optional[str] = None  # Heading the section is listed under (e.g. its tag)
+
+
+class PDFChunk(NamedTuple):
+    """A print document rendered on its own, then merged into the PDF."""
+
+    html: str
+    sections: Tuple[PDFSection, ...]
+
+
+def _layout(html: str, base_url: str) -> Any:
+    """Lay out a print document with the compiled print stylesheet."""
+    from weasyprint import HTML
+
+    return HTML(string=html, base_url=base_url).render(stylesheets=[_stylesheet("document")])
+
+
+def _anchor_pages(document: Any) -> Dict[str, int]:
+    """Page index of every anchor (element id) in a laid out document."""
+    pages: Dict[str, int] = {}
+    for index, page in enumerate(document.pages):
+        for anchor in page.anchors:
+            pages.setdefault(anchor, index)
+    return pages
+
+
+def _render_chunk(html: str, base_url: str) -> Fragment:
+    """
+    Render a print document into a PDF (runs in a worker process).
+
+    Returns:
+        (PDF bytes, page count, page index of every anchor)
+    """
+    document = _layout(html, base_url)
+    return document.write_pdf(), len(document.pages), _anchor_pages(document)
+
+
 class PDFExporter:
     """
     Exports HTML documentation to PDF format.
@@ -20,14 +261,227 @@ class PDFExporter:
     Requires PRO or BUSINESS license.
     """
 
-    def __init__(self, output_dir: Path):
+    def __init__(self, output_dir: Path, profiler: Optional[BuildProfiler] = None):
         """
         Initialize PDF exporter.
 
         Args:
             output_dir: Directory containing generated HTML docs
+            profiler: Optional build profiler
         """
         self.output_dir = Path(output_dir)
+        self.profiler = profiler or BuildProfiler(enabled=False)
+
+    @staticmethod
+    def _weasyprint_available() -> bool:
+        try:
+            # Import weasyprint here so it's only required when using PDF export
+            import weasyprint  # noqa: F401
+        except ImportError:
+            logger.error(
+                "weasyprint not installed. Install it with: pip install weasyprint"
+            )
+            print("\n⚠️  PDF export requires weasyprint.")
+            print("   Install it with: pip install weasyprint")
+            print("   Note: weasyprint requires system dependencies (see docs)")
+            return False
+        return True
+
+    def export_documentation(self, chunks: Sequence[PDFChunk], title: str,
+                             output_filename: str = "api-documentation.pdf",
+                             workers: int = 0,
+                             cache: Optional[PDFFragmentCache] = None) -> Optional[Path]:
+        """
+        Export print documents to one PDF.
+
+        Chunks are rendered by a process pool and merged with pypdf, behind
+        a generated table of contents, with one bookmark per section.
+        Without pypdf, chunks are laid out in this process and bookmarks
+        come from the document headings.
+
+        Args:
+            chunks: Print documents in document order (see api_print.html)
+            title: Document title
+            output_filename: Name of the PDF file to create
+            workers: Rendering processes (0 = all CPUs)
+            cache: Optional cache of rendered chunks; only changed chunks
+                are rendered again
+
+        Returns:
+            Path to generated PDF file, or None if export failed
+        """
+        if not chunks or not self._weasyprint_available():
+            return None
+
+        pdf_output = self.output_dir / output_filename
+        sections = sum(len(chunk.sections) for chunk in chunks)
+
+        keys: List[str] = []
+        digest = None
+        if cache is not None:
+            import weasyprint
+            renderer = f"weasyprint {weasyprint.__version__}"
+            keys = [cache.key(chunk.html, DOCUMENT_CSS, renderer) for chunk in chunks]
+            digest = cache.assembly_digest(
+                keys, title, TOC_CSS, repr([chunk.sections for chunk in chunks]),
+                "pypdf" if PdfWriter is not None else "weasyprint",
+            )
+            if cache.is_assembled(pdf_output, digest):
+                print(f"\n✓ PDF unchanged: {pdf_output}")
+                return pdf_output
+
+        print(f"\n📄 Generating PDF: {output_filename} ({sections} sections)")
+
+        try:
+            if PdfWriter is None:
+                print("   💡 Install pypdf to render in parallel: pip install pypdf")
+                self._export_in_process(chunks, title, pdf_output)
+            else:
+                workers = workers if workers > 0 else (os.cpu_count() or 1)
+                self._export_chunked(chunks, title, pdf_output, workers, cache, keys)
+
+            if cache is not None:
+                cache.record_assembled(pdf_output, digest)
+                cache.prune()
+            print(f"✓ PDF exported successfully: {pdf_output}")
+            return pdf_output
+
+        except Exception as e:
+            logger.error(f"PDF export failed: {e}")
+            print(f"\n⚠️  PDF export failed: {e}")
+            print("   Make sure weasyprint and its dependencies are installed.")
+            return None
+
+    @staticmethod
+    def _section_pages(chunks: Sequence[PDFChunk], page_counts: Sequence[int],
+                       anchors: Sequence[Dict[str, int]]) -> List[Tuple[PDFSection, int]]:
+        """First page (counted from the first chunk) of every section."""
+        pages = []
+        offset = 0
+        for chunk, count, chunk_anchors in zip(chunks, page_counts, anchors):
+            for section in chunk.sections:
+                pages.append((section, offset + chunk_anchors.get(section.anchor, 0)))
+            offset += count
+        return pages
+
+    def _export_chunked(self, chunks: Sequence[PDFChunk], title: str, pdf_output: Path,
+                        workers: int, cache: Optional[PDFFragmentCache] = None,
+                        keys: Sequence[str] = ()) -> None:
+        """Render changed chunks in parallel and merge all fragments with pypdf."""
+        results: List[Optional[Fragment]] = [None] * len(chunks)
+        if cache is not None:
+            with self.profiler.phase("pdf.cache", items=len(chunks)):
+                for i, key in enumerate(keys):
+                    results[i] = cache.load(key)
+        pending = [i for i, result in enumerate(results) if result is None]
+        base_url = str(self.output_dir)
+
+        with self.profiler.phase("pdf.render", items=len(pending)) as phase:
+            if workers > 1 and len(pending) > 1:
+                with ProcessPoolExecutor(max_workers=min(workers, len(pending))) as executor:
+                    futures = {executor.submit(_render_chunk, chunks[i].html, base_url): i for i in pending}
+                    for done, future in enumerate(as_completed(futures), 1):
+                        results[futures[future]] = future.result()
+                        self._progress(done, len(pending), "chunks")
+            else:
+                for done, i in enumerate(pending, 1):
+                    results[i] = _render_chunk(chunks[i].html, base_url)
+                    self._progress(done, len(pending), "chunks")
+            phase.bytes = sum(len(results[i][0]) for i in pending)
+
+        if cache is not None:
+            for i in pending:
+                cache.store(keys[i], results[i])
+            print(f"   {len(pending)} chunk(s) rendered, {len(chunks) - len(pending)} from cache")
+
+        with self.profiler.phase("pdf.merge", items=len(chunks)) as phase:
+            section_pages = self._section_pages(
+                chunks, [count for _, count, _ in results], [anchors for _, _, anchors in results]
+            )
+            toc_document, toc_pages = self._table_of_contents(section_pages, title)
+
+            writer = PdfWriter()
+            writer.append(PdfReader(io.BytesIO(toc_document.write_pdf())), import_outline=False)
+            for data, _, _ in results:
+                writer.append(PdfReader(io.BytesIO(data)), import_outline=False)
+
+            writer.add_outline_item("Contents", 0)
+            groups: Dict[str, Any] = {}
+            for section, page in section_pages:
+                parent = None
+                if section.group:
+                    if section.group not in groups:
+                        groups[section.group] = writer.add_outline_item(section.group, toc_pages + page)
+                    parent = groups[section.group]
+                writer.add_outline_item(section.title, toc_pages + page, parent=parent)
+            writer.add_metadata({"/Title": title})
+
+            tmp = pdf_output.with_name(f".{pdf_output.name}.{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                writer.write(f)
+            os.replace(tmp, pdf_output)
+            phase.bytes = pdf_output.stat().st_size
+
+    def _export_in_process(self, chunks: Sequence[PDFChunk], title: str, pdf_output: Path) -> None:
+        """Lay out every chunk here and write one document (no pypdf needed)."""
+        base_url = str(self.output_dir)
+        with self.profiler.phase("pdf.render", items=len(chunks)) as phase:
+            documents = []
+            for i, chunk in enumerate(chunks):
+                documents.append(_layout(chunk.html, base_url))
+                self._progress(i + 1, len(chunks), "chunks")
+
+            section_pages = self._section_pages(
+                chunks, [len(document.pages) for document in documents],
+                [_anchor_pages(document) for document in documents],
+            )
+            toc_document, _ = self._table_of_contents(section_pages, title)
+            pages = list(toc_document.pages)
+            for document in documents:
+                pages.extend(document.pages)
+            toc_document.copy(pages).write_pdf(str(pdf_output))
+            phase.bytes = pdf_output.stat().st_size
+
+    def _table_of_contents(self, section_pages: Sequence[Tuple[PDFSection, int]],
+                           title: str) -> Tuple[Any, int]:
+        """
+        Lay out the table of contents.
+
+        Args:
+            section_pages: (section, first page after the TOC) in document order
+            title: Document title
+
+        Returns:
+            (TOC document, its page count)
+        """
+        from weasyprint import HTML
+
+        toc_pages = 1
+        # Page numbers are known once the TOC's own length is; it settles after one relayout
+        for _ in range(3):
+            rows = []
+            group = None
+            for section, page in section_pages:
+                if section.group and section.group != group:
+                    group = section.group
+                    rows.append(f'<li class="group"><span class="title">{escape(group)}</span></li>')
+                rows.append(f'<li><span class="title">{escape(section.title)}</span>'
+                            f'<span class="page">{toc_pages + page + 1}</span></li>')
+            html = (f'<!DOCTYPE html><html><head><meta charset="utf-8"><title>{escape(title)}</title>'
+                    f'</head><body class="toc"><h1>Contents</h1><ol>{"".join(rows)}</ol></body></html>')
+
+            document = HTML(string=html, base_url=str(self.output_dir)).render(
+                stylesheets=[_stylesheet("document"), _stylesheet("toc")]
+            )
+            if len(document.pages) == toc_pages:
+                break
+            toc_pages = len(document.pages)
+        return document, toc_pages
+
+    @staticmethod
+    def _progress(done: int, total: int, unit: str) -> None:
+        """Show rendering progress on one line."""
+        print(f"\r   Rendered {done}/{total} {unit}", end="\n" if done == total else "", flush=True)
 
     def export_to_pdf(self, output_filename: str = "api-documentation.pdf") -> Optional[Path]:
         """
@@ -41,7 +495,7 @@ class PDFExporter:
         """
         try:
             # Import weasyprint here so it's only required when using PDF export
-            from weasyprint import HTML, CSS
+            from weasyprint import HTML
         except ImportError:
             logger.error(
                 "weasyprint not installed. Install it with: pip install weasyprint"
@@ -63,57 +517,16 @@ class PDFExporter:
             print("   This may take a minute...")
 
             # Load HTML
-            html = HTML(filename=str(index_html))
+            with self.profiler.phase("pdf.load", items=1):
+                html = HTML(filename=str(index_html))
 
             # Custom CSS for PDF (optional improvements)
-            pdf_css = CSS(string="""
-                @page {
-                    size: A4;
-                    margin: 2cm;
-                }
-
-                body {
-                    font-family: Arial, sans-serif;
-                    font-size: 10pt;
-                    line-height: 1.4;
-                }
-
-                /* Hide interactive elements in PDF */
-                .theme-toggle,
-                .search-box,
-                #searchResults,
-                .apiflow-footer,
-                button,
-                input {
-                    display: none !important;
-                }
-
-                /* Better print layout */
-                .sidebar {
-                    page-break-after: always;
-                }
-
-                .endpoint-card {
-                    page-break-inside: avoid;
-                    margin-bottom: 1em;
-                }
-
-                code {
-                    background: #f5f5f5;
-                    padding: 2px 4px;
-                    border-radius: 3px;
-                }
-
-                .code-block {
-                    background: #f5f5f5;
-                    padding: 10px;
-                    border-radius: 5px;
-                    page-break-inside: avoid;
-                }
-            """)
+            pdf_css = _print_stylesheet()
 
             # Generate PDF
-            html.write_pdf(str(pdf_output), stylesheets=[pdf_css])
+            with self.profiler.phase("pdf.render", items=1) as phase:
+                html.write_pdf(str(pdf_output), stylesheets=[pdf_css])
+                phase.bytes = pdf_output.stat().st_size
 
             print(f"✓ PDF exported successfully: {pdf_output}")
             return pdf_output
@@ -0,0 +1,305 @@
+"""
+Build profiling for documentation generation.
+
+A BuildProfiler records the wall time of named build phases (spec load,
+index, endpoint pages, asset copies, PDF export, ...) together with item
+counts, bytes read or written and the peak memory of the process. The
+results can be printed as a table or exported as JSON (for tracking
+regressions in CI) or in the Chrome trace event format (chrome://tracing,
+Perfetto).
+
+Profiling is off unless a profiler is created with enabled=True; a
+disabled profiler records nothing and costs one attribute check per phase.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:
+    # Not available on Windows; peak memory is then not reported
+    resource = None
+
+
+def peak_rss_kb(children: bool = False) -> Optional[int]:
+    """
+    Get the peak resident set size of this process (or its finished children) in KiB.
+
+    Returns:
+        Peak RSS in KiB, or None where the platform doesn't report it
+    """
+    if resource is None:
+        return None
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    # macOS reports bytes, Linux reports KiB
+    return peak // 1024 if os.uname().sysname == "Darwin" else peak
+
+
+class PhaseStats:
+    """Aggregated measurements of every run of one phase."""
+
+    __slots__ = ("calls", "seconds", "max_seconds", "items", "bytes", "peak_rss_kb")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.items = 0
+        self.bytes = 0
+        self.peak_rss_kb: Optional[int] = None
+
+    def add(self, calls: int, seconds: float, max_seconds: float, items: int,
+            written: int, rss: Optional[int]) -> None:
+        """Fold one or more runs into the totals."""
+        self.calls += calls
+        self.seconds += seconds
+        self.max_seconds = max(self.max_seconds, max_seconds)
+        self.items += items
+        self.bytes += written
+        if rss is not None:
+            self.peak_rss_kb = max(self.peak_rss_kb or 0, rss)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "calls": self.calls,
+            "total_seconds": round(self.seconds, 6),
+            "mean_seconds": round(self.seconds / self.calls, 6) if self.calls else 0.0,
+            "max_seconds": round(self.max_seconds, 6),
+            "items": self.items,
+            "bytes": self.bytes,
+            "peak_rss_kb": self.peak_rss_kb,
+        }
+
+
+class Phase:
+    """
+    One run of a phase, used as a context manager.
+
+    Callers add the work done inside the phase:
+
+        with profiler.phase("endpoint.page") as phase:
+            ...
+            phase.items += 1
+            phase.bytes += size
+    """
+
+    __slots__ = ("profiler", "name", "items", "bytes", "_wall", "_start")
+
+    def __init__(self, profiler: Optional["BuildProfiler"], name: str, items: int = 0):
+        self.profiler = profiler
+        self.name = name
+        self.items = items
+        self.bytes = 0
+
+    def __enter__(self) -> "Phase":
+        if self.profiler is not None:
+            self._wall = time.time()
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self.profiler is not None:
+            self.profiler._record(self, time.perf_counter() - self._start)
+
+
+class BuildProfiler:
+    """
+    Collects per-phase timings, counts, bytes and peak memory.
+
+    Phases may nest (e.g. endpoint.page inside endpoint.pages); times are
+    inclusive. Profilers are picklable, so render worker processes carry a
+    copy whose measurements are merged back with snapshot()/merge().
+    """
+
+    # Cap on recorded trace events; aggregates are always complete
+    MAX_TRACE_EVENTS = 200000
+    FORMAT_VERSION = 1
+
+    def __init__(self, enabled: bool = True):
+        """
+        Initialize the profiler.
+
+        Args:
+            enabled: Record measurements (a disabled profiler is a no-op)
+        """
+        self.enabled = enabled
+        self.started = time.time()
+        self._clock_start = time.perf_counter()
+        self.phases: Dict[str, PhaseStats] = {}
+        self.events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drop the lock when sending the profiler to a worker process."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Recreate the lock inside a worker process."""
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def phase(self, name: str, items: int = 0) -> Phase:
+        """
+        Measure a phase.
+
+        Args:
+            name: Phase name, dotted by component (e.g. "spec.load")
+            items: Number of items the phase processes, if known up front
+
+        Returns:
+            Context manager yielding the Phase, whose items/bytes can be updated
+        """
+        return Phase(self if self.enabled else None, name, items)
+
+    def _record(self, phase: Phase, seconds: float) -> None:
+        """Store a finished phase run."""
+        rss = peak_rss_kb()
+        with self._lock:
+            stats = self.phases.get(phase.name)
+            if stats is None:
+                stats = self.phases[phase.name] = PhaseStats()
+            stats.add(1, seconds, seconds, phase.items, phase.bytes, rss)
+
+            if len(self.events) < self.MAX_TRACE_EVENTS:
+                self.events.append({
+                    "name": phase.name,
+                    "ts": phase._wall,
+                    "dur": seconds,
+                    "pid": os.getpid(),
+                    "tid": threading.get_ident(),
+                    "items": phase.items,
+                    "bytes": phase.bytes,
+                })
+
+    def reset(self) -> None:
+        """Discard all measurements (used by worker processes on startup)."""
+        with self._lock:
+            self.phases = {}
+            self.events = []
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Take the measurements recorded so far and reset.
+
+        Returns:
+            Picklable measurements for merge() in another process
+        """
+        with self._lock:
+            data = {
+                "phases": {
+                    name: (s.calls, s.seconds, s.max_seconds, s.items, s.bytes, s.peak_rss_kb)
+                    for name, s in self.phases.items()
+                },
+                "events": self.events,
+            }
+            self.phases = {}
+            self.events = []
+        return data
+
+    def merge(self, data: Optional[Dict[str, Any]]) -> None:
+        """Add measurements taken by another process (see snapshot())."""
+        if not data:
+            return
+        with self._lock:
+            for name, values in data["phases"].items():
+                stats = self.phases.get(name)
+                if stats is None:
+                    stats = self.phases[name] = PhaseStats()
+                stats.add(*values)
+            room = self.MAX_TRACE_EVENTS - len(self.events)
+            self.events.extend(data["events"][:max(room, 0)])
+
+    def elapsed(self) -> float:
+        """Seconds since the profiler was created."""
+        return time.perf_counter() - self._clock_start
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Get the aggregated report.
+
+        Returns:
+            Dictionary with total time, peak memory and per-phase statistics
+        """
+        return {
+            "format": self.FORMAT_VERSION,
+            "total_seconds": round(self.elapsed(), 6),
+            "peak_rss_kb": peak_rss_kb(),
+            "workers_peak_rss_kb": peak_rss_kb(children=True),
+            "phases": {name: stats.to_dict() for name, stats in sorted(self.phases.items())},
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Get the recorded phases in Chrome trace event format.
+
+        Each process (main and render workers) shows up as its own track.
+        """
+        events = [
+            {
+                "name": event["name"],
+                "cat": event["name"].split(".", 1)[0],
+                "ph": "X",
+                "ts": round((event["ts"] - self.started) * 1e6, 1),
+                "dur": round(event["dur"] * 1e6, 1),
+                "pid": event["pid"],
+                "tid": event["tid"],
+                "args": {"items": event["items"], "bytes": event["bytes"]},
+            }
+            for event in self.events
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_json(self, path: str) -> None:
+        """Write the aggregated report as JSON."""
+        Path(path).write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+
+    def write_chrome_trace(self, path: str) -> None:
+        """Write the recorded phases as a Chrome trace file."""
+        Path(path).write_text(json.dumps(self.to_chrome_trace()), encoding="utf-8")
+
+    def format_table(self) -> str:
+        """Format the aggregated report as a text table, slowest phases first."""
+        report = self.to_dict()
+        lines = [
+            f"{'Phase':<24} {'Calls':>7} {'Total s':>9} {'Mean ms':>9} {'Max ms':>9} "
+            f"{'Items':>7} {'Bytes':>11} {'Peak RSS':>10}",
+            "-" * 93,
+        ]
+        phases = sorted(report["phases"].items(), key=lambda item: -item[1]["total_seconds"])
+        for name, stats in phases:
+            rss = stats["peak_rss_kb"]
+            lines.append(
+                f"{name:<24} {stats['calls']:>7} {stats['total_seconds']:>9.3f} "
+                f"{stats['mean_seconds'] * 1000:>9.2f} {stats['max_seconds'] * 1000:>9.2f} "
+                f"{stats['items']:>7} {_format_bytes(stats['bytes']):>11} "
+                f"{_format_bytes(rss * 1024) if rss is not None else '-':>10}"
+            )
+
+        lines.append("-" * 93)
+        lines.append(f"Total: {report['total_seconds']:.3f}s")
+        if report["peak_rss_kb"] is not None:
+            memory = f"Peak memory: {_format_bytes(report['peak_rss_kb'] * 1024)}"
+            if report["workers_peak_rss_kb"]:
+                memory += f" (render workers: {_format_bytes(report['workers_peak_rss_kb'] * 1024)})"
+            lines.append(memory)
+        return "\n".join(lines)
+
+
+def _format_bytes(size: int) -> str:
+    """Human-readable byte count, e.g. 1536 -> '1.5 KiB'."""
+    if not size:
+        return "-"
+    for unit in ("B", "KiB", "MiB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
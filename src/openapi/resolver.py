@@ -0,0 +1,278 @@
+"""
+JSON Reference ($ref) resolution for OpenAPI documents.
+
+Supports local references (``#/components/schemas/Pet``) and references
+into other files relative to the referring document
+(``common.yaml#/components/schemas/Error``). External documents are loaded
+on first use, and resolved targets are memoized so a component shared
+by many operations is resolved once per spec load.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+from urllib.parse import unquote
+from openapi.build_manifest import content_hash
+
+# (absolute document path, JSON pointer) identifying a reference target
+RefKey = Tuple[str, str]
+# Cut depth of views without a circular reference inside them
+_NO_CUT = 1 << 30
+_NO_KEYS: FrozenSet[RefKey] = frozenset()
+
+
+class RefResolutionError(ValueError):
+    """Raised when a $ref points to a missing document or location."""
+
+
+class RefResolver:
+    """
+    Resolves $ref entries lazily with memoization and cycle detection.
+
+    Resolved views replace each $ref with its (recursively resolved) target.
+    Views are shared between callers and must not be mutated. Circular
+    references are cut at the first repeated reference, which is kept as
+    ``{"$ref": ..., "x-circular-ref": True}``. Where a cycle is cut depends
+    on the references being resolved, so a memoized view containing a cut
+    is reused only where the same cut would be made: resolving a node gives
+    the same view whatever was resolved before it.
+    """
+
+    def __init__(self, document: Any, document_path: Path,
+                 loader: Callable[[Path], Any]):
+        """
+        Initialize the resolver.
+
+        Args:
+            document: The parsed root document
+            document_path: Path of the root document (base for relative refs)
+            loader: Callable that loads and parses another document by path
+        """
+        self.base = str(Path(document_path).resolve())
+        self._loader = loader
+        self._documents: Dict[str, Any] = {self.base: document}
+        self._targets: Dict[RefKey, Any] = {}
+        # Resolved view and, for views with a cycle cut, the references expanded in it
+        self._views: Dict[RefKey, Tuple[Any, Optional[FrozenSet[RefKey]]]] = {}
+        self._direct_refs: Dict[RefKey, Tuple[RefKey, ...]] = {}
+        self._digests: Dict[RefKey, str] = {}
+        # Refs that could not be resolved, kept as-is in resolved views
+        self.unresolved: Set[str] = set()
+
+    def _absolute(self, ref: str, base: str) -> RefKey:
+        """Turn a $ref string into a (document, pointer) key."""
+        location, _, pointer = ref.partition("#")
+        if location:
+            if "://" in location:
+                raise RefResolutionError(f"Remote references are not supported: {ref}")
+            base = str((Path(base).parent / unquote(location)).resolve())
+        return base, pointer
+
+    def _document(self, path: str) -> Any:
+        """Get a loaded document, loading it on first access."""
+        if path not in self._documents:
+            try:
+                self._documents[path] = self._loader(Path(path))
+            except (OSError, ValueError) as e:
+                raise RefResolutionError(f"Cannot load referenced document {path}: {e}") from e
+        return self._documents[path]
+
+    def documents(self) -> List[str]:
+        """Paths of the external documents loaded so far (excluding the root document)."""
+        return [path for path in self._documents if path != self.base]
+
+    def lookup(self, key: RefKey) -> Any:
+        """
+        Get the raw target of a reference.
+
+        Raises:
+            RefResolutionError: If the document or pointer location is missing
+        """
+        if key in self._targets:
+            return self._targets[key]
+
+        path, pointer = key
+        node = self._document(path)
+        tokens = pointer[1:].split("/") if pointer.startswith("/") else []
+
+        for token in tokens:
+            token = unquote(token).replace("~1", "/").replace("~0", "~")
+            try:
+                node = node[int(token)] if isinstance(node, list) else node[token]
+            except (KeyError, IndexError, ValueError, TypeError):
+                raise RefResolutionError(f"Unresolvable reference: {path}#{pointer}")
+
+        self._targets[key] = node
+        return node
+
+    def deref(self, node: Any, base: Optional[str] = None) -> Any:
+        """
+        Follow a chain of $ref objects to the first non-reference node.
+
+        Only the top level is resolved; nested references are left alone.
+        Unresolvable or circular chains return the last reference object.
+        """
+        base = base or self.base
+        seen: Set[RefKey] = set()
+
+        while isinstance(node, dict) and isinstance(node.get("$ref"), str):
+            try:
+                key = self._absolute(node["$ref"], base)
+                if key in seen:
+                    return node
+                seen.add(key)
+                node, base = self.lookup(key), key[0]
+            except RefResolutionError:
+                self.unresolved.add(node["$ref"])
+                return node
+
+        return node
+
+    def resolve(self, node: Any, base: Optional[str] = None) -> Any:
+        """
+        Get a resolved view of a node with every reachable $ref replaced.
+
+        Args:
+            node: Any part of the document
+            base: Document the node belongs to (defaults to the root document)
+
+        Returns:
+            The resolved view
+        """
+        return self._resolve(node, base or self.base, [])[0]
+
+    def _resolve(self, node: Any, base: str, stack: List[RefKey]) -> Tuple[Any, int, FrozenSet[RefKey]]:
+        """
+        Resolve a node under the references on the stack.
+
+        Returns:
+            The resolved view; the lowest stack depth a circular reference
+            inside it was cut at (_NO_CUT if none was); and the references
+            expanded inside it, if it has a cut (else empty)
+        """
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                return self._resolve_ref(ref, base, stack)
+            items = node.items()
+        elif isinstance(node, list):
+            items = enumerate(node)
+        else:
+            return node, _NO_CUT, _NO_KEYS
+
+        view = {} if isinstance(node, dict) else [None] * len(node)
+        cut = _NO_CUT
+        expanded = _NO_KEYS
+        for key, value in items:
+            view[key], value_cut, value_expanded = self._resolve(value, base, stack)
+            cut = min(cut, value_cut)
+            if value_expanded:
+                expanded = expanded | value_expanded
+        return view, cut, expanded
+
+    def _resolve_ref(self, ref: str, base: str, stack: List[RefKey]) -> Tuple[Any, int, FrozenSet[RefKey]]:
+        try:
+            key = self._absolute(ref, base)
+            target = self.lookup(key)
+        except RefResolutionError:
+            self.unresolved.add(ref)
+            return {"$ref": ref}, _NO_CUT, _NO_KEYS
+
+        depth = len(stack)
+        if key in stack:
+            return {"$ref": ref, "x-circular-ref": True}, stack.index(key), _NO_KEYS
+        if key in self._views:
+            view, expanded = self._views[key]
+            if expanded is None:
+                return view, _NO_CUT, _NO_KEYS
+            # Valid if none of the references it expanded is on the stack
+            # now; one that is would have been cut instead
+            if expanded.isdisjoint(stack):
+                return view, depth, expanded
+
+        stack.append(key)
+        try:
+            view, cut, expanded = self._resolve(target, key[0], stack)
+        finally:
+            stack.pop()
+
+        if cut == _NO_CUT:
+            # No cycle below: the same from every entry point
+            self._views[key] = (view, None)
+        else:
+            expanded = expanded | {key}
+            if cut >= depth:
+                # Cut only at itself or below; reusable wherever none of the
+                # references it expanded is on the stack
+                self._views[key] = (view, expanded)
+        return view, cut, expanded
+
+    def _refs_in(self, node: Any, base: str, found: List[RefKey]) -> None:
+        """Collect references directly contained in a node."""
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                try:
+                    found.append(self._absolute(ref, base))
+                except RefResolutionError:
+                    pass
+                return
+            for value in node.values():
+                self._refs_in(value, base, found)
+        elif isinstance(node, (list, tuple)):
+            for item in node:
+                self._refs_in(item, base, found)
+
+    def dependencies(self, node: Any, base: Optional[str] = None) -> FrozenSet[RefKey]:
+        """
+        Get every reference target a node depends on, transitively.
+
+        Walks memoized per-target reference lists, so shared components
+        are scanned once per spec load.
+        """
+        pending: List[RefKey] = []
+        self._refs_in(node, base or self.base, pending)
+        seen: Set[RefKey] = set()
+
+        while pending:
+            key = pending.pop()
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if key not in self._direct_refs:
+                found: List[RefKey] = []
+                try:
+                    self._refs_in(self.lookup(key), key[0], found)
+                except RefResolutionError:
+                    pass
+                self._direct_refs[key] = tuple(found)
+            pending.extend(self._direct_refs[key])
+
+        return frozenset(seen)
+
+    def portable_key(self, key: RefKey) -> RefKey:
+        """
+        Express a key relative to the root document ("" for the root itself).
+
+        Keeps hashes independent of where the spec lives, so identical
+        specs stored under different names hash the same.
+        """
+        path, pointer = key
+        if path == self.base:
+            return "", pointer
+        try:
+            return os.path.relpath(path, os.path.dirname(self.base)), pointer
+        except ValueError:
+            # Different drive on Windows
+            return path, pointer
+
+    def target_digest(self, key: RefKey) -> str:
+        """Hash of a raw reference target (memoized)."""
+        if key not in self._digests:
+            try:
+                target = self.lookup(key)
+            except RefResolutionError:
+                target = None
+            self._digests[key] = content_hash(target)
+        return self._digests[key]
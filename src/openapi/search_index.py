@@ -0,0 +1,138 @@
+"""
+Prebuilt client-side search index.
+
+Instead of embedding every endpoint in index.html and indexing it in the
+browser, the generator writes a compact inverted index next to the pages:
+
+    search/index.js          Result records and the list of shards
+    search/shard-<key>.js    Tokens starting with <key> and their postings
+
+search.js loads index.js on first use and only the shards a query needs,
+so page load and first-keystroke latency don't grow with the API. Files
+are scripts calling ApiFlowSearch.register() rather than JSON, so search
+also works when the docs are opened from disk (file://), where fetch() is
+blocked.
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+FORMAT_VERSION = 1
+
+# Score of a match in each field; a document keeps its best field per token
+FIELD_WEIGHTS = {
+    "path": 3,
+    "summary": 3,
+    "method": 2,
+    "tags": 2,
+    "description": 1,
+}
+
+# Letters and digits in any script
+_WORD_RE = re.compile(r"[^\W_]+")
+# Parts of camelCase and PascalCase words: "petId" -> "pet", "Id"
+_CAMEL_RE = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase search tokens.
+
+    camelCase words are indexed both whole and by part, so "petId" is
+    found by "petid", "pet" and "id".
+
+    Example: "/pets/{petId}" -> ["pets", "petid", "pet", "id"]
+    """
+    tokens = []
+    for word in _WORD_RE.findall(text or ""):
+        tokens.append(word.lower())
+        parts = _CAMEL_RE.findall(word)
+        if len(parts) > 1:
+            tokens.extend(part.lower() for part in parts)
+    return tokens
+
+
+def shard_key(token: str, prefix_length: int) -> str:
+    """
+    Shard a token belongs to: its first prefix_length characters.
+
+    Tokens starting with anything but ASCII letters and digits share the
+    "_" shard so shard names are always safe filenames.
+    """
+    if prefix_length <= 0:
+        return "all"
+    prefix = token[:prefix_length]
+    return prefix if prefix.isascii() and prefix.isalnum() else "_"
+
+
+def build_search_index(entries: Sequence[Dict[str, Any]],
+                       prefix_length: int = 1) -> Dict[str, Dict[str, Any]]:
+    """
+    Build the search index for a set of endpoints.
+
+    Args:
+        entries: Search entries with method, path, summary, description,
+                 tags and filename (see OpenAPIDocGenerator._search_entry)
+        prefix_length: Characters of the token prefix used to shard the
+                       index (0 writes a single shard)
+
+    Returns:
+        Mapping of file name (relative to the search/ directory) to its data
+    """
+    postings: Dict[str, Dict[int, int]] = {}
+
+    for doc_id, entry in enumerate(entries):
+        fields = {
+            "path": entry["path"],
+            "summary": entry.get("summary"),
+            "method": entry["method"],
+            "tags": " ".join(entry.get("tags", [])),
+            "description": entry.get("description"),
+        }
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            for token in tokenize(text):
+                docs = postings.setdefault(token, {})
+                if docs.get(doc_id, 0) < weight:
+                    docs[doc_id] = weight
+
+    shards: Dict[str, Dict[str, List[int]]] = {}
+    for token in sorted(postings):
+        # Flat [doc, weight, doc, weight, ...] keeps the files small
+        flat = [value for item in sorted(postings[token].items()) for value in item]
+        shards.setdefault(shard_key(token, prefix_length), {})[token] = flat
+
+    files: Dict[str, Dict[str, Any]] = {
+        "index.js": {
+            "format": FORMAT_VERSION,
+            "prefix": prefix_length,
+            "docs": [
+                [entry["method"], entry["path"], entry.get("summary") or "", entry["filename"]]
+                for entry in entries
+            ],
+            "shards": sorted(shards),
+        },
+    }
+    for key, tokens in shards.items():
+        files[f"shard-{key}.js"] = {"tokens": tokens}
+    return files
+
+
+def render_search_file(name: str, data: Dict[str, Any]) -> str:
+    """Wrap index data in the script that registers it with search.js."""
+    payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+    # Line separators are valid JSON but break older JavaScript parsers
+    payload = payload.replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+    return f"ApiFlowSearch.register({json.dumps(name[:-3])},{payload});\n"
+
+
+def search_index_files(entries: Sequence[Dict[str, Any]],
+                       prefix_length: int = 1) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (file name, script source) for every file of the search index.
+
+    File names are relative to the search/ output directory.
+    """
+    for name, data in build_search_index(entries, prefix_length).items():
+        yield name, render_search_file(name, data)
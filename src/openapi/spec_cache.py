@@ -0,0 +1,109 @@
+"""
+On-disk cache of parsed OpenAPI specifications.
+
+Parsing large YAML specs dominates build time, so the parsed document is
+stored in pickle form and reused while the spec file is unchanged. Entries
+are keyed by the spec's resolved path, size, mtime and content hash.
+"""
+
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+class SpecCache:
+    """
+    Stores parsed specs under ~/.apiflow/spec-cache.
+
+    Each entry holds a small header pickle followed by the spec pickle,
+    so a stale entry is rejected without unpickling the full document.
+    """
+
+    CACHE_DIR = Path.home() / ".apiflow" / "spec-cache"
+    FORMAT_VERSION = 1
+
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Initialize the spec cache.
+
+        Args:
+            cache_dir: Optional cache directory (defaults to ~/.apiflow/spec-cache)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else self.CACHE_DIR
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def content_hash(raw: bytes) -> str:
+        """Return the content hash used in cache keys."""
+        return hashlib.sha256(raw).hexdigest()
+
+    def _entry_path(self, spec_path: Path) -> Path:
+        """Map a spec file to its cache entry."""
+        key = hashlib.sha256(str(spec_path.resolve()).encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.pickle"
+
+    def _header(self, spec_path: Path, signature: Tuple[int, int], digest: str) -> Dict[str, Any]:
+        """Build the header that must match for an entry to be reused."""
+        mtime_ns, size = signature
+        return {
+            "format": self.FORMAT_VERSION,
+            "path": str(spec_path.resolve()),
+            "size": size,
+            "mtime_ns": mtime_ns,
+            "sha256": digest,
+        }
+
+    def load(self, spec_path: Path, signature: Tuple[int, int], digest: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a parsed spec.
+
+        Args:
+            spec_path: Path to the spec file
+            signature: (mtime_ns, size) of the spec file
+            digest: Content hash of the spec file
+
+        Returns:
+            The cached spec, or None on a miss
+        """
+        entry = self._entry_path(spec_path)
+        expected = self._header(spec_path, signature, digest)
+
+        try:
+            with open(entry, "rb") as f:
+                if pickle.load(f) != expected:
+                    self.misses += 1
+                    return None
+                spec = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ValueError):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return spec
+
+    def store(self, spec_path: Path, signature: Tuple[int, int], digest: str,
+              spec: Dict[str, Any]) -> None:
+        """
+        Save a parsed spec.
+
+        The entry is written to a temporary file and renamed into place so
+        concurrent builds never read a partially written entry.
+        """
+        entry = self._entry_path(spec_path)
+        tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                pickle.dump(self._header(spec_path, signature, digest), f, pickle.HIGHEST_PROTOCOL)
+                pickle.dump(spec, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, entry)
+        except OSError:
+            # The cache is an optimization only; never fail a build over it
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,346 @@
+"""
+Self-hosted copies of the third-party assets the templates use.
+
+By default pages load the Inter font from Google Fonts, and Font Awesome
+and Prism from cdnjs. In offline mode the generator instead copies pinned
+copies of these files from static/vendor/ into the output, so pages make
+no third-party requests (and work in air-gapped deployments).
+
+The files are downloaded once with fetch_vendor_assets() (the
+--fetch-offline-assets command). Every file must match a hash known in
+advance: the integrity hash published upstream, or the SHA-256 recorded
+in static/vendor/vendor-lock.json, which is committed with the code. A
+file without either is refused, so the CDN is never trusted on first use.
+The lock file is (re)written by pin_vendor_assets() (--pin-offline-assets),
+a maintainer step whose result is reviewed like any other change.
+
+Font Awesome is subset to the icons the templates and scripts actually
+reference when fontTools is installed (a few KB instead of the full
+webfonts); otherwise the full stylesheet and webfonts are copied.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import re
+import urllib.request
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+try:
+    from fontTools import subset as font_subset
+except ImportError:
+    font_subset = None
+
+PRISM_VERSION = "1.29.0"
+# Prism language components (code example languages and JSON response examples)
+PRISM_COMPONENTS = ("bash", "python", "javascript", "go", "java", "ruby", "json")
+FONT_AWESOME_VERSION = "6.5.1"
+INTER_VERSION = "5.0.16"
+INTER_WEIGHTS = (400, 500, 600, 700, 800, 900)
+
+# Directory under the static assets directory holding the downloaded files
+VENDOR_DIR = "vendor"
+LOCK_FILE = "vendor-lock.json"
+# Characters of the "latin" subset the Inter files cover (as served by Google Fonts)
+INTER_UNICODE_RANGE = (
+    "U+0000-00FF, U+0131, U+0152-0153, U+02BB-02BC, U+02C6, U+02DA, U+02DC, "
+    "U+0304, U+0308, U+0329, U+2000-206F, U+2074, U+20AC, U+2122, U+2191, "
+    "U+2193, U+2212, U+2215, U+FEFF, U+FFFD"
+)
+
+# Font Awesome style classes -> (webfont file, font-family, font-weight)
+FONT_AWESOME_STYLES = {
+    "solid": ("fa-solid-900.woff2", "Font Awesome 6 Free", 900),
+    "regular": ("fa-regular-400.woff2", "Font Awesome 6 Free", 400),
+    "brands": ("fa-brands-400.woff2", "Font Awesome 6 Brands", 400),
+}
+_STYLE_CLASSES = {
+    "fa": "solid", "fas": "solid", "fa-solid": "solid",
+    "far": "regular", "fa-regular": "regular",
+    "fab": "brands", "fa-brands": "brands",
+}
+_ICON_CLASS_RE = re.compile(r"\b(fa-[a-z0-9-]+|fa[srb]?)\b")
+# ".fa-moon:before{content:"\f186"}", possibly with several selectors
+_ICON_RULE_RE = re.compile(r'((?:\.fa-[a-z0-9-]+:{1,2}before,?)+)\{content:"\\([0-9a-f]+)"\}')
+_WEBFONT_URL_RE = re.compile(r"url\(\.\./webfonts/([^)?#]+)\)")
+
+
+class MissingVendorFilesError(FileNotFoundError):
+    """Raised when offline assets are requested before the vendor files are downloaded."""
+
+
+class VendorFile(NamedTuple):
+    """A pinned third-party file."""
+
+    path: str  # Relative to static/vendor/
+    url: str
+    # Subresource-integrity hash published upstream, if known
+    integrity: Optional[str] = None
+
+
+_CDNJS = "https://cdnjs.cloudflare.com/ajax/libs"
+
+VENDOR_FILES: Tuple[VendorFile, ...] = (
+    VendorFile("prism/prism.min.js", f"{_CDNJS}/prism/{PRISM_VERSION}/prism.min.js"),
+    *(
+        VendorFile(f"prism/prism-{component}.min.js",
+                   f"{_CDNJS}/prism/{PRISM_VERSION}/components/prism-{component}.min.js")
+        for component in PRISM_COMPONENTS
+    ),
+    VendorFile("prism/prism-tomorrow.min.css",
+               f"{_CDNJS}/prism/{PRISM_VERSION}/themes/prism-tomorrow.min.css"),
+    VendorFile(
+        "font-awesome/css/all.min.css",
+        f"{_CDNJS}/font-awesome/{FONT_AWESOME_VERSION}/css/all.min.css",
+        integrity="sha512-DTOQO9RWCH3ppGqcWaEA1BIZOC6xxalwEsw9c2QQeAIftl+Vegovlnee1c9QX4Tct"
+                  "nWMn13TZye+giMm8e2LwA==",
+    ),
+    *(
+        VendorFile(f"font-awesome/webfonts/{filename}",
+                   f"{_CDNJS}/font-awesome/{FONT_AWESOME_VERSION}/webfonts/{filename}")
+        for filename, _, _ in FONT_AWESOME_STYLES.values()
+    ),
+    *(
+        VendorFile(
+            f"fonts/inter-latin-{weight}-normal.woff2",
+            f"https://cdn.jsdelivr.net/npm/@fontsource/inter@{INTER_VERSION}"
+            f"/files/inter-latin-{weight}-normal.woff2",
+        )
+        for weight in INTER_WEIGHTS
+    ),
+)
+
+
+def missing_vendor_files(static_path: Path) -> List[str]:
+    """Vendor files not yet downloaded into static_path/vendor."""
+    vendor_path = static_path / VENDOR_DIR
+    return [file.path for file in VENDOR_FILES if not (vendor_path / file.path).exists()]
+
+
+def _load_lock(vendor_path: Path) -> Dict[str, str]:
+    """Pinned SHA-256 hashes by vendor file path (empty without a lock file)."""
+    lock_path = vendor_path / LOCK_FILE
+    if not lock_path.exists():
+        return {}
+    with open(lock_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def unpinned_vendor_files(lock: Dict[str, str]) -> List[str]:
+    """Vendor files with neither a published integrity hash nor a locked SHA-256."""
+    return [file.path for file in VENDOR_FILES if not file.integrity and file.path not in lock]
+
+
+def _check_integrity(file: VendorFile, data: bytes, locked: Optional[str]) -> None:
+    """Raise ValueError unless data matches the file's pinned hashes."""
+    if not file.integrity and not locked:
+        raise ValueError(f"{file.path} has no pinned hash in {LOCK_FILE}")
+    if file.integrity:
+        algorithm, expected = file.integrity.split("-", 1)
+        actual = base64.b64encode(hashlib.new(algorithm, data).digest()).decode("ascii")
+        if actual != expected:
+            raise ValueError(f"{file.path} does not match its published integrity hash")
+    if locked and hashlib.sha256(data).hexdigest() != locked:
+        raise ValueError(f"{file.path} does not match its hash in {LOCK_FILE}")
+
+
+def _download(file: VendorFile, timeout: float) -> bytes:
+    request = urllib.request.Request(file.url, headers={"User-Agent": "apiflow"})
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return response.read()
+
+
+def fetch_vendor_assets(static_dir: str, timeout: float = 30) -> int:
+    """
+    Download the pinned vendor files into static_dir/vendor.
+
+    Every file must match its published integrity hash or its SHA-256 in
+    vendor-lock.json; files present already are verified the same way.
+
+    Args:
+        static_dir: Static assets directory
+        timeout: Seconds to wait for each download
+
+    Returns:
+        Number of files downloaded
+
+    Raises:
+        ValueError: If a file has no pinned hash or doesn't match it
+        OSError: If a download fails
+    """
+    vendor_path = Path(static_dir) / VENDOR_DIR
+    lock = _load_lock(vendor_path)
+    unpinned = unpinned_vendor_files(lock)
+    if unpinned:
+        raise ValueError(f"no pinned hash for {', '.join(unpinned)} in "
+                         f"{vendor_path / LOCK_FILE} (see --pin-offline-assets)")
+
+    downloaded = 0
+    for file in VENDOR_FILES:
+        dest = vendor_path / file.path
+        if dest.exists():
+            _check_integrity(file, dest.read_bytes(), lock.get(file.path))
+            continue
+
+        data = _download(file, timeout)
+        _check_integrity(file, data, lock.get(file.path))
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        dest.write_bytes(data)
+        downloaded += 1
+        print(f"  ✓ {file.path}")
+
+    return downloaded
+
+
+def pin_vendor_assets(static_dir: str, timeout: float = 30) -> Path:
+    """
+    Record the SHA-256 of every vendor file in vendor-lock.json.
+
+    For maintainers updating a pinned version: run from a trusted network
+    and review the resulting lock file before committing it. Files with a
+    published integrity hash must still match it.
+
+    Args:
+        static_dir: Static assets directory
+        timeout: Seconds to wait for each download
+
+    Returns:
+        Path of the written lock file
+
+    Raises:
+        ValueError: If a file doesn't match its published integrity hash
+        OSError: If a download fails
+    """
+    vendor_path = Path(static_dir) / VENDOR_DIR
+    lock = {}
+    for file in VENDOR_FILES:
+        data = _download(file, timeout)
+        if file.integrity:
+            _check_integrity(file, data, None)
+        lock[file.path] = hashlib.sha256(data).hexdigest()
+        print(f"  ✓ {file.path} {lock[file.path]}")
+
+    vendor_path.mkdir(parents=True, exist_ok=True)
+    lock_path = vendor_path / LOCK_FILE
+    with open(lock_path, "w", encoding="utf-8") as f:
+        json.dump(lock, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return lock_path
+
+
+def inter_stylesheet(font_urls: Dict[int, str]) -> str:
+    """
+    @font-face rules for the self-hosted Inter font.
+
+    Args:
+        font_urls: Font weight -> URL of its woff2 file, relative to the stylesheet
+    """
+    return "".join(
+        "@font-face{font-family:'Inter';font-style:normal;"
+        f"font-weight:{weight};font-display:swap;"
+        f"src:url({url}) format('woff2');unicode-range:{INTER_UNICODE_RANGE}}}\n"
+        for weight, url in sorted(font_urls.items())
+    )
+
+
+def used_icons(sources: Iterable[str]) -> Tuple[Set[str], Set[str]]:
+    """
+    Find the Font Awesome icons and styles referenced in sources.
+
+    Args:
+        sources: Template and script sources
+
+    Returns:
+        (icon class names such as "fa-moon", style names such as "solid")
+    """
+    classes: Set[str] = set()
+    for source in sources:
+        classes.update(_ICON_CLASS_RE.findall(source))
+
+    styles = {_STYLE_CLASSES[name] for name in classes if name in _STYLE_CLASSES}
+    return classes, styles or {"solid"}
+
+
+def icon_codepoints(font_awesome_css: str, icons: Set[str]) -> Dict[str, int]:
+    """
+    Map icon class names to their glyph codepoints, using Font Awesome's stylesheet.
+
+    Names without a glyph (style and utility classes) are left out.
+    """
+    codepoints = {}
+    for selectors, codepoint in _ICON_RULE_RE.findall(font_awesome_css):
+        for selector in selectors.split(","):
+            name = selector.split(":", 1)[0][1:]
+            if name in icons:
+                codepoints[name] = int(codepoint, 16)
+    return codepoints
+
+
+def subset_font(font_data: bytes, codepoints: Iterable[int]) -> Optional[bytes]:
+    """
+    Subset a font to the given codepoints as woff2.
+
+    Returns:
+        The subset font, or None if fontTools (or brotli, for woff2) is unavailable
+    """
+    if font_subset is None:
+        return None
+
+    options = font_subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    try:
+        font = font_subset.load_font(io.BytesIO(font_data), options)
+        subsetter = font_subset.Subsetter(options)
+        subsetter.populate(unicodes=sorted(set(codepoints)))
+        subsetter.subset(font)
+        output = io.BytesIO()
+        font_subset.save_font(font, output, options)
+    except ImportError:
+        # Reading and writing woff2 needs brotli
+        return None
+    return output.getvalue()
+
+
+def icon_stylesheet(codepoints: Dict[str, int], font_urls: Dict[str, str]) -> str:
+    """
+    Stylesheet for a subset Font Awesome: @font-face, style classes and used icons.
+
+    Args:
+        codepoints: Icon class name -> glyph codepoint
+        font_urls: Style name -> URL of its subset font, relative to the stylesheet
+    """
+    rules = []
+    for style, url in sorted(font_urls.items()):
+        _, family, weight = FONT_AWESOME_STYLES[style]
+        classes = ",".join(f".{name}" for name, value in _STYLE_CLASSES.items() if value == style)
+        rules.append(
+            f'@font-face{{font-family:"{family}";font-style:normal;font-weight:{weight};'
+            f'font-display:block;src:url({url}) format("woff2")}}'
+        )
+        rules.append(
+            f'{classes}{{font-family:"{family}";font-weight:{weight};'
+            "-moz-osx-font-smoothing:grayscale;-webkit-font-smoothing:antialiased;"
+            "display:var(--fa-display,inline-block);font-style:normal;"
+            "font-variant:normal;line-height:1;text-rendering:auto}"
+        )
+    for name, codepoint in sorted(codepoints.items()):
+        rules.append(f'.{name}:before{{content:"\\{codepoint:x}"}}')
+    return "\n".join(rules) + "\n"
+
+
+def rewrite_webfont_urls(font_awesome_css: str, font_urls: Dict[str, str]) -> str:
+    """
+    Point Font Awesome's ../webfonts/ URLs at the copied webfonts.
+
+    Args:
+        font_awesome_css: all.min.css source
+        font_urls: Webfont file name -> URL relative to the rewritten stylesheet
+    """
+    return _WEBFONT_URL_RE.sub(
+        lambda match: f"url({font_urls.get(match.group(1), 'webfonts/' + match.group(1))})",
+        font_awesome_css,
+    )
@@ -5,14 +5,33 @@ Handles multiple versions of API specifications and generates
 unified documentation with version switching capabilities.
 """
 
-from typing import Dict, List, Any, Optional
-from openapi.parser import OpenAPIParser
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional, Tuple
+from openapi.parser import OpenAPIParser, Endpoint, EndpointSummary
+from openapi.diff import OperationIndex, VersionDiff, diff_versions
+from openapi.spec_cache import SpecCache
+from openapi.profiling import BuildProfiler
+
+
+def _load_parser(spec_path: str, spec_cache: Optional[SpecCache],
+                 profile: bool) -> Tuple[OpenAPIParser, Optional[Dict[str, Any]]]:
+    """Load a spec in a worker process (see VersionManager.load_all)."""
+    parser = OpenAPIParser(spec_path, spec_cache=spec_cache, profiler=BuildProfiler(enabled=profile))
+    return parser, parser.profiler.snapshot() if profile else None
 
 
 class VersionedAPI:
-    """Represents a single version of an API."""
+    """
+    Represents a single version of an API.
+
+    The spec is loaded on first access to the parser, so registering a
+    version is cheap. release() drops the loaded spec again.
+    """
 
-    def __init__(self, version: str, spec_path: str, label: Optional[str] = None):
+    def __init__(self, version: str, spec_path: str, label: Optional[str] = None,
+                 spec_cache: Optional[SpecCache] = None,
+                 profiler: Optional[BuildProfiler] = None):
         """
         Initialize a versioned API.
 
@@ -20,25 +39,85 @@ class VersionedAPI:
             version: Version identifier (e.g., "1.0.0", "v1", "2.0")
             spec_path: Path to the OpenAPI specification file
             label: Optional display label (defaults to version)
+            spec_cache: Optional on-disk cache of parsed specs
+            profiler: Optional build profiler
         """
+        if not Path(spec_path).exists():
+            raise FileNotFoundError(f"OpenAPI spec not found: {spec_path}")
+
         self.version = version
         self.spec_path = spec_path
         self.label = label or version
-        self.parser = OpenAPIParser(spec_path)
+        self.spec_cache = spec_cache
+        self.profiler = profiler
+        self._parser: Optional[OpenAPIParser] = None
+        self._endpoints: Optional[Tuple[Endpoint, ...]] = None
+        self._source_endpoints: Optional[Tuple[Endpoint, ...]] = None
+
+    @property
+    def parser(self) -> OpenAPIParser:
+        """Parser for this version's spec, loaded on first access."""
+        return self.load()
+
+    def load(self) -> OpenAPIParser:
+        """Load the spec now, unless it is already loaded."""
+        if self._parser is None:
+            self._parser = OpenAPIParser(
+                self.spec_path, spec_cache=self.spec_cache, profiler=self.profiler
+            )
+        return self._parser
+
+    @parser.setter
+    def parser(self, parser: OpenAPIParser) -> None:
+        self._parser = parser
+        self._endpoints = None
+        self._source_endpoints = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the spec is currently loaded."""
+        return self._parser is not None
+
+    def release(self) -> None:
+        """
+        Drop the loaded spec and everything derived from it.
+
+        The spec is loaded again (from the spec cache, when used) on next access.
+        """
+        self._parser = None
+        self._endpoints = None
+        self._source_endpoints = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Leave the loaded spec behind when sent to a worker process; it is loaded there if needed."""
+        state = self.__dict__.copy()
+        state["_parser"] = None
+        state["_endpoints"] = None
+        state["_source_endpoints"] = None
+        return state
 
     def get_info(self) -> Dict[str, Any]:
         """Get API info with version metadata."""
-        info = self.parser.get_info()
+        # Copy so the parser's spec (and its cache entry) stays untouched
+        info = dict(self.parser.get_info())
         info["api_version"] = self.version
         info["version_label"] = self.label
         return info
 
-    def get_endpoints(self) -> List[Dict[str, Any]]:
+    def get_endpoints(self) -> Tuple[Endpoint, ...]:
         """Get endpoints with version metadata."""
-        endpoints = self.parser.get_endpoints()
-        for endpoint in endpoints:
-            endpoint["api_version"] = self.version
-        return endpoints
+        parsed = self.parser.get_endpoints()
+        # Rebuild the tagged copies only when the parser rebuilt its model
+        if self._endpoints is None or self._source_endpoints is not parsed:
+            self._source_endpoints = parsed
+            self._endpoints = tuple(
+                endpoint._replace(api_version=self.version) for endpoint in parsed
+            )
+        return self._endpoints
+
+    def get_endpoint_summaries(self) -> Tuple[EndpointSummary, ...]:
+        """Get lightweight endpoint records (no version metadata needed)."""
+        return self.parser.get_endpoint_summaries()
 
     def get_servers(self) -> List[Dict[str, Any]]:
         """Get servers from this version."""
@@ -52,10 +131,29 @@ class VersionedAPI:
 class VersionManager:
     """Manages multiple API versions and generates unified documentation."""
 
-    def __init__(self):
-        """Initialize the version manager."""
+    def __init__(self, spec_cache: Optional[SpecCache] = None,
+                 profiler: Optional[BuildProfiler] = None):
+        """
+        Initialize the version manager.
+
+        Args:
+            spec_cache: Optional on-disk cache of parsed specs, shared by all versions
+            profiler: Optional build profiler, shared by all versions
+        """
+        self.spec_cache = spec_cache
+        self.profiler = profiler
         self.versions: Dict[str, VersionedAPI] = {}
         self.default_version: Optional[str] = None
+        self._indexes: Dict[str, OperationIndex] = {}
+        # (old, new) -> (old index, new index, diff)
+        self._diffs: Dict[Tuple[str, str], Tuple[OperationIndex, OperationIndex, VersionDiff]] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Leave indexes and diffs (which hold loaded specs) behind when sent to a worker process."""
+        state = self.__dict__.copy()
+        state["_indexes"] = {}
+        state["_diffs"] = {}
+        return state
 
     def add_version(
         self,
@@ -73,12 +171,69 @@ class VersionManager:
             label: Optional display label
             is_default: Whether this is the default version to show
         """
-        versioned_api = VersionedAPI(version, spec_path, label)
+        versioned_api = VersionedAPI(
+            version, spec_path, label, spec_cache=self.spec_cache, profiler=self.profiler
+        )
         self.versions[version] = versioned_api
+        self._indexes.pop(version, None)
 
         if not self.default_version or is_default:
             self.default_version = version
 
+    def load_all(self, jobs: int = 1) -> None:
+        """
+        Load every version's spec that is not loaded yet.
+
+        Args:
+            jobs: Worker processes parsing specs concurrently (1 = in this process)
+        """
+        pending = [api for api in self.versions.values() if not api.is_loaded]
+        if jobs > 1 and len(pending) > 1:
+            profile = self.profiler is not None and self.profiler.enabled
+            try:
+                with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as pool:
+                    futures = [
+                        pool.submit(_load_parser, api.spec_path, self.spec_cache, profile)
+                        for api in pending
+                    ]
+                    for api, future in zip(pending, futures):
+                        parser, measurements = future.result()
+                        self._adopt(api, parser, measurements)
+                return
+            except (OSError, NotImplementedError) as e:
+                # Platforms without working process pools (e.g. no sem_open)
+                print(f"⚠️  Parallel spec loading unavailable ({e}), loading serially")
+
+        for api in pending:
+            api.load()
+
+    def _adopt(self, api: VersionedAPI, parser: OpenAPIParser,
+               measurements: Optional[Dict[str, Any]]) -> None:
+        """Take over a parser loaded in a worker process."""
+        if self.profiler is not None:
+            parser.profiler = self.profiler
+            self.profiler.merge(measurements)
+        # The worker's spec cache counted the lookup in its own copy
+        if self.spec_cache is not None:
+            if parser.cache_status == "hit":
+                self.spec_cache.hits += 1
+            elif parser.cache_status == "miss":
+                self.spec_cache.misses += 1
+        api.parser = parser
+
+    def release(self, version: str) -> None:
+        """
+        Release a version's loaded spec once its documentation is written.
+
+        Args:
+            version: Version identifier
+        """
+        self.versions[version].release()
+        self._indexes.pop(version, None)
+        self._diffs = {
+            pair: cached for pair, cached in self._diffs.items() if version not in pair
+        }
+
     def get_version(self, version: str) -> Optional[VersionedAPI]:
         """Get a specific API version."""
         return self.versions.get(version)
@@ -113,7 +268,7 @@ class VersionManager:
         """Check if multiple versions are available."""
         return len(self.versions) > 1
 
-    def get_combined_endpoints(self) -> List[Dict[str, Any]]:
+    def get_combined_endpoints(self) -> List[Endpoint]:
         """
         Get all endpoints from all versions combined.
 
@@ -132,7 +287,7 @@ class VersionManager:
 
         return all_endpoints
 
-    def get_endpoints_by_version(self) -> Dict[str, List[Dict[str, Any]]]:
+    def get_endpoints_by_version(self) -> Dict[str, Tuple[Endpoint, ...]]:
         """
         Get endpoints grouped by version.
 
@@ -141,6 +296,54 @@ class VersionManager:
         """
         return {version: api.get_endpoints() for version, api in self.versions.items()}
 
+    def get_operation_index(self, version: str) -> OperationIndex:
+        """
+        Get the operations of a version keyed by "METHOD path".
+
+        Built once per version and rebuilt only when its spec is reloaded.
+        """
+        parser = self.versions[version].parser
+        index = self._indexes.get(version)
+        if index is None or index.parser is not parser or index.is_stale():
+            index = OperationIndex(parser)
+            self._indexes[version] = index
+        return index
+
+    def diff_versions(self, old_version: str, new_version: str) -> VersionDiff:
+        """
+        Get the structural differences between two versions.
+
+        Args:
+            old_version: Version compared against
+            new_version: Version whose changes are listed
+
+        Returns:
+            Added, removed and changed operations, down to parameters,
+            request bodies, responses and schema fields
+        """
+        old_index = self.get_operation_index(old_version)
+        new_index = self.get_operation_index(new_version)
+        cached = self._diffs.get((old_version, new_version))
+        if cached is not None and cached[0] is old_index and cached[1] is new_index:
+            return cached[2]
+
+        diff = diff_versions(old_index, new_index, old_version, new_version)
+        self._diffs[(old_version, new_version)] = (old_index, new_index, diff)
+        return diff
+
+    def get_changelog(self) -> List[VersionDiff]:
+        """
+        Get the changes of every version since the previous one.
+
+        Returns:
+            One diff per pair of adjacent versions (sorted by version string), oldest first
+        """
+        versions_sorted = sorted(self.versions.keys())
+        return [
+            self.diff_versions(previous, version)
+            for previous, version in zip(versions_sorted, versions_sorted[1:])
+        ]
+
     def get_version_comparison(self) -> Dict[str, Any]:
         """
         Generate comparison data between versions.
@@ -152,31 +355,21 @@ class VersionManager:
 
         comparison = {
             "versions": list(self.versions.keys()),
-            "endpoint_counts": {},
+            "endpoint_counts": {
+                version: len(self.get_operation_index(version).operations)
+                for version in sorted(self.versions.keys())
+            },
             "new_endpoints": {},
             "removed_endpoints": {},
+            "changed_endpoints": {},
         }
 
-        versions_sorted = sorted(self.versions.keys())
-
-        for i, version in enumerate(versions_sorted):
-            api = self.versions[version]
-            endpoints = api.get_endpoints()
-            comparison["endpoint_counts"][version] = len(endpoints)
-
-            if i > 0:
-                prev_version = versions_sorted[i - 1]
-                prev_api = self.versions[prev_version]
-                prev_endpoints = {
-                    f"{e['method']} {e['path']}" for e in prev_api.get_endpoints()
-                }
-                curr_endpoints = {f"{e['method']} {e['path']}" for e in endpoints}
-
-                comparison["new_endpoints"][version] = list(
-                    curr_endpoints - prev_endpoints
-                )
-                comparison["removed_endpoints"][version] = list(
-                    prev_endpoints - curr_endpoints
-                )
+        for diff in self.get_changelog():
+            version = diff.new_version
+            comparison["new_endpoints"][version] = [e.operation_key for e in diff.added]
+            comparison["removed_endpoints"][version] = [e.operation_key for e in diff.removed]
+            comparison["changed_endpoints"][version] = [
+                operation.summary.operation_key for operation in diff.changed
+            ]
 
         return comparison
@@ -1,4 +1,4 @@
-// Search functionality (requires Fuse.js and endpoints data)
+// Search functionality (queries the prebuilt index in search/, loaded on first use)
 (function () {
     const searchInput = document.getElementById('searchInput');
     const searchResults = document.getElementById('searchResults');
@@ -9,25 +9,128 @@
         return;
     }
 
-    if (typeof endpoints === 'undefined' || typeof Fuse === 'undefined') {
-        console.error('Search requires endpoints data and Fuse.js');
-        return;
+    const MAX_RESULTS = 10;
+    // Relative path from this page to the directory holding search/
+    const base = searchInput.dataset.searchBase || '';
+    const loaded = {};
+    const pending = {};
+    let latestQuery = 0;
+
+    // Index files are scripts calling ApiFlowSearch.register(name, data),
+    // which (unlike fetch) also works for docs opened from disk
+    window.ApiFlowSearch = {
+        register(name, data) {
+            loaded[name] = data;
+            (pending[name] || []).forEach(resolve => resolve(data));
+            delete pending[name];
+        }
+    };
+
+    function loadIndexFile(name) {
+        if (loaded[name]) {
+            return Promise.resolve(loaded[name]);
+        }
+
+        return new Promise(resolve => {
+            if (pending[name]) {
+                pending[name].push(resolve);
+                return;
+            }
+            pending[name] = [resolve];
+
+            const script = document.createElement('script');
+            script.src = `${base}search/${name}.js`;
+            script.async = true;
+            script.onerror = () => {
+                console.error(`Search index file not found: ${script.src}`);
+                (pending[name] || []).forEach(done => done(null));
+                delete pending[name];
+            };
+            document.head.appendChild(script);
+        });
     }
 
-    // Configure Fuse.js for fuzzy search
-    const fuse = new Fuse(endpoints, {
-        keys: ['path', 'method', 'summary', 'description', 'tags'],
-        threshold: 0.3,
-        includeScore: true,
-    });
+    function tokenize(text) {
+        return text.toLowerCase().split(/[^\p{L}\p{N}]+/u).filter(Boolean);
+    }
+
+    // Shards that can hold tokens starting with term (mirrors search_index.shard_key)
+    function shardsFor(term, index) {
+        if (index.prefix === 0) {
+            return index.shards;
+        }
+        const prefix = term.slice(0, index.prefix);
+        if (!/^[a-z0-9]+$/.test(prefix)) {
+            return index.shards.filter(key => key === '_');
+        }
+        if (term.length >= index.prefix) {
+            return index.shards.filter(key => key === prefix);
+        }
+        // Longer tokens starting with term may continue with a character
+        // outside [a-z0-9] ("aé..."), which puts them in the "_" shard
+        return index.shards.filter(key => key.startsWith(term) || key === '_');
+    }
+
+    // Best score of every document containing a token that starts with term
+    async function matchTerm(term, index) {
+        const shards = await Promise.all(
+            shardsFor(term, index).map(key => loadIndexFile(`shard-${key}`))
+        );
+        const scores = new Map();
+
+        shards.forEach(shard => {
+            if (!shard) {
+                return;
+            }
+            Object.entries(shard.tokens).forEach(([token, postings]) => {
+                if (!token.startsWith(term)) {
+                    return;
+                }
+                // Whole-word matches rank above prefix matches
+                const bonus = token === term ? 2 : 1;
+                for (let i = 0; i < postings.length; i += 2) {
+                    const score = postings[i + 1] * bonus;
+                    if ((scores.get(postings[i]) || 0) < score) {
+                        scores.set(postings[i], score);
+                    }
+                }
+            });
+        });
 
-    function getEndpointUrl(endpoint) {
-        const method = endpoint.method.toLowerCase();
-        const path = endpoint.path
-            .replace(/\//g, '_')
-            .replace(/[{}]/g, '')
-            .replace(/^_/, '');
-        return `${method}_${path}.html`;
+        return scores;
+    }
+
+    // Documents matching every term, best first
+    async function search(query) {
+        const index = await loadIndexFile('index');
+        const terms = tokenize(query);
+        if (!index || terms.length === 0) {
+            return [];
+        }
+
+        const perTerm = await Promise.all(terms.map(term => matchTerm(term, index)));
+        const totals = new Map(perTerm[0]);
+
+        perTerm.slice(1).forEach(scores => {
+            totals.forEach((total, doc) => {
+                if (scores.has(doc)) {
+                    totals.set(doc, total + scores.get(doc));
+                } else {
+                    totals.delete(doc);
+                }
+            });
+        });
+
+        return Array.from(totals.entries())
+            .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+            .slice(0, MAX_RESULTS)
+            .map(([doc]) => index.docs[doc]);
+    }
+
+    function escapeHtml(text) {
+        const div = document.createElement('div');
+        div.textContent = text;
+        return div.innerHTML;
     }
 
     function renderSearchResults(results) {
@@ -42,15 +145,13 @@
         searchResults.classList.add('active');
         mainNav.style.display = 'none';
 
-        const html = results.map(result => {
-            const endpoint = result.item;
-            const url = getEndpointUrl(endpoint);
-            const methodClass = `method-${endpoint.method.toLowerCase()}`;
+        const html = results.map(([method, path, summary, filename]) => {
+            const methodClass = `method-${method.toLowerCase()}`;
 
             return `
-                <a href="${url}" class="search-result-item">
-                    <span class="method-badge ${methodClass}">${endpoint.method}</span>
-                    <span>${endpoint.path}</span>
+                <a href="${escapeHtml(base + filename)}" class="search-result-item" title="${escapeHtml(summary)}">
+                    <span class="method-badge ${methodClass}">${escapeHtml(method)}</span>
+                    <span>${escapeHtml(path)}</span>
                 </a>
             `;
         }).join('');
@@ -58,27 +159,39 @@
         searchResults.innerHTML = html;
     }
 
-    searchInput.addEventListener('input', (e) => {
+    function clearSearch() {
+        searchResults.classList.remove('active');
+        noResults.classList.remove('active');
+        mainNav.style.display = 'block';
+    }
+
+    // Start loading the index as soon as the user shows interest in searching
+    searchInput.addEventListener('focus', () => {
+        loadIndexFile('index');
+    }, { once: true });
+
+    searchInput.addEventListener('input', async (e) => {
         const query = e.target.value.trim();
+        const queryId = ++latestQuery;
 
         if (query === '') {
-            searchResults.classList.remove('active');
-            noResults.classList.remove('active');
-            mainNav.style.display = 'block';
+            clearSearch();
             return;
         }
 
-        const results = fuse.search(query).slice(0, 10); // Limit to 10 results
-        renderSearchResults(results);
+        const results = await search(query);
+        // Ignore results of queries the user has already typed past
+        if (queryId === latestQuery) {
+            renderSearchResults(results);
+        }
     });
 
     // Clear search on Escape key
     searchInput.addEventListener('keydown', (e) => {
         if (e.key === 'Escape') {
             searchInput.value = '';
-            searchResults.classList.remove('active');
-            noResults.classList.remove('active');
-            mainNav.style.display = 'block';
+            latestQuery++;
+            clearSearch();
         }
     });
 })();
@@ -6,8 +6,12 @@
 (function() {
     'use strict';
 
-    // Get current version from localStorage or default
+    // Get current version from the page (versioned builds), localStorage or default
     function getCurrentVersion() {
+        const versionData = document.getElementById('versionData');
+        if (versionData && versionData.dataset.currentVersion) {
+            return versionData.dataset.currentVersion;
+        }
         return localStorage.getItem('apiflow-selected-version') || null;
     }
 
@@ -19,12 +23,12 @@
     // Update visibility of version-specific content
     function updateVersionVisibility(selectedVersion) {
         // Hide all version-specific content
-        document.querySelectorAll('[data-version]').forEach(element => {
+        document.querySelectorAll('[data-version]:not(.version-option)').forEach(element => {
             element.style.display = 'none';
         });
 
         // Show selected version content
-        document.querySelectorAll(`[data-version="${selectedVersion}"]`).forEach(element => {
+        document.querySelectorAll(`[data-version="${selectedVersion}"]:not(.version-option)`).forEach(element => {
             element.style.display = '';
         });
 
@@ -40,7 +44,7 @@
         // Update version selector button text
         const selectorButton = document.getElementById('versionSelectorButton');
         if (selectorButton) {
-            const selectedOption = document.querySelector(`[data-version="${selectedVersion}"]`);
+            const selectedOption = document.querySelector(`.version-option[data-version="${selectedVersion}"]`);
             if (selectedOption) {
                 const label = selectedOption.dataset.label || selectedVersion;
                 selectorButton.textContent = label;
@@ -122,6 +126,10 @@
         document.querySelectorAll('.version-option').forEach(option => {
             option.addEventListener('click', () => {
                 handleVersionSelect(option.dataset.version);
+                // Each version has its own pages in versioned builds
+                if (option.dataset.href && option.dataset.version !== getCurrentVersion()) {
+                    window.location.href = option.dataset.href;
+                }
             });
         });
 
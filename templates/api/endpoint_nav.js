@@ -0,0 +1,36 @@
+// Sidebar navigation shared by every endpoint page (generated by ApiFlow)
+(function () {
+    const nav = document.getElementById('endpointNav');
+    if (!nav) {
+        return;
+    }
+
+    // [method, path, filename] for every endpoint
+    const endpoints = {{ nav_entries | tojson }};
+    const current = decodeURIComponent(window.location.pathname.split('/').pop());
+    const fragment = document.createDocumentFragment();
+
+    endpoints.forEach(([method, path, filename]) => {
+        const link = document.createElement('a');
+        link.href = filename;
+        link.className = 'endpoint-link';
+
+        if (filename === current) {
+            link.setAttribute('aria-current', 'page');
+            link.style.background = 'var(--bg-tertiary)';
+            link.style.fontWeight = '600';
+        }
+
+        const badge = document.createElement('span');
+        badge.className = `method-badge method-${method.toLowerCase()}`;
+        badge.textContent = method;
+
+        const label = document.createElement('span');
+        label.textContent = path;
+
+        link.append(badge, label);
+        fragment.appendChild(link);
+    });
+
+    nav.appendChild(fragment);
+})();
@@ -0,0 +1,41 @@
+"""Shared fixtures for the test suite."""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+import yaml
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "src"))
+
+# Caches and the license file live under ~/.apiflow; keep them out of the real home
+os.environ["HOME"] = tempfile.mkdtemp(prefix="apiflow-tests-")
+os.environ.pop("APIFLOW_LICENSE_KEY", None)
+
+from license.config import Config  # noqa: E402
+from openapi.generator import OpenAPIDocGenerator  # noqa: E402
+
+TEMPLATE_DIR = REPO_ROOT / "templates" / "api"
+
+
+@pytest.fixture
+def write_spec(tmp_path):
+    """Write an OpenAPI document to a YAML file and return its path."""
+    def write(spec, name="openapi.yaml"):
+        path = tmp_path / name
+        path.write_text(yaml.safe_dump(spec, sort_keys=False), encoding="utf-8")
+        return path
+    return write
+
+
+@pytest.fixture
+def make_generator(tmp_path):
+    """Create a generator writing to tmp_path/docs with the default configuration."""
+    def make(spec_path=None, **kwargs):
+        kwargs.setdefault("config", Config(str(tmp_path / "apiflow.json")))
+        return OpenAPIDocGenerator(str(spec_path) if spec_path else None, str(tmp_path / "docs"),
+                                   str(TEMPLATE_DIR), **kwargs)
+    return make
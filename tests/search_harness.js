@@ -0,0 +1,60 @@
+// Run static/js/search.js for one query against a generated search/ directory.
+// Usage: node search_harness.js <search.js> <docs dir> <query>
+// Prints {"results": [page, ...], "loaded": [index file, ...]} as JSON.
+const fs = require('fs');
+const path = require('path');
+const vm = require('vm');
+
+const [searchJs, docsDir, query] = process.argv.slice(2);
+const listeners = {};
+const loaded = [];
+
+function element(id) {
+    return {
+        dataset: {},
+        style: {},
+        innerHTML: '',
+        classList: { add() {}, remove() {} },
+        addEventListener(type, handler) {
+            listeners[`${id}:${type}`] = handler;
+        },
+    };
+}
+
+const elements = {};
+['searchInput', 'searchResults', 'noResults', 'mainNav'].forEach(id => {
+    elements[id] = element(id);
+});
+
+const context = {
+    console,
+    document: {
+        getElementById: id => elements[id],
+        createElement: () => ({
+            set textContent(text) {
+                this.innerHTML = text.replace(/&/g, '&amp;').replace(/</g, '&lt;').replace(/>/g, '&gt;');
+            },
+        }),
+        head: {
+            appendChild(script) {
+                const file = path.join(docsDir, script.src);
+                setImmediate(() => {
+                    if (!fs.existsSync(file)) {
+                        script.onerror();
+                        return;
+                    }
+                    loaded.push(path.basename(file, '.js'));
+                    vm.runInContext(fs.readFileSync(file, 'utf8'), context);
+                });
+            },
+        },
+    },
+};
+context.window = context;
+vm.createContext(context);
+vm.runInContext(fs.readFileSync(searchJs, 'utf8'), context);
+
+listeners['searchInput:input']({ target: { value: query } }).then(() => {
+    const results = [...elements.searchResults.innerHTML.matchAll(/href="([^"]*)"/g)].map(m => m[1]);
+    console.log(JSON.stringify({ results, loaded: loaded.sort() }));
+});
@@ -0,0 +1,95 @@
+"""Tests for the build manifest behind incremental builds."""
+
+import datetime
+
+from openapi.build_manifest import BuildManifest, content_hash
+
+
+def build(output_dir, files, force=False):
+    """Run a build writing files (name -> digest); returns its manifest."""
+    manifest = BuildManifest(output_dir, force=force)
+    for name, digest in files.items():
+        if not manifest.is_fresh(name, digest):
+            (output_dir / name).parent.mkdir(parents=True, exist_ok=True)
+            (output_dir / name).write_text(digest, encoding="utf-8")
+    manifest.remove_stale()
+    manifest.save()
+    return manifest
+
+
+def test_content_hash_ignores_dict_order_and_hashes_other_types():
+    assert content_hash({"a": 1, "b": 2}) == content_hash({"b": 2, "a": 1})
+    assert content_hash(datetime.date(2024, 1, 1)) == content_hash("2024-01-01")
+    assert content_hash("a", "b") != content_hash("ab")
+
+
+def test_unchanged_files_are_skipped(tmp_path):
+    build(tmp_path, {"a.html": "1", "b.html": "1"})
+    manifest = build(tmp_path, {"a.html": "1", "b.html": "2"})
+
+    assert (manifest.rendered, manifest.skipped) == (1, 1)
+
+
+def test_deleted_output_is_rendered_again(tmp_path):
+    build(tmp_path, {"a.html": "1"})
+    (tmp_path / "a.html").unlink()
+
+    manifest = build(tmp_path, {"a.html": "1"})
+
+    assert manifest.rendered == 1
+    assert (tmp_path / "a.html").exists()
+
+
+def test_force_renders_everything(tmp_path):
+    build(tmp_path, {"a.html": "1"})
+
+    assert build(tmp_path, {"a.html": "1"}, force=True).skipped == 0
+
+
+def test_other_format_version_renders_everything(tmp_path, monkeypatch):
+    build(tmp_path, {"a.html": "1"})
+    monkeypatch.setattr(BuildManifest, "FORMAT_VERSION", BuildManifest.FORMAT_VERSION + 1)
+
+    assert build(tmp_path, {"a.html": "1"}).skipped == 0
+
+
+def test_corrupt_manifest_renders_everything(tmp_path):
+    build(tmp_path, {"a.html": "1"})
+    (tmp_path / BuildManifest.FILENAME).write_text("{", encoding="utf-8")
+
+    assert build(tmp_path, {"a.html": "1"}).skipped == 0
+
+
+def test_stale_files_are_removed_but_user_files_are_kept(tmp_path):
+    build(tmp_path, {"a.html": "1", "v1/b.html": "1"})
+    (tmp_path / "notes.txt").write_text("mine", encoding="utf-8")
+
+    manifest = BuildManifest(tmp_path)
+    manifest.is_fresh("a.html", "1")
+
+    assert manifest.remove_stale() == ["v1/b.html"]
+    assert not (tmp_path / "v1" / "b.html").exists()
+    assert (tmp_path / "notes.txt").exists()
+
+
+def test_assets_are_kept_by_builds_that_copy_none(tmp_path):
+    manifest = BuildManifest(tmp_path)
+    manifest.record_asset("css/app.1234.css", "css/app.css")
+    manifest.save()
+
+    manifest = BuildManifest(tmp_path)
+    manifest.is_fresh("index.html", "1")
+
+    assert manifest.remove_stale() == []
+    assert manifest.generated_files() == ["css/app.1234.css", "index.html"]
+
+
+def test_replaced_assets_are_removed(tmp_path):
+    manifest = BuildManifest(tmp_path)
+    manifest.record_asset("css/app.1234.css", "css/app.css")
+    manifest.save()
+
+    manifest = BuildManifest(tmp_path)
+    manifest.record_asset("css/app.5678.css", "css/app.css")
+
+    assert manifest.remove_stale() == ["css/app.1234.css"]
@@ -0,0 +1,135 @@
+"""Tests for the built-in CSS/JS minifiers, critical CSS and bundles."""
+
+import shutil
+import subprocess
+
+import pytest
+
+from openapi import bundler
+from openapi.bundler import build_bundles, bundle_filename, critical_css, minify_css, minify_js
+
+from tests.conftest import REPO_ROOT
+
+STATIC_DIR = REPO_ROOT / "static"
+
+
+@pytest.fixture(autouse=True)
+def builtin_minifiers(monkeypatch):
+    """Test the built-in minifiers even where rcssmin/rjsmin are installed."""
+    monkeypatch.setattr(bundler, "rcssmin", None)
+    monkeypatch.setattr(bundler, "rjsmin", None)
+
+
+def test_minify_css_drops_comments_and_whitespace():
+    source = "/* header */\na ,\nb > c {\n  color: red;\n  margin: 0 auto;\n}\n"
+
+    assert minify_css(source) == "a,b>c{color:red;margin:0 auto}"
+
+
+def test_minify_css_keeps_significant_spaces_and_strings():
+    source = '.a :hover { content: "/* not a comment */  x"; }\n.b .c{}'
+
+    assert minify_css(source) == '.a :hover{content:"/* not a comment */  x"}.b .c{}'
+
+
+def test_minify_js_keeps_code_around_same_line_comments():
+    assert minify_js("/* a */ foo();\nbar(); /* b\n*/ baz();") == "foo();\nbar();\nbaz();"
+
+
+def test_minify_js_keeps_tokens_apart_around_mid_line_comments():
+    assert minify_js("return/* x */value;") == "return value;"
+
+
+def test_minify_js_drops_line_comments_and_indentation():
+    assert minify_js("function f() {\n    // explain\n    return 1; // one\n}\n\n") == \
+        "function f() {\nreturn 1;\n}"
+
+
+@pytest.mark.parametrize("line", [
+    "const a = '/* kept */';",
+    'const b = "// kept";',
+    "const c = `/* kept ${x} // kept`;",
+    "const d = /\\/\\*[^*]*\\*\\//g;",
+    "const e = text.split(/[^a-z]+/u);",
+])
+def test_minify_js_keeps_comment_markers_inside_literals(line):
+    assert minify_js(line) == line
+
+
+def test_minify_js_tells_division_from_regex():
+    assert minify_js("const half = total / 2; // half\nconst r = x / y / z;") == \
+        "const half = total / 2;\nconst r = x / y / z;"
+
+
+def test_minify_js_keeps_multiline_templates_verbatim():
+    source = "const html = `\n    <a>\n        // not a comment\n    </a>`;"
+
+    assert minify_js(source) == source
+
+
+def test_critical_css_keeps_page_frame_rules():
+    css = "body{margin:0}.sidebar .nav{width:1px}.param-table{width:100%}*{box-sizing:border-box}"
+
+    assert critical_css(css) == "body{margin:0}.sidebar .nav{width:1px}*{box-sizing:border-box}"
+
+
+def test_critical_css_keeps_rules_with_any_critical_selector():
+    assert critical_css(".param-table,.header{color:red}") == ".param-table,.header{color:red}"
+
+
+def test_critical_css_filters_media_blocks():
+    css = "@media (max-width:768px){.sidebar{display:none}.param-table{width:auto}}" \
+          "@media print{.param-table{color:black}}"
+
+    assert critical_css(css) == "@media (max-width:768px){.sidebar{display:none}}"
+
+
+def test_critical_css_keeps_theme_scoped_rules():
+    css = '[data-theme="dark"]{--bg:#000}[data-theme="dark"] .sidebar{color:white}' \
+          '[data-theme="dark"] .param-table{color:gray}'
+
+    assert critical_css(css) == '[data-theme="dark"]{--bg:#000}[data-theme="dark"] .sidebar{color:white}'
+
+
+def test_critical_css_leaves_other_at_rules_to_the_stylesheet():
+    css = '@import url("x.css");@keyframes spin{to{transform:rotate(1turn)}}' \
+          '@font-face{font-family:X}html{color:red}'
+
+    assert critical_css(css) == "html{color:red}"
+
+
+def test_build_bundles_produces_every_kind():
+    bundles = build_bundles(STATIC_DIR, versioning=True, highlight=True)
+
+    assert set(bundles) == {"critical_css", "css", "index_js", "endpoint_js"}
+    assert all(bundles.values())
+    assert bundles["critical_css"].startswith(minify_css((STATIC_DIR / "css/variables.css").read_text()))
+    assert "/*" not in bundles["css"]
+
+
+def test_build_bundles_includes_the_version_switcher_only_when_versioned():
+    switcher = minify_js((STATIC_DIR / "js/version-switcher.js").read_text())
+
+    assert switcher in build_bundles(STATIC_DIR, versioning=True)["index_js"]
+    assert switcher not in build_bundles(STATIC_DIR)["index_js"]
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+@pytest.mark.parametrize("kind", ["index_js", "endpoint_js"])
+def test_minified_script_bundles_are_valid_javascript(kind, tmp_path):
+    script = tmp_path / f"{kind}.js"
+    script.write_text(build_bundles(STATIC_DIR, versioning=True)[kind], encoding="utf-8")
+
+    result = subprocess.run(["node", "--check", str(script)], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize("kind, theme, expected", [
+    ("css", None, "css/apiflow.min.css"),
+    ("css", "dark-pro", "css/apiflow-dark-pro.min.css"),
+    ("index_js", None, "js/index.min.js"),
+    ("endpoint_js", "dark-pro", "js/endpoint.min.js"),
+])
+def test_bundle_filename(kind, theme, expected):
+    assert bundle_filename(kind, theme) == expected
@@ -0,0 +1,82 @@
+"""Tests for code examples and their on-disk cache."""
+
+import pytest
+
+from openapi import generator as generator_module
+from openapi.code_example_cache import CodeExampleCache
+from openapi.code_examples import ExampleContext, build_context, go_example
+from openapi.parser import Endpoint
+
+
+def endpoint(path, parameters, method="GET"):
+    return Endpoint(path, method, "op", "", "", tuple(parameters), None, (), (), False,
+                    f"{method} {path}", "page.html")
+
+
+def test_path_and_query_parameters_may_share_a_name():
+    context = build_context(endpoint("/files/{id}", [
+        {"in": "path", "name": "id", "example": "a/b c"},
+        {"in": "query", "name": "id", "example": 5},
+    ]), [])
+    assert context.path == "/files/a%2Fb%20c"
+    assert context.query == (("id", "5"),)
+
+
+def test_path_parameters_without_example_keep_a_placeholder():
+    context = build_context(endpoint("/files/{name}", [{"in": "path", "name": "name"}]), [])
+    assert context.path == "/files/<name>"
+
+
+def test_go_body_with_backtick_uses_an_interpreted_string():
+    code = go_example(ExampleContext("POST", "https://x", "/p", (), (), {"q": "a`b"}))
+    assert 'strings.NewReader("{\\"q\\": \\"a`b\\"}")' in code
+
+
+def test_cache_round_trip(tmp_path):
+    cache = CodeExampleCache(str(tmp_path))
+    key = cache.key("digest", "curl")
+    assert cache.load(key) is None
+
+    cache.store(key, {"curl": "curl -X GET 'https://x'"})
+    assert cache.load(key) == {"curl": "curl -X GET 'https://x'"}
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_key_covers_every_part(tmp_path):
+    cache = CodeExampleCache(str(tmp_path))
+    assert cache.key("a", "b") != cache.key("a", "c")
+    assert cache.key("ab", "") != cache.key("a", "b")
+
+
+def test_cache_ignores_entries_of_another_format(tmp_path, monkeypatch):
+    cache = CodeExampleCache(str(tmp_path))
+    key = cache.key("digest")
+    cache.store(key, {"curl": "old"})
+    monkeypatch.setattr(CodeExampleCache, "FORMAT_VERSION", CodeExampleCache.FORMAT_VERSION + 1)
+    assert cache.load(key) is None
+
+
+SPEC = {
+    "openapi": "3.0.0",
+    "info": {"title": "T", "version": "1"},
+    "paths": {
+        "/pets/{id}": {"get": {
+            "parameters": [{"in": "path", "name": "id", "schema": {"type": "integer", "example": 1}}],
+            "responses": {"200": {"description": "OK"}},
+        }},
+    },
+}
+
+
+def test_rebuild_reuses_cached_examples(write_spec, make_generator, tmp_path, monkeypatch):
+    monkeypatch.setattr(CodeExampleCache, "CACHE_DIR", tmp_path / "cache")
+    path = write_spec(SPEC)
+    first = make_generator(path, incremental=False)
+    first.generate()
+    assert first.code_example_cache.misses == 1
+
+    monkeypatch.setattr(generator_module, "generate_examples", pytest.fail)
+    second = make_generator(path, incremental=False)
+    second.generate()
+    assert second.code_example_cache.hits == 1
+    assert "https://api.example.com/pets/1" in (tmp_path / "docs" / "get_pets_id.html").read_text()
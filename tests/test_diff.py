@@ -0,0 +1,249 @@
+"""Tests for the structural diff between API versions and its classification."""
+
+import pytest
+
+from openapi.diff import Change, OperationIndex, diff_versions
+from openapi.parser import OpenAPIParser
+
+
+def spec(paths, schemas=None, version="1.0.0"):
+    document = {"openapi": "3.0.0", "info": {"title": "T", "version": version}, "paths": paths}
+    if schemas:
+        document["components"] = {"schemas": schemas}
+    return document
+
+
+def get(responses=None, parameters=None, description=None):
+    operation = {"responses": responses or {"204": {"description": "Empty"}}}
+    if parameters:
+        operation["parameters"] = parameters
+    if description:
+        operation["description"] = description
+    return operation
+
+
+def post(schema, required=True):
+    return {
+        "requestBody": {"required": required, "content": {"application/json": {"schema": schema}}},
+        "responses": {"204": {"description": "Created"}},
+    }
+
+
+def returns(schema):
+    return {"200": {"description": "OK", "content": {"application/json": {"schema": schema}}}}
+
+
+def obj(properties, required=()):
+    schema = {"type": "object", "properties": properties}
+    if required:
+        schema["required"] = list(required)
+    return schema
+
+
+def query(name, required=False, schema=None):
+    return {"in": "query", "name": name, "required": required, "schema": schema or {"type": "string"}}
+
+
+@pytest.fixture
+def diff(write_spec):
+    """Diff two versions given as (paths, schemas) documents."""
+    def compare(old, new):
+        old_parser = OpenAPIParser(str(write_spec(old, "old.yaml")))
+        new_parser = OpenAPIParser(str(write_spec(new, "new.yaml")))
+        return diff_versions(OperationIndex(old_parser), OperationIndex(new_parser), "v1", "v2")
+    return compare
+
+
+def changes(version_diff):
+    """The changes of the only changed operation."""
+    (operation,) = version_diff.changed
+    return operation.changes
+
+
+def test_added_removed_and_unchanged_operations(diff):
+    result = diff(
+        spec({"/a": {"get": get()}, "/b": {"get": get()}}),
+        spec({"/a": {"get": get()}, "/c": {"get": get()}}),
+    )
+
+    assert [summary.operation_key for summary in result.added] == ["GET /c"]
+    assert [summary.operation_key for summary in result.removed] == ["GET /b"]
+    assert result.changed == ()
+    assert result.unchanged == 1
+    # Clients of a removed operation break
+    assert result.breaking
+
+
+def test_only_added_operations_are_not_breaking(diff):
+    result = diff(spec({"/a": {"get": get()}}), spec({"/a": {"get": get()}, "/b": {"get": get()}}))
+
+    assert not result.breaking
+
+
+def test_documentation_changes_are_not_structural(diff):
+    result = diff(spec({"/a": {"get": get(description="Old")}}),
+                  spec({"/a": {"get": get(description="New")}}))
+
+    assert result.changed == ()
+    assert result.unchanged == 1
+
+
+@pytest.mark.parametrize("required, breaking", [(True, True), (False, False)])
+def test_added_query_parameter(diff, required, breaking):
+    result = diff(spec({"/a": {"get": get()}}),
+                  spec({"/a": {"get": get(parameters=[query("limit", required)])}}))
+
+    detail = "required" if required else "optional"
+    assert changes(result) == (Change("added", "query parameter limit", detail, breaking),)
+
+
+def test_parameter_becoming_required_is_breaking(diff):
+    result = diff(spec({"/a": {"get": get(parameters=[query("limit")])}}),
+                  spec({"/a": {"get": get(parameters=[query("limit", required=True)])}}))
+
+    assert changes(result) == (Change("changed", "query parameter limit", "now required", True),)
+
+
+@pytest.mark.parametrize("old, new, breaking", [
+    ("integer", "number", False),
+    ("number", "integer", True),
+    ("string", "integer", True),
+])
+def test_parameter_type_changes(diff, old, new, breaking):
+    result = diff(spec({"/a": {"get": get(parameters=[query("n", schema={"type": old})])}}),
+                  spec({"/a": {"get": get(parameters=[query("n", schema={"type": new})])}}))
+
+    assert changes(result) == (Change("changed", "query parameter n", f"type {old} → {new}", breaking),)
+
+
+def test_widened_response_type_is_breaking(diff):
+    result = diff(spec({"/a": {"get": get(returns({"type": "integer"}))}}),
+                  spec({"/a": {"get": get(returns({"type": "number"}))}}))
+
+    (change,) = changes(result)
+    assert change.detail == "type integer → number"
+    assert change.breaking
+
+
+def test_removed_property_breaks_responses_but_not_requests(diff):
+    before = obj({"id": {"type": "string"}, "name": {"type": "string"}})
+    after = obj({"id": {"type": "string"}})
+
+    response = diff(spec({"/a": {"get": get(returns(before))}}), spec({"/a": {"get": get(returns(after))}}))
+    request = diff(spec({"/a": {"post": post(before)}}), spec({"/a": {"post": post(after)}}))
+
+    assert changes(response) == (
+        Change("removed", "response 200 (application/json) › name", "", True),
+    )
+    assert changes(request) == (
+        Change("removed", "request body (application/json) › name", "", False),
+    )
+
+
+def test_property_becoming_required_breaks_requests(diff):
+    result = diff(spec({"/a": {"post": post(obj({"name": {"type": "string"}}))}}),
+                  spec({"/a": {"post": post(obj({"name": {"type": "string"}}, required=["name"]))}}))
+
+    assert changes(result) == (
+        Change("changed", "request body (application/json) › name", "now required", True),
+    )
+
+
+def test_property_becoming_optional_breaks_responses(diff):
+    result = diff(spec({"/a": {"get": get(returns(obj({"id": {"type": "string"}}, required=["id"])))}}),
+                  spec({"/a": {"get": get(returns(obj({"id": {"type": "string"}})))}}))
+
+    assert changes(result) == (
+        Change("changed", "response 200 (application/json) › id", "now optional", True),
+    )
+
+
+def test_enum_changes_depend_on_direction(diff):
+    before = {"type": "string", "enum": ["a", "b"]}
+    after = {"type": "string", "enum": ["a", "c"]}
+
+    request = diff(spec({"/a": {"post": post(before)}}), spec({"/a": {"post": post(after)}}))
+    response = diff(spec({"/a": {"get": get(returns(before))}}), spec({"/a": {"get": get(returns(after))}}))
+
+    location = "request body (application/json)"
+    assert changes(request) == (
+        Change("added", location, "enum values c", False),
+        Change("removed", location, "enum values b", True),
+    )
+    location = "response 200 (application/json)"
+    assert changes(response) == (
+        Change("added", location, "enum values c", True),
+        Change("removed", location, "enum values b", False),
+    )
+
+
+def test_read_only_properties_are_ignored_in_requests(diff):
+    before = obj({"id": {"type": "string", "readOnly": True}, "name": {"type": "string"}})
+    after = obj({"name": {"type": "string"}})
+
+    result = diff(spec({"/a": {"post": post(before)}}), spec({"/a": {"post": post(after)}}))
+
+    assert result.changed == ()
+    assert result.unchanged == 1
+
+
+def test_reorganized_all_of_compares_by_content(diff):
+    flat = obj({"id": {"type": "string"}, "name": {"type": "string"}}, required=["id"])
+    composed = {"allOf": [obj({"id": {"type": "string"}}, required=["id"]),
+                          obj({"name": {"type": "string"}})]}
+
+    result = diff(spec({"/a": {"get": get(returns(flat))}}), spec({"/a": {"get": get(returns(composed))}}))
+
+    assert result.changed == ()
+
+
+def test_removed_success_response_is_breaking(diff):
+    both = {"200": {"description": "OK"}, "404": {"description": "Missing"}}
+
+    success = diff(spec({"/a": {"get": get(both)}}), spec({"/a": {"get": get({"404": both["404"]})}}))
+    error = diff(spec({"/a": {"get": get(both)}}), spec({"/a": {"get": get({"200": both["200"]})}}))
+
+    assert changes(success) == (Change("removed", "response 200", "", True),)
+    assert changes(error) == (Change("removed", "response 404", "", False),)
+
+
+def test_shared_schema_change_is_reported_for_every_operation(diff):
+    ref = {"$ref": "#/components/schemas/Pet"}
+    paths = {"/a": {"get": get(returns(ref))}, "/b": {"get": get(returns({"type": "array", "items": ref}))}}
+
+    result = diff(spec(paths, {"Pet": obj({"id": {"type": "string"}, "tag": {"type": "string"}})}),
+                  spec(paths, {"Pet": obj({"id": {"type": "string"}})}))
+
+    assert [(op.summary.operation_key, [c.location for c in op.changes]) for op in result.changed] == [
+        ("GET /a", ["response 200 (application/json) › tag"]),
+        ("GET /b", ["response 200 (application/json) › [].tag"]),
+    ]
+
+
+def test_circular_schemas_are_compared(diff):
+    def node(extra):
+        properties = {"children": {"type": "array", "items": {"$ref": "#/components/schemas/Node"}}}
+        properties.update(extra)
+        return obj(properties)
+
+    paths = {"/tree": {"get": get(returns({"$ref": "#/components/schemas/Node"}))}}
+    result = diff(spec(paths, {"Node": node({"name": {"type": "string"}})}),
+                  spec(paths, {"Node": node({})}))
+
+    assert changes(result) == (Change("removed", "response 200 (application/json) › name", "", True),)
+
+
+def test_to_dict_lists_changes_by_operation(diff):
+    result = diff(spec({"/a": {"get": get()}, "/b": {"get": get()}}),
+                  spec({"/a": {"get": get(parameters=[query("q")])}, "/c": {"get": get()}}))
+
+    assert result.to_dict() == {
+        "old_version": "v1",
+        "new_version": "v2",
+        "added": ["GET /c"],
+        "removed": ["GET /b"],
+        "changed": {"GET /a": [
+            {"kind": "added", "location": "query parameter q", "detail": "optional", "breaking": False},
+        ]},
+        "unchanged": 0,
+    }
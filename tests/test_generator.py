@@ -0,0 +1,168 @@
+"""Tests for page generation, deduplication and incremental rebuilds."""
+
+import pickle
+import re
+
+import pytest
+
+from openapi.build_manifest import BuildManifest
+from openapi.version_manager import VersionManager, VersionedAPI
+
+PRO_KEY = "APIFLOW-PRO-0123456789abcdef0123456789abcdef"
+
+
+def operation(summary="Delete it"):
+    return {
+        "summary": summary,
+        "responses": {"204": {"description": "Deleted"}},
+    }
+
+
+def spec(paths, version="1.0.0", schemas=None):
+    document = {"openapi": "3.0.0", "info": {"title": "T", "version": version}, "paths": paths}
+    if schemas:
+        document["components"] = {"schemas": schemas}
+    return document
+
+
+def title(page):
+    return re.search(r"<title>(.*?)</title>", page.read_text(encoding="utf-8")).group(1)
+
+
+def test_identical_operations_get_their_own_pages(write_spec, make_generator, tmp_path):
+    path = write_spec(spec({"/a": {"delete": operation()}, "/b": {"delete": operation()}}))
+    make_generator(path).generate()
+
+    docs = tmp_path / "docs"
+    assert title(docs / "delete_a.html") == "DELETE /a - T"
+    assert title(docs / "delete_b.html") == "DELETE /b - T"
+
+
+def test_identical_operations_differing_in_method_get_their_own_pages(write_spec, make_generator, tmp_path):
+    path = write_spec(spec({"/a": {"put": operation(), "patch": operation()}}))
+    make_generator(path).generate()
+
+    docs = tmp_path / "docs"
+    assert title(docs / "put_a.html") == "PUT /a - T"
+    assert title(docs / "patch_a.html") == "PATCH /a - T"
+
+
+def rendered_pages(tmp_path):
+    return {page.name: page.stat().st_mtime_ns for page in (tmp_path / "docs").glob("*_*.html")}
+
+
+def test_rebuild_skips_unchanged_pages(write_spec, make_generator, tmp_path):
+    path = write_spec(spec({"/a": {"get": operation()}, "/b": {"delete": operation()}}))
+    make_generator(path).generate()
+    before = rendered_pages(tmp_path)
+
+    make_generator(path).generate()
+    assert rendered_pages(tmp_path) == before
+
+
+def test_rebuild_renders_pages_depending_on_a_changed_schema(write_spec, make_generator, tmp_path):
+    def write(pet_type):
+        uses_pet = {
+            "summary": "Get pet",
+            "responses": {"200": {"description": "OK", "content": {"application/json": {
+                "schema": {"$ref": "#/components/schemas/Pet"}}}}},
+        }
+        return write_spec(spec({"/pet": {"get": uses_pet}, "/other": {"delete": operation()}},
+                               schemas={"Pet": {"type": pet_type}}))
+
+    make_generator(write("object")).generate()
+    before = rendered_pages(tmp_path)
+
+    make_generator(write("string")).generate()
+    after = rendered_pages(tmp_path)
+    assert after["get_pet.html"] != before["get_pet.html"]
+    assert after["delete_other.html"] == before["delete_other.html"]
+
+
+def test_rebuild_renders_a_moved_operation(write_spec, make_generator, tmp_path):
+    make_generator(write_spec(spec({"/a": {"delete": operation()}}))).generate()
+    make_generator(write_spec(spec({"/b": {"delete": operation()}}))).generate()
+
+    docs = tmp_path / "docs"
+    assert title(docs / "delete_b.html") == "DELETE /b - T"
+    assert not (docs / "delete_a.html").exists()
+
+
+def test_rebuild_without_manifest_renders_everything(write_spec, make_generator, tmp_path):
+    path = write_spec(spec({"/a": {"delete": operation()}}))
+    make_generator(path).generate()
+    (tmp_path / "docs" / BuildManifest.FILENAME).unlink()
+    page = tmp_path / "docs" / "delete_a.html"
+    page.write_text("stale", encoding="utf-8")
+
+    make_generator(path).generate()
+    assert title(page) == "DELETE /a - T"
+
+
+@pytest.fixture
+def versioned(write_spec, make_generator, tmp_path):
+    """Build two versions whose specs are given as path dicts."""
+    def build(v1_paths, v2_paths):
+        manager = VersionManager()
+        manager.add_version("v1", str(write_spec(spec(v1_paths, "1.0.0"), "v1.yaml")))
+        manager.add_version("v2", str(write_spec(spec(v2_paths, "2.0.0"), "v2.yaml")), is_default=True)
+        make_generator(license_key=PRO_KEY, version_manager=manager).generate()
+        return tmp_path / "docs"
+    return build
+
+
+def test_identical_operation_across_versions_is_copied(versioned, capsys):
+    docs = versioned({"/a": {"delete": operation()}}, {"/a": {"delete": operation()}})
+
+    assert "Reused 1 identical page(s)" in capsys.readouterr().out
+    pages = sorted(docs.rglob("delete_a.html"))
+    assert len(pages) == 2
+    assert pages[0].read_bytes() == pages[1].read_bytes()
+
+
+def test_identical_operations_are_not_merged_across_versions(versioned):
+    docs = versioned({"/a": {"delete": operation()}}, {"/b": {"delete": operation()}})
+
+    titles = {page.name: title(page) for page in docs.rglob("delete_*.html")}
+    assert titles == {"delete_a.html": "DELETE /a - T", "delete_b.html": "DELETE /b - T"}
+
+
+@pytest.fixture
+def three_versions(write_spec):
+    manager = VersionManager()
+    for number in (1, 2, 3):
+        paths = {f"/v{number}": {"delete": operation()}}
+        manager.add_version(f"v{number}", str(write_spec(spec(paths, f"{number}.0.0"), f"v{number}.yaml")))
+    return manager
+
+
+def test_versions_are_loaded_one_at_a_time(three_versions, make_generator, monkeypatch, tmp_path):
+    load = VersionedAPI.load
+    loaded_counts = []
+
+    def counting_load(api):
+        parser = load(api)
+        loaded_counts.append(sum(v.is_loaded for v in three_versions.versions.values()))
+        return parser
+
+    monkeypatch.setattr(VersionedAPI, "load", counting_load)
+    generator = make_generator(license_key=PRO_KEY, version_manager=three_versions)
+    generator.generate()
+
+    # A version and the one its changelog compares against
+    assert max(loaded_counts) == 2
+    assert not any(api.is_loaded for api in three_versions.versions.values())
+    assert (tmp_path / "docs" / "v3" / "changelog.html").exists()
+    assert sorted(generator.spec_documents) == ["v1", "v2", "v3"]
+
+
+def test_render_workers_receive_no_loaded_versions(three_versions, make_generator):
+    generator = make_generator(license_key=PRO_KEY, version_manager=three_versions)
+    three_versions.diff_versions("v1", "v2")
+    target = generator._build_target("v3")
+
+    worker_generator, worker_target = pickle.loads(pickle.dumps((generator, target)))
+
+    assert not any(api.is_loaded for api in worker_generator.version_manager.versions.values())
+    assert worker_generator.version_manager._diffs == {}
+    assert worker_target.parser.spec_path == target.parser.spec_path
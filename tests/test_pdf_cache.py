@@ -0,0 +1,65 @@
+"""Tests for the on-disk cache of rendered PDF fragments."""
+
+import os
+import time
+
+from openapi.pdf_cache import PDFFragmentCache
+
+
+def test_fragment_round_trip(tmp_path):
+    cache = PDFFragmentCache(str(tmp_path))
+    key = cache.key("<html>", "print.css")
+    assert cache.load(key) is None
+
+    cache.store(key, (b"%PDF-1.7 ...", 3, {"get_pets": 1}))
+
+    assert cache.load(key) == (b"%PDF-1.7 ...", 3, {"get_pets": 1})
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_key_depends_on_every_part():
+    cache = PDFFragmentCache()
+
+    assert cache.key("a", "b") != cache.key("a", "c")
+    assert cache.key("ab", "") != cache.key("a", "b")
+
+
+def test_entries_of_another_format_are_misses(tmp_path, monkeypatch):
+    cache = PDFFragmentCache(str(tmp_path))
+    cache.store("k", (b"pdf", 1, {}))
+    monkeypatch.setattr(PDFFragmentCache, "FORMAT_VERSION", PDFFragmentCache.FORMAT_VERSION + 1)
+
+    assert cache.load("k") is None
+
+
+def test_corrupt_entries_are_misses(tmp_path):
+    cache = PDFFragmentCache(str(tmp_path))
+    (tmp_path / "k.fragment").write_bytes(b"not a fragment")
+
+    assert cache.load("k") is None
+
+
+def test_assembled_output_is_reused_until_inputs_or_file_change(tmp_path):
+    cache = PDFFragmentCache(str(tmp_path / "cache"))
+    output = tmp_path / "docs.pdf"
+    output.write_bytes(b"%PDF")
+    digest = cache.assembly_digest(["k1", "k2"], "toc")
+
+    cache.record_assembled(output, digest)
+
+    assert cache.is_assembled(output, digest)
+    assert not cache.is_assembled(output, cache.assembly_digest(["k1", "k3"], "toc"))
+    output.write_bytes(b"%PDF edited")
+    assert not cache.is_assembled(output, digest)
+
+
+def test_prune_removes_only_old_fragments(tmp_path):
+    cache = PDFFragmentCache(str(tmp_path))
+    cache.store("old", (b"pdf", 1, {}))
+    cache.store("new", (b"pdf", 1, {}))
+    expired = time.time() - (cache.MAX_AGE_DAYS + 1) * 86400
+    os.utime(tmp_path / "old.fragment", (expired, expired))
+
+    assert cache.prune() == 1
+    assert cache.load("old") is None
+    assert cache.load("new") is not None
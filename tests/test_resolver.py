@@ -0,0 +1,105 @@
+"""Tests for $ref resolution and cycle detection."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from openapi.resolver import RefResolutionError, RefResolver
+
+
+def make_resolver(document, path="/specs/openapi.yaml", loader=None):
+    return RefResolver(document, Path(path), loader or (lambda p: yaml.safe_load(p.read_text())))
+
+
+def schemas(**definitions):
+    return {"components": {"schemas": definitions}}
+
+
+def ref(name):
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def test_resolves_nested_refs():
+    resolver = make_resolver(schemas(
+        Pet={"type": "object", "properties": {"owner": ref("Owner")}},
+        Owner={"type": "string"},
+    ))
+    assert resolver.resolve(ref("Pet")) == {
+        "type": "object", "properties": {"owner": {"type": "string"}},
+    }
+
+
+def test_self_reference_is_cut_at_the_repeated_ref():
+    resolver = make_resolver(schemas(
+        Node={"type": "object", "properties": {"child": ref("Node")}},
+    ))
+    view = resolver.resolve(ref("Node"))
+    assert view["properties"]["child"] == {**ref("Node"), "x-circular-ref": True}
+
+
+def test_cycle_cut_does_not_depend_on_resolution_order():
+    document = schemas(
+        A={"properties": {"b": ref("B")}},
+        B={"properties": {"a": ref("A")}},
+    )
+
+    fresh_b = make_resolver(document).resolve(ref("B"))
+
+    resolver = make_resolver(document)
+    resolver.resolve(ref("A"))  # resolves B inside the A -> B -> A cycle first
+    assert resolver.resolve(ref("B")) == fresh_b
+    assert fresh_b == {"properties": {"a": {"properties": {"b": {**ref("B"), "x-circular-ref": True}}}}}
+
+
+def test_views_outside_cycles_are_shared():
+    resolver = make_resolver(schemas(
+        A={"properties": {"b": ref("B")}},
+        B={"type": "string"},
+    ))
+    assert resolver.resolve(ref("A"))["properties"]["b"] is resolver.resolve(ref("B"))
+
+
+def test_unresolvable_ref_is_kept_and_recorded():
+    resolver = make_resolver(schemas())
+    assert resolver.resolve(ref("Missing")) == ref("Missing")
+    assert resolver.unresolved == {"#/components/schemas/Missing"}
+    with pytest.raises(RefResolutionError):
+        resolver.lookup(("/specs/openapi.yaml", "/components/schemas/Missing"))
+
+
+def test_external_document_refs(tmp_path):
+    (tmp_path / "common.yaml").write_text(yaml.safe_dump(schemas(Error={"type": "object"})))
+    resolver = make_resolver({"x": {"$ref": "common.yaml#/components/schemas/Error"}},
+                             path=tmp_path / "openapi.yaml")
+    assert resolver.resolve({"$ref": "#/x"}) == {"type": "object"}
+    assert resolver.documents() == [str((tmp_path / "common.yaml").resolve())]
+
+
+def test_dependencies_follow_refs_transitively():
+    resolver = make_resolver(schemas(
+        A={"properties": {"b": ref("B")}},
+        B={"items": ref("C")},
+        C={"type": "string"},
+    ))
+    base = resolver.base
+    assert resolver.dependencies(ref("A")) == {
+        (base, "/components/schemas/A"), (base, "/components/schemas/B"), (base, "/components/schemas/C"),
+    }
+
+
+def test_every_entry_point_matches_a_fresh_resolver():
+    document = schemas(
+        A={"properties": {"b": ref("B"), "c": ref("C")}},
+        B={"properties": {"a": ref("A"), "d": ref("D")}},
+        C={"items": ref("B")},
+        D={"properties": {"d": ref("D"), "e": ref("E")}},
+        E={"type": "string"},
+    )
+    names = ["A", "B", "C", "D", "E"]
+    fresh = {name: make_resolver(document).resolve(ref(name)) for name in names}
+
+    for order in (names, names[::-1], ["C", "A", "E", "D", "B"]):
+        resolver = make_resolver(document)
+        for name in order:
+            assert resolver.resolve(ref(name)) == fresh[name], (order, name)
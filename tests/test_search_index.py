@@ -0,0 +1,102 @@
+"""Tests for the prebuilt search index and the search.js client."""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from openapi.search_index import build_search_index, search_index_files, shard_key, tokenize
+
+from tests.conftest import REPO_ROOT
+
+
+def entry(method, path, summary="", filename=None):
+    return {
+        "method": method,
+        "path": path,
+        "summary": summary,
+        "description": "",
+        "tags": [],
+        "filename": filename or f"{method.lower()}_{path.strip('/')}.html",
+    }
+
+
+ENTRIES = [
+    entry("GET", "/pets", "List pets"),
+    entry("GET", "/aéro", "Aéroports", "get_aero.html"),
+    entry("GET", "/éclairs", "Éclairs", "get_eclairs.html"),
+    entry("POST", "/x1", "Create x"),
+]
+
+
+def test_tokenize_splits_camel_case():
+    assert tokenize("/pets/{petId}") == ["pets", "petid", "pet", "id"]
+
+
+def test_shard_key():
+    assert shard_key("pets", 2) == "pe"
+    assert shard_key("p", 2) == "p"
+    assert shard_key("aéro", 2) == "_"
+    assert shard_key("éclairs", 1) == "_"
+    assert shard_key("pets", 0) == "all"
+
+
+def test_tokens_are_sharded_by_prefix():
+    files = build_search_index(ENTRIES, prefix_length=2)
+    assert "aéro" in files["shard-_.js"]["tokens"]
+    assert "pets" in files["shard-pe.js"]["tokens"]
+    assert files["index.js"]["shards"] == sorted(
+        name[len("shard-"):-len(".js")] for name in files if name.startswith("shard-")
+    )
+
+
+def test_postings_keep_the_best_field_weight():
+    files = build_search_index([entry("GET", "/pets", "pets")], prefix_length=1)
+    # "pets" is in path (3), summary (3) and nowhere heavier
+    assert files["shard-p.js"]["tokens"]["pets"] == [0, 3]
+
+
+@pytest.fixture(scope="module")
+def search(tmp_path_factory):
+    """Run a query through search.js against an index sharded by two-character prefixes."""
+    node = shutil.which("node")
+    if node is None:
+        pytest.skip("node is not installed")
+
+    docs = tmp_path_factory.mktemp("docs")
+    (docs / "search").mkdir()
+    for name, source in search_index_files(ENTRIES, prefix_length=2):
+        (docs / "search" / name).write_text(source, encoding="utf-8")
+
+    def run(query):
+        output = subprocess.run(
+            [node, str(REPO_ROOT / "tests" / "search_harness.js"),
+             str(REPO_ROOT / "static" / "js" / "search.js"), str(docs), query],
+            check=True, capture_output=True, text=True,
+        ).stdout
+        return json.loads(output)
+    return run
+
+
+def test_query_as_long_as_the_prefix_loads_one_shard(search):
+    assert search("pe") == {"results": ["get_pets.html"], "loaded": ["index", "shard-pe"]}
+
+
+def test_short_query_finds_tokens_in_the_non_ascii_shard(search):
+    found = search("a")
+    assert found["results"] == ["get_aero.html"]
+    assert "shard-_" in found["loaded"]
+
+
+def test_short_query_finds_tokens_in_ascii_shards(search):
+    assert search("x")["results"] == ["post_x1.html"]
+
+
+def test_non_ascii_query(search):
+    assert search("écl")["results"] == ["get_eclairs.html"]
+    assert search("aéro")["results"] == ["get_aero.html"]
+
+
+def test_query_without_matches(search):
+    assert search("zebra")["results"] == []
@@ -0,0 +1,60 @@
+"""Tests for self-hosted (offline) vendor assets."""
+
+import hashlib
+import json
+
+import pytest
+
+from openapi import vendor_assets
+from openapi.vendor_assets import MissingVendorFilesError, VendorFile
+
+
+def test_offline_build_fails_without_vendor_files(write_spec, make_generator, tmp_path):
+    static = tmp_path / "static"
+    (static / "css").mkdir(parents=True)
+    generator = make_generator(write_spec({"openapi": "3.0.0", "info": {"title": "T"}, "paths": {}}))
+    generator.config.set("assets.offline", True)
+
+    with pytest.raises(MissingVendorFilesError):
+        generator.generate(static_dir=str(static))
+
+
+def test_offline_build_fails_without_static_dir(write_spec, make_generator):
+    generator = make_generator(write_spec({"openapi": "3.0.0", "info": {"title": "T"}, "paths": {}}))
+    generator.config.set("assets.offline", True)
+
+    with pytest.raises(MissingVendorFilesError):
+        generator.generate()
+
+
+def test_fetch_refuses_files_without_a_pinned_hash(tmp_path, monkeypatch):
+    monkeypatch.setattr(vendor_assets, "_download", pytest.fail)
+
+    with pytest.raises(ValueError, match="no pinned hash"):
+        vendor_assets.fetch_vendor_assets(str(tmp_path))
+
+
+def test_fetch_verifies_files_already_present(tmp_path, monkeypatch):
+    file = VendorFile("prism/prism.min.js", "https://example.invalid/prism.min.js")
+    monkeypatch.setattr(vendor_assets, "VENDOR_FILES", (file,))
+    vendor = tmp_path / "vendor"
+    (vendor / "prism").mkdir(parents=True)
+    (vendor / "prism" / "prism.min.js").write_bytes(b"tampered")
+    (vendor / "vendor-lock.json").write_text(
+        json.dumps({file.path: hashlib.sha256(b"original").hexdigest()}))
+
+    with pytest.raises(ValueError, match="does not match"):
+        vendor_assets.fetch_vendor_assets(str(tmp_path))
+
+
+def test_fetch_downloads_files_matching_the_lock(tmp_path, monkeypatch):
+    file = VendorFile("prism/prism.min.js", "https://example.invalid/prism.min.js")
+    monkeypatch.setattr(vendor_assets, "VENDOR_FILES", (file,))
+    monkeypatch.setattr(vendor_assets, "_download", lambda file, timeout: b"original")
+    vendor = tmp_path / "vendor"
+    vendor.mkdir()
+    (vendor / "vendor-lock.json").write_text(
+        json.dumps({file.path: hashlib.sha256(b"original").hexdigest()}))
+
+    assert vendor_assets.fetch_vendor_assets(str(tmp_path)) == 1
+    assert (vendor / "prism" / "prism.min.js").read_bytes() == b"original"